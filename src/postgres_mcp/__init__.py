@@ -1,12 +1,30 @@
 import asyncio
+import importlib
 import sys
+from typing import TYPE_CHECKING
 
-from . import server
-from . import top_queries
+if TYPE_CHECKING:
+    from . import server
+    from . import top_queries
+
+# Deferred via PEP 562: importing `server` pulls in the whole MCP/FastMCP
+# stack (~1s), which callers that only need a submodule shouldn't pay for.
+_LAZY_SUBMODULES = ("server", "top_queries")
+
+
+def __getattr__(name: str):
+    """Import heavy submodules on first attribute access."""
+    if name in _LAZY_SUBMODULES:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def main():
     """Main entry point for the package."""
+    from . import server
+
     # As of version 3.3.0 Psycopg on Windows is not compatible with the default
     # ProactorEventLoop.
     # See: https://www.psycopg.org/psycopg3/docs/advanced/async.html#async
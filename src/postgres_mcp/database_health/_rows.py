@@ -0,0 +1,13 @@
+"""Helpers for reading single-row SqlDriver results."""
+
+from __future__ import annotations
+
+from typing import Any
+from typing import Optional
+
+from ..sql import SqlDriver
+
+
+def scalar(result: Optional[list[SqlDriver.RowResult]], key: str, default: Any = 0) -> Any:
+    """Return one cell from a single-row result, or default when the result is empty."""
+    return result[0].cells[key] if result else default
@@ -0,0 +1,37 @@
+"""Short-lived per-instance caching for health check methods."""
+
+from __future__ import annotations
+
+import time
+from functools import wraps
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import TypeVar
+from typing import cast
+
+F = TypeVar("F", bound=Callable[..., Awaitable[str]])
+
+
+def ttl_cache(ttl_seconds: float = 1.0) -> Callable[[F], F]:
+    """Cache an async check method's result on the instance for ttl_seconds.
+
+    Health endpoints often invoke the same check twice in quick succession
+    (e.g., once for status and once for the body). Re-serving the string
+    within the TTL avoids a second round of Postgres queries.
+    """
+
+    def decorator(func: F) -> F:
+        @wraps(func)
+        async def wrapper(self: Any, *args: Any, **kwargs: Any) -> str:
+            cache: dict[str, tuple[float, str]] = self.__dict__.setdefault("_check_cache", {})
+            entry = cache.get(func.__name__)
+            if entry is not None and time.monotonic() - entry[0] <= ttl_seconds:
+                return entry[1]
+            value = await func(self, *args, **kwargs)
+            cache[func.__name__] = (time.monotonic(), value)
+            return value
+
+        return cast(F, wrapper)
+
+    return decorator
@@ -1,6 +1,7 @@
 from typing import Any
 
 from ..sql import SqlDriver
+from ._rows import scalar
 
 
 class BufferHealthCalc:
@@ -22,12 +23,11 @@ class BufferHealthCalc:
                 pg_statio_user_indexes
         """)
 
-        result_list = [dict(x.cells) for x in result] if result else []
-
-        if not result_list or result_list[0]["rate"] is None:
+        rate = scalar(result, "rate", None)
+        if rate is None:
             return "No index cache statistics available."
 
-        hit_rate = float(result_list[0]["rate"]) * 100
+        hit_rate = float(rate) * 100
         threshold_pct = threshold * 100
 
         if hit_rate >= threshold_pct:
@@ -48,12 +48,11 @@ class BufferHealthCalc:
                 pg_statio_user_tables
         """)
 
-        result_list = [dict(x.cells) for x in result] if result else []
-
-        if not result_list or result_list[0]["rate"] is None:
+        rate = scalar(result, "rate", None)
+        if rate is None:
             return "No table cache statistics available."
 
-        hit_rate = float(result_list[0]["rate"]) * 100
+        hit_rate = float(rate) * 100
         threshold_pct = threshold * 100
 
         if hit_rate >= threshold_pct:
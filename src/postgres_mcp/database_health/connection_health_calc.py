@@ -2,9 +2,10 @@ from dataclasses import dataclass
 
 from ..sql import SqlDriver
 from ..sql import has_view_column
+from ._ttl_cache import ttl_cache
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ConnectionHealthMetrics:
     total_connections: int
     idle_connections: int
@@ -31,7 +32,7 @@ class ConnectionHealthCalc:
 
     async def total_connections_check(self) -> str:
         """Check if total number of connections is within healthy limits."""
-        total = await self._get_total_connections()
+        total, _ = await self._get_connection_counts()
 
         if total <= self.max_total_connections:
             return f"Total connections healthy: {total}"
@@ -39,16 +40,16 @@ class ConnectionHealthCalc:
 
     async def idle_connections_check(self) -> str:
         """Check if number of idle connections is within healthy limits."""
-        idle = await self._get_idle_connections()
+        _, idle = await self._get_connection_counts()
 
         if idle <= self.max_idle_connections:
             return f"Idle connections healthy: {idle}"
         return f"High number of idle connections: {idle} (max: {self.max_idle_connections})"
 
+    @ttl_cache(1.0)
     async def connection_health_check(self) -> str:
         """Run all connection health checks and return combined results."""
-        total = await self._get_total_connections()
-        idle = await self._get_idle_connections()
+        total, idle = await self._get_connection_counts()
 
         if total > self.max_total_connections:
             return f"High number of connections: {total}"
@@ -71,47 +72,38 @@ class ConnectionHealthCalc:
         else:
             return f"Connections healthy: {total} total, {idle} idle"
 
-    async def _get_total_connections(self) -> int:
-        """Get the total number of database connections."""
+    async def _get_connection_counts(self) -> tuple[int, int]:
+        """Get the total and idle-in-transaction connection counts in one query."""
         result = await self.sql_driver.execute_query("""
-            SELECT COUNT(*) as count
+            SELECT
+                COUNT(*) AS total,
+                COUNT(*) FILTER (WHERE state = 'idle in transaction') AS idle
             FROM pg_stat_activity
         """)
         result_list = [dict(x.cells) for x in result] if result else []
-        return result_list[0]["count"] if result_list else 0
-
-    async def _get_idle_connections(self) -> int:
-        """Get the number of connections that are idle in transaction."""
-        result = await self.sql_driver.execute_query("""
-            SELECT COUNT(*) as count
-            FROM pg_stat_activity
-            WHERE state = 'idle in transaction'
-        """)
-        result_list = [dict(x.cells) for x in result] if result else []
-        return result_list[0]["count"] if result_list else 0
+        if not result_list:
+            return 0, 0
+        return result_list[0]["total"], result_list[0]["idle"]
 
     async def _get_idle_in_transaction_wait_events(self) -> list[dict[str, str | int]]:
         """Return grouped wait-event context for idle-in-transaction sessions."""
         if not await has_view_column(self.sql_driver, "pg_catalog", "pg_wait_events", "name"):
             return []
 
-        try:
-            result = await self.sql_driver.execute_query("""
-                SELECT
-                    COALESCE(a.wait_event_type, 'Unknown') AS wait_event_type,
-                    COALESCE(a.wait_event, 'Unknown') AS wait_event,
-                    COALESCE(w.description, '') AS wait_event_description,
-                    COUNT(*)::int AS count
-                FROM pg_stat_activity a
-                LEFT JOIN pg_catalog.pg_wait_events w
-                    ON w.type = a.wait_event_type
-                    AND w.name = a.wait_event
-                WHERE a.state = 'idle in transaction'
-                GROUP BY 1, 2, 3
-                ORDER BY 4 DESC, 1, 2
-            """)
-            if not result:
-                return []
-            return [dict(x.cells) for x in result]
-        except Exception:
+        result = await self.sql_driver.execute_query("""
+            SELECT
+                COALESCE(a.wait_event_type, 'Unknown') AS wait_event_type,
+                COALESCE(a.wait_event, 'Unknown') AS wait_event,
+                COALESCE(w.description, '') AS wait_event_description,
+                COUNT(*)::int AS count
+            FROM pg_stat_activity a
+            LEFT JOIN pg_catalog.pg_wait_events w
+                ON w.type = a.wait_event_type
+                AND w.name = a.wait_event
+            WHERE a.state = 'idle in transaction'
+            GROUP BY 1, 2, 3
+            ORDER BY 4 DESC, 1, 2
+        """)
+        if not result:
             return []
+        return [x.cells for x in result]
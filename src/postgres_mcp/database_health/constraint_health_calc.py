@@ -1,10 +1,24 @@
 from dataclasses import dataclass
+from typing import cast
+
+from typing_extensions import LiteralString
 
 from ..sql import SqlDriver
 from ..sql import has_view_column
+from ._rows import scalar
+from ._ttl_cache import ttl_cache
+
+# (validated, enforced) -> issue description, computed once instead of per row.
+_ISSUE_TEXT = {
+    (False, False): "is invalid and not enforced",
+    (False, True): "is invalid",
+    (True, False): "is not enforced",
+}
+_REF_TMPL = "Constraint '%s' on table '%s.%s' referencing '%s.%s' %s"
+_PLAIN_TMPL = "Constraint '%s' on table '%s.%s' %s"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ConstraintMetrics:
     schema: str
     table: str
@@ -16,9 +30,12 @@ class ConstraintMetrics:
 
 
 class ConstraintHealthCalc:
-    def __init__(self, sql_driver: SqlDriver):
+    def __init__(self, sql_driver: SqlDriver, max_rows: int = 200):
         self.sql_driver = sql_driver
+        self.max_rows = max_rows
+        self._sql_variants: dict[frozenset[str], LiteralString] = {}
 
+    @ttl_cache(1.0)
     async def invalid_constraints_check(self) -> str:
         """Check for invalid and, when available, not-enforced constraints.
 
@@ -30,70 +47,78 @@ class ConstraintHealthCalc:
         if not metrics:
             return "No invalid or not-enforced constraints found."
 
+        truncated = len(metrics) > self.max_rows
+        if truncated:
+            metrics = metrics[: self.max_rows]
+
         result = ["Constraint issues found:"]
         for metric in metrics:
-            if not metric.validated and not metric.enforced:
-                issue = "is invalid and not enforced"
-            elif not metric.validated:
-                issue = "is invalid"
-            else:
-                issue = "is not enforced"
-
+            issue = _ISSUE_TEXT.get((bool(metric.validated), bool(metric.enforced)), "is not enforced")
             if metric.referenced_table:
-                result.append(
-                    f"Constraint '{metric.name}' on table '{metric.schema}.{metric.table}' "
-                    f"referencing '{metric.referenced_schema}.{metric.referenced_table}' {issue}"
-                )
+                result.append(_REF_TMPL % (metric.name, metric.schema, metric.table, metric.referenced_schema, metric.referenced_table, issue))
             else:
-                result.append(f"Constraint '{metric.name}' on table '{metric.schema}.{metric.table}' {issue}")
+                result.append(_PLAIN_TMPL % (metric.name, metric.schema, metric.table, issue))
+        if truncated:
+            result.append(f"... and more (showing first {self.max_rows})")
         return "\n".join(result)
 
     async def _get_invalid_constraints(self) -> list[ConstraintMetrics]:
         """Get all invalid (and optionally not-enforced) constraints in the database."""
         has_conenforced = await has_view_column(self.sql_driver, "pg_catalog", "pg_constraint", "conenforced")
-        where_clause = "con.convalidated = false"
-        if has_conenforced:
-            where_clause = f"({where_clause} OR con.conenforced = false)"
-
-        results = await self.sql_driver.execute_query(f"""
-            SELECT
-                nsp.nspname AS schema,
-                rel.relname AS table,
-                con.conname AS name,
-                fnsp.nspname AS referenced_schema,
-                frel.relname AS referenced_table,
-                con.convalidated AS validated,
-                {"con.conenforced AS enforced" if has_conenforced else "TRUE AS enforced"}
-            FROM
-                pg_catalog.pg_constraint con
-            INNER JOIN
-                pg_catalog.pg_class rel ON rel.oid = con.conrelid
-            LEFT JOIN
-                pg_catalog.pg_class frel ON frel.oid = con.confrelid
-            LEFT JOIN
-                pg_catalog.pg_namespace nsp ON nsp.oid = con.connamespace
-            LEFT JOIN
-                pg_catalog.pg_namespace fnsp ON fnsp.oid = frel.relnamespace
-            WHERE
-                {where_clause}
-        """)
+        features = frozenset({"conenforced"}) if has_conenforced else frozenset()
+
+        query = self._sql_variants.get(features)
+        if query is None:
+            where_clause = "con.convalidated = false"
+            if has_conenforced:
+                where_clause = f"({where_clause} OR con.conenforced = false)"
+
+            query = cast(
+                LiteralString,
+                f"""
+                SELECT
+                    nsp.nspname AS schema,
+                    rel.relname AS table,
+                    con.conname AS name,
+                    fnsp.nspname AS referenced_schema,
+                    frel.relname AS referenced_table,
+                    con.convalidated AS validated,
+                    {"con.conenforced AS enforced" if has_conenforced else "TRUE AS enforced"}
+                FROM
+                    pg_catalog.pg_constraint con
+                INNER JOIN
+                    pg_catalog.pg_class rel ON rel.oid = con.conrelid
+                LEFT JOIN
+                    pg_catalog.pg_class frel ON frel.oid = con.confrelid
+                LEFT JOIN
+                    pg_catalog.pg_namespace nsp ON nsp.oid = con.connamespace
+                LEFT JOIN
+                    pg_catalog.pg_namespace fnsp ON fnsp.oid = frel.relnamespace
+                WHERE
+                    {where_clause}
+                ORDER BY
+                    1, 2, 3
+                LIMIT {self.max_rows + 1}
+                """,
+            )
+            self._sql_variants[features] = query
+
+        results = await self.sql_driver.execute_query(query)
 
         if not results:
             return []
 
-        result_list = [dict(x.cells) for x in results]
-
         return [
             ConstraintMetrics(
-                schema=row["schema"],
-                table=row["table"],
-                name=row["name"],
-                referenced_schema=row["referenced_schema"],
-                referenced_table=row["referenced_table"],
-                validated=row["validated"],
-                enforced=row["enforced"],
+                schema=row.cells["schema"],
+                table=row.cells["table"],
+                name=row.cells["name"],
+                referenced_schema=row.cells["referenced_schema"],
+                referenced_table=row.cells["referenced_table"],
+                validated=row.cells["validated"],
+                enforced=row.cells["enforced"],
             )
-            for row in result_list
+            for row in results
         ]
 
     async def _get_total_constraints(self) -> int:
@@ -102,10 +127,7 @@ class ConstraintHealthCalc:
             SELECT COUNT(*) as count
             FROM information_schema.table_constraints
         """)
-        if not result:
-            return 0
-        result_list = [dict(x.cells) for x in result]
-        return result_list[0]["count"] if result_list else 0
+        return scalar(result, "count")
 
     async def _get_active_constraints(self) -> int:
         """Get the number of active constraints."""
@@ -114,7 +136,4 @@ class ConstraintHealthCalc:
             FROM information_schema.table_constraints
             WHERE is_deferrable = 'NO'
         """)
-        if not result:
-            return 0
-        result_list = [dict(x.cells) for x in result]
-        return result_list[0]["count"] if result_list else 0
+        return scalar(result, "count")
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from enum import Enum
+from typing import Awaitable
 from typing import List
 
 import mcp.types as types
@@ -37,6 +39,17 @@ class DatabaseHealthTool:
 
     def __init__(self, sql_driver):
         self.sql_driver = sql_driver
+        # All calculators share the same driver (and therefore the same
+        # connection pool), and live as long as the tool so their short-lived
+        # caches are effective across repeated health() calls.
+        self.index_health = IndexHealthCalc(sql_driver)
+        self.connection_health = ConnectionHealthCalc(sql_driver)
+        self.vacuum_health = VacuumHealthCalc(sql_driver)
+        self.sequence_health = SequenceHealthCalc(sql_driver)
+        self.replication_health = ReplicationCalc(sql_driver)
+        self.buffer_health = BufferHealthCalc(sql_driver)
+        self.constraint_health = ConstraintHealthCalc(sql_driver)
+        self.checkpoint_health = CheckpointHealthCalc(sql_driver)
 
     async def health(self, health_type: str) -> str:
         """Run database health checks for the specified components.
@@ -49,7 +62,6 @@ class DatabaseHealthTool:
             A string with the health check results
         """
         try:
-            result = ""
             try:
                 health_types = {HealthType(x.strip()) for x in health_type.split(",")}
             except ValueError:
@@ -62,41 +74,47 @@ class DatabaseHealthTool:
             if HealthType.ALL in health_types:
                 health_types = [t.value for t in HealthType if t != HealthType.ALL]
 
+            # Collect the selected checks, then run them concurrently: they are
+            # independent and I/O-bound, so total wall time is the slowest
+            # check rather than the sum of all of them.
+            checks: list[tuple[str, Awaitable[str]]] = []
+
             if HealthType.INDEX in health_types:
-                index_health = IndexHealthCalc(self.sql_driver)
-                result += "Invalid index check: " + await index_health.invalid_index_check() + "\n"
-                result += "Duplicate index check: " + await index_health.duplicate_index_check() + "\n"
-                result += "Index bloat: " + await index_health.index_bloat() + "\n"
-                result += "Unused index check: " + await index_health.unused_indexes() + "\n"
+                checks.append(("Invalid index check: ", self.index_health.invalid_index_check()))
+                checks.append(("Duplicate index check: ", self.index_health.duplicate_index_check()))
+                checks.append(("Index bloat: ", self.index_health.index_bloat()))
+                checks.append(("Unused index check: ", self.index_health.unused_indexes()))
 
             if HealthType.CONNECTION in health_types:
-                connection_health = ConnectionHealthCalc(self.sql_driver)
-                result += "Connection health: " + await connection_health.connection_health_check() + "\n"
+                checks.append(("Connection health: ", self.connection_health.connection_health_check()))
 
             if HealthType.VACUUM in health_types:
-                vacuum_health = VacuumHealthCalc(self.sql_driver)
-                result += "Vacuum health: " + await vacuum_health.transaction_id_danger_check() + "\n"
+                checks.append(("Vacuum health: ", self.vacuum_health.transaction_id_danger_check()))
 
             if HealthType.SEQUENCE in health_types:
-                sequence_health = SequenceHealthCalc(self.sql_driver)
-                result += "Sequence health: " + await sequence_health.sequence_danger_check() + "\n"
+                checks.append(("Sequence health: ", self.sequence_health.sequence_danger_check()))
 
             if HealthType.REPLICATION in health_types:
-                replication_health = ReplicationCalc(self.sql_driver)
-                result += "Replication health: " + await replication_health.replication_health_check() + "\n"
+                checks.append(("Replication health: ", self.replication_health.replication_health_check()))
 
             if HealthType.BUFFER in health_types:
-                buffer_health = BufferHealthCalc(self.sql_driver)
-                result += "Buffer health for indexes: " + await buffer_health.index_hit_rate() + "\n"
-                result += "Buffer health for tables: " + await buffer_health.table_hit_rate() + "\n"
+                checks.append(("Buffer health for indexes: ", self.buffer_health.index_hit_rate()))
+                checks.append(("Buffer health for tables: ", self.buffer_health.table_hit_rate()))
 
             if HealthType.CONSTRAINT in health_types:
-                constraint_health = ConstraintHealthCalc(self.sql_driver)
-                result += "Constraint health: " + await constraint_health.invalid_constraints_check() + "\n"
+                checks.append(("Constraint health: ", self.constraint_health.invalid_constraints_check()))
 
             if HealthType.CHECKPOINT in health_types:
-                checkpoint_health = CheckpointHealthCalc(self.sql_driver)
-                result += "Checkpoint health: " + await checkpoint_health.checkpoint_health_check() + "\n"
+                checks.append(("Checkpoint health: ", self.checkpoint_health.checkpoint_health_check()))
+
+            outputs = await asyncio.gather(*(check for _, check in checks), return_exceptions=True)
+
+            result = ""
+            for (label, _), output in zip(checks, outputs):
+                if isinstance(output, BaseException):
+                    logger.error(f"Error calculating database health: {output}", exc_info=output)
+                    output = f"Error: {output}"
+                result += label + output + "\n"
 
             return result if result else "No health checks were performed."
         except Exception as e:
@@ -1,12 +1,16 @@
+import asyncio
 from dataclasses import dataclass
 from typing import Optional
 
 from ..sql import SqlDriver
 from ..sql import get_server_info
 from ..sql import has_view_column
+from ..sql import has_view_columns
+from ._rows import scalar
+from ._ttl_cache import ttl_cache
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ReplicationSlot:
     slot_name: str
     database: str
@@ -17,7 +21,7 @@ class ReplicationSlot:
     synced: bool | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ReplicationMetrics:
     is_replica: bool
     replication_lag_seconds: Optional[float]
@@ -28,9 +32,9 @@ class ReplicationMetrics:
 class ReplicationCalc:
     def __init__(self, sql_driver: SqlDriver):
         self.sql_driver = sql_driver
-        self._server_version: Optional[int] = None
         self._feature_support: dict[str, bool] = {}
 
+    @ttl_cache(1.0)
     async def replication_health_check(self) -> str:
         """Check replication health including lag and slots."""
         metrics = await self._get_replication_metrics()
@@ -59,18 +63,18 @@ class ReplicationCalc:
 
         # Check replication slots for both primary and replica
         if metrics.replication_slots:
-            active_slots = [s for s in metrics.replication_slots if s.active]
-            inactive_slots = [s for s in metrics.replication_slots if not s.active]
+            active_slots: list[ReplicationSlot] = []
+            inactive_slots: list[ReplicationSlot] = []
+            for slot in metrics.replication_slots:
+                (active_slots if slot.active else inactive_slots).append(slot)
 
             if active_slots:
                 result.append("\nActive replication slots:")
-                for slot in active_slots:
-                    result.append(self._format_slot(slot))
+                result.extend(map(self._format_slot, active_slots))
 
             if inactive_slots:
                 result.append("\nInactive replication slots:")
-                for slot in inactive_slots:
-                    result.append(self._format_slot(slot))
+                result.extend(map(self._format_slot, inactive_slots))
         else:
             result.append("\nNo replication slots found.")
 
@@ -78,18 +82,23 @@ class ReplicationCalc:
 
     async def _get_replication_metrics(self) -> ReplicationMetrics:
         """Get comprehensive replication metrics."""
+        is_replica, replication_lag_seconds, is_replicating, replication_slots = await asyncio.gather(
+            self._is_replica(),
+            self._get_replication_lag(),
+            self._is_replicating(),
+            self._get_replication_slots(),
+        )
         return ReplicationMetrics(
-            is_replica=await self._is_replica(),
-            replication_lag_seconds=await self._get_replication_lag(),
-            is_replicating=await self._is_replicating(),
-            replication_slots=await self._get_replication_slots(),
+            is_replica=is_replica,
+            replication_lag_seconds=replication_lag_seconds,
+            is_replicating=is_replicating,
+            replication_slots=replication_slots,
         )
 
     async def _is_replica(self) -> bool:
         """Check if this database is a replica."""
         result = await self.sql_driver.execute_query("SELECT pg_is_in_recovery()")
-        result_list = [dict(x.cells) for x in result] if result is not None else []
-        return bool(result_list[0]["pg_is_in_recovery"]) if result_list else False
+        return bool(scalar(result, "pg_is_in_recovery", False))
 
     async def _get_replication_lag(self) -> Optional[float]:
         """Get replication lag in seconds."""
@@ -111,72 +120,57 @@ class ReplicationCalc:
                     END
                 AS replication_lag
             """)
-            result_list = [dict(x.cells) for x in result] if result is not None else []
-            return float(result_list[0]["replication_lag"]) if result_list else None
+            lag = scalar(result, "replication_lag", None)
+            return float(lag) if lag is not None else None
         except Exception:
             self._feature_support["replication_lag"] = False
             return None
 
     async def _get_replication_slots(self) -> list[ReplicationSlot]:
         """Get information about replication slots."""
-        if await self._get_server_version() < 90400 or not self._feature_supported("replication_slots"):
-            return []
-
-        try:
-            supports_invalidation_reason = await has_view_column(
-                self.sql_driver,
-                "pg_catalog",
-                "pg_replication_slots",
-                "invalidation_reason",
-            )
-            supports_inactive_since = await has_view_column(
-                self.sql_driver,
-                "pg_catalog",
-                "pg_replication_slots",
-                "inactive_since",
-            )
-            supports_failover = await has_view_column(
-                self.sql_driver,
-                "pg_catalog",
-                "pg_replication_slots",
-                "failover",
-            )
-            supports_synced = await has_view_column(
+        server_version, columns = await asyncio.gather(
+            self._get_server_version(),
+            has_view_columns(
                 self.sql_driver,
                 "pg_catalog",
                 "pg_replication_slots",
-                "synced",
-            )
-
-            result = await self.sql_driver.execute_query(f"""
-                SELECT
-                    slot_name,
-                    database,
-                    active,
-                    {"invalidation_reason AS invalidation_reason" if supports_invalidation_reason else "NULL::text AS invalidation_reason"},
-                    {"inactive_since::text AS inactive_since" if supports_inactive_since else "NULL::text AS inactive_since"},
-                    {"failover AS failover" if supports_failover else "NULL::boolean AS failover"},
-                    {"synced AS synced" if supports_synced else "NULL::boolean AS synced"}
-                FROM pg_replication_slots
-            """)
-            if result is None:
-                return []
-            result_list = [dict(x.cells) for x in result]
-            return [
-                ReplicationSlot(
-                    slot_name=row["slot_name"],
-                    database=row["database"],
-                    active=row["active"],
-                    invalidation_reason=row["invalidation_reason"],
-                    inactive_since=row["inactive_since"],
-                    failover=row["failover"],
-                    synced=row["synced"],
-                )
-                for row in result_list
-            ]
-        except Exception:
-            self._feature_support["replication_slots"] = False
+                ["slot_name", "invalidation_reason", "inactive_since", "failover", "synced"],
+            ),
+        )
+        # The probe doubles as feature detection: no slot_name column means
+        # the pg_replication_slots view itself is unavailable.
+        if server_version < 90400 or "slot_name" not in columns:
             return []
+        supports_invalidation_reason = "invalidation_reason" in columns
+        supports_inactive_since = "inactive_since" in columns
+        supports_failover = "failover" in columns
+        supports_synced = "synced" in columns
+
+        result = await self.sql_driver.execute_query(f"""
+            SELECT
+                slot_name,
+                database,
+                active,
+                {"invalidation_reason AS invalidation_reason" if supports_invalidation_reason else "NULL::text AS invalidation_reason"},
+                {"inactive_since::text AS inactive_since" if supports_inactive_since else "NULL::text AS inactive_since"},
+                {"failover AS failover" if supports_failover else "NULL::boolean AS failover"},
+                {"synced AS synced" if supports_synced else "NULL::boolean AS synced"}
+            FROM pg_replication_slots
+        """)
+        if result is None:
+            return []
+        return [
+            ReplicationSlot(
+                slot_name=row.cells["slot_name"],
+                database=row.cells["database"],
+                active=row.cells["active"],
+                invalidation_reason=row.cells["invalidation_reason"],
+                inactive_since=row.cells["inactive_since"],
+                failover=row.cells["failover"],
+                synced=row.cells["synced"],
+            )
+            for row in result
+        ]
 
     def _format_slot(self, slot: ReplicationSlot) -> str:
         details: list[str] = []
@@ -193,22 +187,15 @@ class ReplicationCalc:
 
     async def _is_replicating(self) -> bool:
         """Check if replication is active."""
-        if not self._feature_supported("replicating"):
+        if not await has_view_column(self.sql_driver, "pg_catalog", "pg_stat_replication", "state"):
             return False
 
-        try:
-            result = await self.sql_driver.execute_query("SELECT state FROM pg_stat_replication")
-            result_list = [dict(x.cells) for x in result] if result is not None else []
-            return bool(result_list and len(result_list) > 0)
-        except Exception:
-            self._feature_support["replicating"] = False
-            return False
+        result = await self.sql_driver.execute_query("SELECT state FROM pg_stat_replication")
+        return bool(result)
 
     async def _get_server_version(self) -> int:
         """Get PostgreSQL server version as a number (e.g. 100000 for version 10.0)."""
-        if self._server_version is None:
-            self._server_version = (await get_server_info(self.sql_driver)).server_version_num
-        return self._server_version
+        return (await get_server_info(self.sql_driver)).server_version_num
 
     def _feature_supported(self, feature: str) -> bool:
         """Check if a feature is supported and cache the result."""
@@ -7,7 +7,7 @@ from ..sql import SafeSqlDriver
 from ..sql import SqlDriver
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SequenceMetrics:
     schema: str
     table: str
@@ -5,7 +5,7 @@ from ..sql import SqlDriver
 from ..sql import has_view_column
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TransactionIdMetrics:
     schema: str
     table: str
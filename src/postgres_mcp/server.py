@@ -13,6 +13,7 @@ from mcp.types import ToolAnnotations
 import postgres_mcp.tools._state as state
 
 from .sql import obfuscate_password
+from .sql import warm_catalog_caches
 from .tools._response import format_error_response
 from .tools._response import format_text_response
 from .tools._state import AccessMode
@@ -23,9 +24,9 @@ from .tools.analysis_tools import postgres_analyze_db_health
 from .tools.analysis_tools import postgres_analyze_query_indexes
 from .tools.analysis_tools import postgres_analyze_workload_indexes
 from .tools.analysis_tools import postgres_get_top_queries
+from .tools.object_tools import postgres_get_object_details
 from .tools.query_tools import postgres_execute_sql
 from .tools.query_tools import postgres_explain_query
-from .tools.schema_tools import postgres_get_object_details
 from .tools.schema_tools import postgres_list_objects
 from .tools.schema_tools import postgres_list_schemas
 
@@ -42,48 +43,50 @@ _READONLY_ANNOTATIONS = ToolAnnotations(
 )
 
 
-def _register_readonly_tools() -> None:
-    """Register all read-only tools at module load time."""
-    mcp.add_tool(
+# (function, tool name, description, annotation title) for every tool that is
+# read-only regardless of access mode. postgres_execute_sql is registered in
+# main() because its annotations depend on the access mode.
+_TOOL_SPECS = (
+    (
         postgres_list_schemas,
-        name="postgres_list_schemas",
-        description="List all schemas in the database",
-        annotations=ToolAnnotations(title="List Schemas", **_READONLY_ANNOTATIONS.model_dump(exclude={"title"})),
-    )
-    mcp.add_tool(
+        "postgres_list_schemas",
+        "List schemas in the database (system schemas are excluded unless include_system is set)",
+        "List Schemas",
+    ),
+    (
         postgres_list_objects,
-        name="postgres_list_objects",
-        description="List objects in a schema",
-        annotations=ToolAnnotations(title="List Objects", **_READONLY_ANNOTATIONS.model_dump(exclude={"title"})),
-    )
-    mcp.add_tool(
+        "postgres_list_objects",
+        "List objects in a schema",
+        "List Objects",
+    ),
+    (
         postgres_get_object_details,
-        name="postgres_get_object_details",
-        description="Show detailed information about a database object",
-        annotations=ToolAnnotations(title="Get Object Details", **_READONLY_ANNOTATIONS.model_dump(exclude={"title"})),
-    )
-    mcp.add_tool(
+        "postgres_get_object_details",
+        "Show detailed information about a database object",
+        "Get Object Details",
+    ),
+    (
         postgres_explain_query,
-        name="postgres_explain_query",
-        description=("Explains the execution plan for a SQL query, showing how the database will execute it and provides detailed cost estimates."),
-        annotations=ToolAnnotations(title="Explain Query", **_READONLY_ANNOTATIONS.model_dump(exclude={"title"})),
-    )
-    mcp.add_tool(
+        "postgres_explain_query",
+        "Explains the execution plan for a SQL query, showing how the database will execute it and provides detailed cost estimates.",
+        "Explain Query",
+    ),
+    (
         postgres_analyze_workload_indexes,
-        name="postgres_analyze_workload_indexes",
-        description="Analyze frequently executed queries in the database and recommend optimal indexes",
-        annotations=ToolAnnotations(title="Analyze Workload Indexes", **_READONLY_ANNOTATIONS.model_dump(exclude={"title"})),
-    )
-    mcp.add_tool(
+        "postgres_analyze_workload_indexes",
+        "Analyze frequently executed queries in the database and recommend optimal indexes",
+        "Analyze Workload Indexes",
+    ),
+    (
         postgres_analyze_query_indexes,
-        name="postgres_analyze_query_indexes",
-        description="Analyze a list of (up to 10) SQL queries and recommend optimal indexes",
-        annotations=ToolAnnotations(title="Analyze Query Indexes", **_READONLY_ANNOTATIONS.model_dump(exclude={"title"})),
-    )
-    mcp.add_tool(
+        "postgres_analyze_query_indexes",
+        "Analyze a list of (up to 10) SQL queries and recommend optimal indexes",
+        "Analyze Query Indexes",
+    ),
+    (
         postgres_analyze_db_health,
-        name="postgres_analyze_db_health",
-        description=(
+        "postgres_analyze_db_health",
+        (
             "Analyzes database health. Here are the available health checks:\n"
             "- index - checks for invalid, duplicate, and bloated indexes\n"
             "- connection - checks the number of connection and their utilization\n"
@@ -96,14 +99,26 @@ def _register_readonly_tools() -> None:
             "You can optionally specify a single health check or a comma-separated list of health checks. "
             "The default is 'all' checks."
         ),
-        annotations=ToolAnnotations(title="Analyze Database Health", **_READONLY_ANNOTATIONS.model_dump(exclude={"title"})),
-    )
-    mcp.add_tool(
+        "Analyze Database Health",
+    ),
+    (
         postgres_get_top_queries,
-        name="postgres_get_top_queries",
-        description=f"Reports the slowest or most resource-intensive queries using data from the '{PG_STAT_STATEMENTS}' extension.",
-        annotations=ToolAnnotations(title="Get Top Queries", **_READONLY_ANNOTATIONS.model_dump(exclude={"title"})),
-    )
+        "postgres_get_top_queries",
+        f"Reports the slowest or most resource-intensive queries using data from the '{PG_STAT_STATEMENTS}' extension.",
+        "Get Top Queries",
+    ),
+)
+
+
+def _register_readonly_tools() -> None:
+    """Register all read-only tools at module load time."""
+    for fn, name, description, title in _TOOL_SPECS:
+        mcp.add_tool(
+            fn,
+            name=name,
+            description=description,
+            annotations=_READONLY_ANNOTATIONS.model_copy(update={"title": title}),
+        )
 
 
 _register_readonly_tools()
@@ -198,10 +213,7 @@ async def main() -> None:
             postgres_execute_sql,
             name="postgres_execute_sql",
             description="Execute a read-only SQL query",
-            annotations=ToolAnnotations(
-                title="Execute SQL (Read-Only)",
-                **_READONLY_ANNOTATIONS.model_dump(exclude={"title"}),
-            ),
+            annotations=_READONLY_ANNOTATIONS.model_copy(update={"title": "Execute SQL (Read-Only)"}),
         )
 
     logger.info(f"Starting PostgreSQL MCP Server in {state.current_access_mode.upper()} mode")
@@ -216,6 +228,9 @@ async def main() -> None:
     try:
         await state.db_connection.pool_connect(database_url)
         logger.info("Successfully connected to database and initialized connection pool")
+        # Resolve version and catalog capabilities now so the first tool call
+        # skips the probe round-trips.
+        await warm_catalog_caches(await get_sql_driver())
     except Exception as e:
         logger.warning(f"Could not connect to database: {obfuscate_password(str(e))}")
         logger.warning("The MCP server will start but database operations will fail until a valid connection is established.")
@@ -252,6 +267,7 @@ async def shutdown(sig=None) -> None:
         logger.info(f"Received exit signal {sig.name}")
 
     try:
+        state.reset_sql_drivers()
         await state.db_connection.close()
         logger.info("Closed database connections")
     except Exception as e:
@@ -13,9 +13,13 @@ from .pg_compat import PgServerInfo
 from .pg_compat import PgStatStatementsColumns
 from .pg_compat import get_pg_stat_statements_columns
 from .pg_compat import get_server_info
+from .pg_compat import get_view_columns
 from .pg_compat import has_pg_stat_statements_column
+from .pg_compat import has_pg_stat_statements_columns
 from .pg_compat import has_view_column
+from .pg_compat import has_view_columns
 from .pg_compat import reset_pg_compat_cache
+from .pg_compat import warm_catalog_caches
 from .safe_sql import SafeSqlDriver
 from .sql_driver import DbConnPool
 from .sql_driver import SqlDriver
@@ -37,9 +41,13 @@ __all__ = [
     "get_pg_stat_statements_columns",
     "get_postgres_version",
     "get_server_info",
+    "get_view_columns",
     "has_pg_stat_statements_column",
+    "has_pg_stat_statements_columns",
     "has_view_column",
+    "has_view_columns",
     "obfuscate_password",
     "reset_pg_compat_cache",
     "reset_postgres_version_cache",
+    "warm_catalog_caches",
 ]
@@ -2,20 +2,35 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
+import time
 from dataclasses import dataclass
+from typing import Optional
 
-from .safe_sql import SafeSqlDriver
 from .sql_driver import SqlDriver
 
 logger = logging.getLogger(__name__)
 
-_SERVER_INFO_CACHE: dict[str, PgServerInfo] = {}
-_COLUMN_CACHE: dict[tuple[str, str, str, str], bool] = {}
+# Catalog facts are stable for the lifetime of a server, but a short TTL lets
+# long-running processes pick up extension or server upgrades.
+_CACHE_TTL_SECONDS = 60.0
 
+_MAJOR_VERSION_RE = re.compile(r"(\d+)")
 
-@dataclass(frozen=True)
+_SERVER_INFO_CACHE: dict[str, tuple[float, PgServerInfo]] = {}
+_COLUMN_CACHE: dict[tuple[str, str, str, str], tuple[float, bool]] = {}
+_VIEW_COLS_CACHE: dict[tuple[str, str, str], tuple[float, frozenset[str]]] = {}
+_PGSS_CACHE: dict[str, tuple[float, PgStatStatementsColumns]] = {}
+
+
+def _cache_entry_fresh(entry: Optional[tuple[float, object]]) -> bool:
+    """Check whether a (timestamp, value) cache entry is still within the TTL."""
+    return entry is not None and time.monotonic() - entry[0] <= _CACHE_TTL_SECONDS
+
+
+@dataclass(frozen=True, slots=True)
 class PgServerInfo:
     """Minimal server version information used by compatibility gates."""
 
@@ -23,7 +38,7 @@ class PgServerInfo:
     major: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PgStatStatementsColumns:
     """Version-aware and capability-aware projection for pg_stat_statements."""
 
@@ -45,16 +60,21 @@ def reset_pg_compat_cache() -> None:
     """Reset version and capability caches. Primarily used by tests."""
     _SERVER_INFO_CACHE.clear()
     _COLUMN_CACHE.clear()
+    _VIEW_COLS_CACHE.clear()
+    _PGSS_CACHE.clear()
+
+
+# Wrapper nesting is one level deep in practice (SafeSqlDriver around
+# SqlDriver); the bound only guards against pathological self-references.
+_MAX_UNWRAP_DEPTH = 8
 
 
 def _unwrap_sql_driver(sql_driver: SqlDriver) -> SqlDriver:
     """Return the underlying SqlDriver if wrapped (e.g., SafeSqlDriver)."""
     candidate = sql_driver
-    seen = set()
-    while id(candidate) not in seen:
-        seen.add(id(candidate))
-        nested = getattr(candidate, "__dict__", {}).get("sql_driver")
-        if nested is None:
+    for _ in range(_MAX_UNWRAP_DEPTH):
+        nested = getattr(candidate, "sql_driver", None)
+        if not isinstance(nested, SqlDriver) or nested is candidate:
             break
         candidate = nested
     return candidate
@@ -64,11 +84,16 @@ def _cache_key(sql_driver: SqlDriver) -> str:
     """Create a stable-ish key scoped to an active connection target."""
     driver = _unwrap_sql_driver(sql_driver)
 
-    conn = getattr(driver, "__dict__", {}).get("conn")
+    conn = getattr(driver, "conn", None)
     if conn is not None:
-        return f"conn:{id(conn)}"
-
-    engine_url = getattr(driver, "__dict__", {}).get("engine_url")
+        # Anchor on the pool and its DSN so the key survives driver
+        # reconstruction and goes stale if the pool reconnects elsewhere.
+        dsn = getattr(conn, "connection_url", None)
+        if isinstance(dsn, str) and dsn:
+            return f"pool:{id(conn)}:{hash(dsn)}"
+        return f"pool:{id(conn)}"
+
+    engine_url = getattr(driver, "engine_url", None)
     if isinstance(engine_url, str) and engine_url:
         return f"url:{engine_url}"
 
@@ -77,7 +102,7 @@ def _cache_key(sql_driver: SqlDriver) -> str:
 
 def _major_from_version_string(version_string: str) -> int:
     """Parse major version from server version string."""
-    match = re.search(r"(\d+)", version_string)
+    match = _MAJOR_VERSION_RE.search(version_string)
     if not match:
         return 0
     return int(match.group(1))
@@ -87,112 +112,210 @@ async def get_server_info(sql_driver: SqlDriver) -> PgServerInfo:
     """Return cached server version info, preferring server_version_num."""
     key = _cache_key(sql_driver)
     cached = _SERVER_INFO_CACHE.get(key)
-    if cached is not None:
-        return cached
+    if _cache_entry_fresh(cached):
+        assert cached is not None
+        return cached[1]
 
     version_num = 0
     major = 0
 
-    try:
-        rows = await sql_driver.execute_query("SHOW server_version_num")
-        if rows:
-            raw_value = rows[0].cells.get("server_version_num", 0)
-            version_num = int(raw_value) if raw_value is not None else 0
-            major = version_num // 10000 if version_num >= 10000 else version_num
-    except Exception as e:
-        logger.debug("Failed to read server_version_num, falling back to server_version: %s", e)
+    # Both probes are cheap and idempotent; fire them together so the cold
+    # path costs one round-trip of latency instead of two when falling back.
+    num_rows, version_rows = await asyncio.gather(
+        sql_driver.execute_query("SHOW server_version_num"),
+        sql_driver.execute_query("SHOW server_version"),
+        return_exceptions=True,
+    )
+
+    if isinstance(num_rows, BaseException):
+        logger.debug("Failed to read server_version_num, falling back to server_version: %s", num_rows)
+    elif num_rows:
+        raw_value = num_rows[0].cells.get("server_version_num", 0)
+        version_num = int(raw_value) if raw_value is not None else 0
+        major = version_num // 10000 if version_num >= 10000 else version_num
 
     if major == 0:
-        try:
-            rows = await sql_driver.execute_query("SHOW server_version")
-            if rows:
-                raw_value = str(rows[0].cells.get("server_version", ""))
-                major = _major_from_version_string(raw_value)
-                version_num = major * 10000 if major > 0 else 0
-        except Exception as e:
-            raise ValueError("Error determining PostgreSQL server version") from e
+        if isinstance(version_rows, BaseException):
+            raise ValueError("Error determining PostgreSQL server version") from version_rows
+        if version_rows:
+            raw_value = str(version_rows[0].cells.get("server_version", ""))
+            major = _major_from_version_string(raw_value)
+            version_num = major * 10000 if major > 0 else 0
 
     info = PgServerInfo(server_version_num=version_num, major=major)
-    _SERVER_INFO_CACHE[key] = info
+    _SERVER_INFO_CACHE[key] = (time.monotonic(), info)
     return info
 
 
+# Fixed probe SQL executed with bind parameters so psycopg can parse and plan
+# each statement once per connection and re-execute it server-side thereafter.
+_VIEW_COLUMNS_SQL = """
+SELECT column_name
+FROM information_schema.columns
+WHERE table_schema = %s
+  AND table_name = %s
+"""
+
+_HAS_PG_STAT_STATEMENTS_COLUMN_SQL = """
+SELECT EXISTS (
+    SELECT 1
+    FROM pg_catalog.pg_attribute a
+    JOIN pg_catalog.pg_class c ON c.oid = a.attrelid
+    JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+    WHERE c.relname = 'pg_stat_statements'
+      AND n.nspname NOT IN ('pg_toast')
+      AND a.attname = %s
+      AND NOT a.attisdropped
+) AS has_column
+"""
+
+_HAS_PG_STAT_STATEMENTS_COLUMNS_SQL = """
+SELECT a.attname AS column_name
+FROM pg_catalog.pg_attribute a
+JOIN pg_catalog.pg_class c ON c.oid = a.attrelid
+JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+WHERE c.relname = 'pg_stat_statements'
+  AND n.nspname NOT IN ('pg_toast')
+  AND a.attname = ANY(%s)
+  AND NOT a.attisdropped
+"""
+
+
+async def get_view_columns(sql_driver: SqlDriver, schema: str, view_name: str) -> frozenset[str]:
+    """Return all column names of a view/table, fetched once per TTL window."""
+    key = (_cache_key(sql_driver), schema, view_name)
+    cached = _VIEW_COLS_CACHE.get(key)
+    if _cache_entry_fresh(cached):
+        assert cached is not None
+        return cached[1]
+
+    driver = _unwrap_sql_driver(sql_driver)
+    rows = await driver.execute_query(
+        _VIEW_COLUMNS_SQL,
+        params=[schema, view_name],
+        force_readonly=True,
+    )
+
+    columns = frozenset(str(row.cells["column_name"]) for row in rows) if rows else frozenset()
+    _VIEW_COLS_CACHE[key] = (time.monotonic(), columns)
+    return columns
+
+
 async def has_view_column(sql_driver: SqlDriver, schema: str, view_name: str, column_name: str) -> bool:
     """Check whether a specific view/table column exists."""
-    key = (_cache_key(sql_driver), schema, view_name, column_name)
-    cached = _COLUMN_CACHE.get(key)
-    if cached is not None:
-        return cached
-
-    rows = await SafeSqlDriver.execute_param_query(
-        sql_driver,
-        """
-        SELECT EXISTS (
-            SELECT 1
-            FROM information_schema.columns
-            WHERE table_schema = {}
-              AND table_name = {}
-              AND column_name = {}
-        ) AS has_column
-        """,
-        [schema, view_name, column_name],
-    )
+    return column_name in await get_view_columns(sql_driver, schema, view_name)
 
-    has_column = bool(rows and rows[0].cells.get("has_column"))
-    _COLUMN_CACHE[key] = has_column
-    return has_column
+
+async def has_view_columns(sql_driver: SqlDriver, schema: str, view_name: str, column_names: list[str]) -> set[str]:
+    """Return the subset of column_names present on a view/table in one round-trip."""
+    available = await get_view_columns(sql_driver, schema, view_name)
+    return {name for name in column_names if name in available}
 
 
 async def has_pg_stat_statements_column(sql_driver: SqlDriver, column_name: str) -> bool:
     """Check whether pg_stat_statements exposes a given column."""
     key = (_cache_key(sql_driver), "*", "pg_stat_statements", column_name)
     cached = _COLUMN_CACHE.get(key)
-    if cached is not None:
-        return cached
-
-    rows = await SafeSqlDriver.execute_param_query(
-        sql_driver,
-        """
-        SELECT EXISTS (
-            SELECT 1
-            FROM pg_catalog.pg_attribute a
-            JOIN pg_catalog.pg_class c ON c.oid = a.attrelid
-            JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
-            WHERE c.relname = 'pg_stat_statements'
-              AND n.nspname NOT IN ('pg_toast')
-              AND a.attname = {}
-              AND NOT a.attisdropped
-        ) AS has_column
-        """,
-        [column_name],
+    if _cache_entry_fresh(cached):
+        assert cached is not None
+        return cached[1]
+
+    driver = _unwrap_sql_driver(sql_driver)
+    rows = await driver.execute_query(
+        _HAS_PG_STAT_STATEMENTS_COLUMN_SQL,
+        params=[column_name],
+        force_readonly=True,
     )
 
     has_column = bool(rows and rows[0].cells.get("has_column"))
-    _COLUMN_CACHE[key] = has_column
+    _COLUMN_CACHE[key] = (time.monotonic(), has_column)
     return has_column
 
 
+async def has_pg_stat_statements_columns(sql_driver: SqlDriver, column_names: list[str]) -> set[str]:
+    """Return the subset of column_names that pg_stat_statements exposes, in one round-trip."""
+    driver_key = _cache_key(sql_driver)
+    missing = [name for name in column_names if not _cache_entry_fresh(_COLUMN_CACHE.get((driver_key, "*", "pg_stat_statements", name)))]
+
+    if missing:
+        driver = _unwrap_sql_driver(sql_driver)
+        rows = await driver.execute_query(
+            _HAS_PG_STAT_STATEMENTS_COLUMNS_SQL,
+            params=[missing],
+            force_readonly=True,
+        )
+        present = {str(row.cells["column_name"]) for row in rows} if rows else set()
+        now = time.monotonic()
+        for name in missing:
+            _COLUMN_CACHE[(driver_key, "*", "pg_stat_statements", name)] = (now, name in present)
+
+    return {name for name in column_names if _COLUMN_CACHE[(driver_key, "*", "pg_stat_statements", name)][1]}
+
+
+_PGSS_PROBE_COLUMNS = [
+    "total_exec_time",
+    "mean_exec_time",
+    "stddev_exec_time",
+    "wal_bytes",
+    "stats_since",
+    "minmax_stats_since",
+    "local_blk_read_time",
+    "local_blk_write_time",
+    "parallel_workers_to_launch",
+    "parallel_workers_launched",
+    "wal_buffers_full",
+]
+
+# Every view whose columns the health calculators probe via
+# has_view_column(s); kept in one place so the startup warmup below stays in
+# step with the probes.
+_PROBED_VIEWS = [
+    "pg_constraint",
+    "pg_replication_slots",
+    "pg_stat_all_tables",
+    "pg_stat_checkpointer",
+    "pg_stat_replication",
+    "pg_wait_events",
+]
+
+
+async def warm_catalog_caches(sql_driver: SqlDriver) -> None:
+    """Prime every catalog capability cache in one concurrent burst.
+
+    Called at startup so the first tool call does not pay the probe
+    round-trips; failures are tolerated because each probe re-runs lazily
+    on first use if its cache entry is missing.
+    """
+    results = await asyncio.gather(
+        get_server_info(sql_driver),
+        get_pg_stat_statements_columns(sql_driver),
+        *(get_view_columns(sql_driver, "pg_catalog", view) for view in _PROBED_VIEWS),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            logger.debug("Catalog cache warmup probe failed: %s", result)
+
+
 async def get_pg_stat_statements_columns(sql_driver: SqlDriver) -> PgStatStatementsColumns:
     """Return capability-aware pg_stat_statements projection details."""
-    total_time = "total_exec_time" if await has_pg_stat_statements_column(sql_driver, "total_exec_time") else "total_time"
-    mean_time = "mean_exec_time" if await has_pg_stat_statements_column(sql_driver, "mean_exec_time") else "mean_time"
-    stddev_time = "stddev_exec_time" if await has_pg_stat_statements_column(sql_driver, "stddev_exec_time") else "stddev_time"
-    has_wal_bytes = await has_pg_stat_statements_column(sql_driver, "wal_bytes")
+    key = _cache_key(sql_driver)
+    cached = _PGSS_CACHE.get(key)
+    if _cache_entry_fresh(cached):
+        assert cached is not None
+        return cached[1]
+
+    present = await has_pg_stat_statements_columns(sql_driver, _PGSS_PROBE_COLUMNS)
+
+    total_time = "total_exec_time" if "total_exec_time" in present else "total_time"
+    mean_time = "mean_exec_time" if "mean_exec_time" in present else "mean_time"
+    stddev_time = "stddev_exec_time" if "stddev_exec_time" in present else "stddev_time"
+    has_wal_bytes = "wal_bytes" in present
 
     def optional_select(column: str, fallback_cast: str) -> str:
-        return f"{column} AS {column}" if column_presence[column] else f"NULL::{fallback_cast} AS {column}"
-
-    column_presence = {
-        "stats_since": await has_pg_stat_statements_column(sql_driver, "stats_since"),
-        "minmax_stats_since": await has_pg_stat_statements_column(sql_driver, "minmax_stats_since"),
-        "local_blk_read_time": await has_pg_stat_statements_column(sql_driver, "local_blk_read_time"),
-        "local_blk_write_time": await has_pg_stat_statements_column(sql_driver, "local_blk_write_time"),
-        "parallel_workers_to_launch": await has_pg_stat_statements_column(sql_driver, "parallel_workers_to_launch"),
-        "parallel_workers_launched": await has_pg_stat_statements_column(sql_driver, "parallel_workers_launched"),
-        "wal_buffers_full": await has_pg_stat_statements_column(sql_driver, "wal_buffers_full"),
-    }
-
-    return PgStatStatementsColumns(
+        return f"{column} AS {column}" if column in present else f"NULL::{fallback_cast} AS {column}"
+
+    columns = PgStatStatementsColumns(
         total_time=total_time,
         mean_time=mean_time,
         stddev_time=stddev_time,
@@ -210,3 +333,5 @@ async def get_pg_stat_statements_columns(sql_driver: SqlDriver) -> PgStatStateme
         parallel_workers_launched_select=optional_select("parallel_workers_launched", "bigint"),
         wal_buffers_full_select=optional_select("wal_buffers_full", "bigint"),
     )
+    _PGSS_CACHE[key] = (time.monotonic(), columns)
+    return columns
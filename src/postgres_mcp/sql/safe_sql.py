@@ -224,6 +224,7 @@ class SafeSqlDriver(SqlDriver):
         "array_to_string",
         "array_upper",
         "cardinality",
+        "generate_subscripts",
         "string_to_array",
         "trim_array",
         "unnest",
@@ -59,6 +59,17 @@ def obfuscate_password(text: str | None) -> str | None:
     return text
 
 
+async def _configure_connection(connection: Any) -> None:
+    """Prepare parameterized statements on first execution.
+
+    psycopg only switches a statement to a server-side prepared plan after
+    several executions by default; lowering the threshold to zero lets the
+    stable-text catalog queries (version and capability probes, schema
+    listings) reuse their parse/plan work from the first repeat onwards.
+    """
+    connection.prepare_threshold = 0
+
+
 class DbConnPool:
     """Database connection manager using psycopg's connection pool."""
 
@@ -85,12 +96,16 @@ class DbConnPool:
         await self.close()
 
         try:
-            # Configure connection pool with appropriate settings
+            # Configure connection pool with appropriate settings. min_size=2
+            # pre-warms a second connection at startup so concurrent tool
+            # queries (e.g. the gathered object-detail lookups) skip the
+            # TCP/TLS/startup handshake on their first use.
             self.pool = AsyncConnectionPool(
                 conninfo=url,
-                min_size=1,
+                min_size=2,
                 max_size=5,
                 open=False,  # Don't connect immediately, let's do it explicitly
+                configure=_configure_connection,
             )
 
             # Open the pool explicitly
@@ -4,17 +4,23 @@ from typing import Any
 import mcp.types as types
 from mcp.types import CallToolResult
 
+# Reused across responses so each call skips encoder construction.
+_JSON_ENCODER = json.JSONEncoder(indent=2, default=str, ensure_ascii=False)
+
 
 def format_text_response(text: Any) -> CallToolResult:
     """Format a text response.
 
-    Strings are passed through as-is. All other types are serialized to JSON
-    with ``default=str`` so that objects like ``datetime`` are handled gracefully.
+    Strings and UTF-8 bytes are passed through as-is. All other types are
+    serialized to JSON with ``default=str`` so that objects like ``datetime``
+    are handled gracefully.
     """
     if isinstance(text, str):
         body = text
+    elif isinstance(text, (bytes, bytearray)):
+        body = bytes(text).decode()
     else:
-        body = json.dumps(text, indent=2, default=str)
+        body = _JSON_ENCODER.encode(text)
     return CallToolResult(
         content=[types.TextContent(type="text", text=body)],
     )
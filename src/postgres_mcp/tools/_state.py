@@ -20,14 +20,32 @@ db_connection = DbConnPool()
 current_access_mode = AccessMode.UNRESTRICTED
 shutdown_in_progress = False
 
+# Drivers are stateless apart from the shared pool, so one per access mode is
+# reused across tool calls instead of constructing a fresh driver per request.
+# Each entry remembers the pool it was built from so the memo drops itself if
+# db_connection is swapped (e.g. in tests).
+_drivers: dict[AccessMode, tuple[DbConnPool, Union[SqlDriver, SafeSqlDriver]]] = {}
+
+
+def reset_sql_drivers() -> None:
+    """Drop memoized drivers. Called on shutdown and pool reconnect."""
+    _drivers.clear()
+
 
 async def get_sql_driver() -> Union[SqlDriver, SafeSqlDriver]:
     """Get the appropriate SQL driver based on the current access mode."""
+    cached = _drivers.get(current_access_mode)
+    if cached is not None and cached[0] is db_connection:
+        return cached[1]
+
     base_driver = SqlDriver(conn=db_connection)
 
     if current_access_mode == AccessMode.RESTRICTED:
         logger.debug("Using SafeSqlDriver with restrictions (RESTRICTED mode)")
-        return SafeSqlDriver(sql_driver=base_driver, timeout=30)
+        driver: Union[SqlDriver, SafeSqlDriver] = SafeSqlDriver(sql_driver=base_driver, timeout=30)
     else:
         logger.debug("Using unrestricted SqlDriver (UNRESTRICTED mode)")
-        return base_driver
+        driver = base_driver
+
+    _drivers[current_access_mode] = (db_connection, driver)
+    return driver
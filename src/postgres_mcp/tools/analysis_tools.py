@@ -1,28 +1,38 @@
 # ruff: noqa: B008
 import logging
+from typing import TYPE_CHECKING
 from typing import Literal
 
 from mcp.types import CallToolResult
 from pydantic import Field
 
-from postgres_mcp.database_health import DatabaseHealthTool
 from postgres_mcp.database_health import HealthType
-from postgres_mcp.index.dta_calc import DatabaseTuningAdvisor
-from postgres_mcp.index.index_opt_base import MAX_NUM_INDEX_TUNING_QUERIES
-from postgres_mcp.index.llm_opt import LLMOptimizerTool
-from postgres_mcp.index.presentation import TextPresentation
 from postgres_mcp.sql import SqlDriver
-from postgres_mcp.top_queries import TopQueriesCalc
 
 from ._response import format_error_response
 from ._response import format_text_response
 from ._state import get_sql_driver
 
+if TYPE_CHECKING:
+    from postgres_mcp.index.presentation import TextPresentation
+
 logger = logging.getLogger(__name__)
 
+_HEALTH_TYPES = tuple(sorted(t.value for t in HealthType))
+_HEALTH_TYPES_CSV = ", ".join(_HEALTH_TYPES)
+
+
+def _create_index_tool(sql_driver: SqlDriver, method: str) -> "TextPresentation":
+    """Create the appropriate index analysis tool based on the method.
+
+    The index tuning modules pull in heavyweight SQL parsing machinery, so
+    they are imported lazily to keep server cold-start fast for callers that
+    never run index analysis.
+    """
+    from postgres_mcp.index.dta_calc import DatabaseTuningAdvisor
+    from postgres_mcp.index.llm_opt import LLMOptimizerTool
+    from postgres_mcp.index.presentation import TextPresentation
 
-def _create_index_tool(sql_driver: SqlDriver, method: str) -> TextPresentation:
-    """Create the appropriate index analysis tool based on the method."""
     if method == "dta":
         optimizer = DatabaseTuningAdvisor(sql_driver)
     else:
@@ -51,6 +61,8 @@ async def postgres_analyze_query_indexes(
     method: Literal["dta", "llm"] = Field(description="Method to use for analysis", default="dta"),
 ) -> CallToolResult:
     """Analyze a list of SQL queries and recommend optimal indexes."""
+    from postgres_mcp.index.index_opt_base import MAX_NUM_INDEX_TUNING_QUERIES
+
     if len(queries) == 0:
         return format_error_response("Please provide a non-empty list of queries to analyze.")
     if len(queries) > MAX_NUM_INDEX_TUNING_QUERIES:
@@ -68,11 +80,13 @@ async def postgres_analyze_query_indexes(
 
 async def postgres_analyze_db_health(
     health_type: str = Field(
-        description=f"Optional. Valid values are: {', '.join(sorted([t.value for t in HealthType]))}.",
+        description=f"Optional. Valid values are: {_HEALTH_TYPES_CSV}.",
         default="all",
     ),
 ) -> CallToolResult:
     """Analyze database health for specified components."""
+    from postgres_mcp.database_health import DatabaseHealthTool
+
     health_tool = DatabaseHealthTool(await get_sql_driver())
     result = await health_tool.health(health_type=health_type)
     return format_text_response(result)
@@ -87,6 +101,8 @@ async def postgres_get_top_queries(
     limit: int = Field(description="Number of queries to return when ranking based on mean_time or total_time", default=10),
 ) -> CallToolResult:
     """Reports the slowest or most resource-intensive queries using pg_stat_statements."""
+    from postgres_mcp.top_queries import TopQueriesCalc
+
     try:
         sql_driver = await get_sql_driver()
         top_queries_tool = TopQueriesCalc(sql_driver=sql_driver)
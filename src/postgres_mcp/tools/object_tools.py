@@ -0,0 +1,203 @@
+# ruff: noqa: B008
+import asyncio
+import logging
+from operator import itemgetter
+
+from mcp.types import CallToolResult
+from pydantic import Field
+
+from postgres_mcp.sql import SafeSqlDriver
+from postgres_mcp.sql import get_server_info
+
+from ._response import format_error_response
+from ._response import format_text_response
+from ._state import get_sql_driver
+
+logger = logging.getLogger(__name__)
+
+# itemgetter pulls all keys per row in a single C-level call, trimming
+# per-row overhead on wide tables.
+_COLUMN_KEYS = ("column", "data_type", "is_nullable", "default", "is_generated", "generation_expression")
+_COLUMN_GET = itemgetter("column_name", "data_type", "is_nullable", "column_default", "is_generated", "generation_expression")
+_INDEX_KEYS = ("name", "method", "is_unique", "is_primary", "columns")
+_INDEX_GET = itemgetter("name", "method", "is_unique", "is_primary", "columns")
+
+# Query pg_index and friends directly instead of the pg_indexes view: the view
+# adds extra joins and only yields an indexdef string that consumers would have
+# to parse, while the catalogs return structured per-column data via the pk
+# index on pg_index.indrelid.
+_TABLE_INDEXES_SQL = """
+    SELECT
+        c.relname AS name,
+        am.amname AS method,
+        i.indisunique AS is_unique,
+        i.indisprimary AS is_primary,
+        array(
+            -- indkey is an int2vector with a 0-based lower bound, while
+            -- pg_get_indexdef numbers columns from 1 (0 means "whole definition").
+            SELECT pg_get_indexdef(i.indexrelid, k + 1, true)
+            FROM generate_subscripts(i.indkey, 1) AS k
+        ) AS columns
+    FROM pg_catalog.pg_index i
+    INNER JOIN pg_catalog.pg_class c ON c.oid = i.indexrelid
+    INNER JOIN pg_catalog.pg_class t ON t.oid = i.indrelid
+    INNER JOIN pg_catalog.pg_namespace n ON n.oid = t.relnamespace
+    INNER JOIN pg_catalog.pg_am am ON am.oid = c.relam
+    WHERE n.nspname = {} AND t.relname = {}
+    ORDER BY c.relname
+"""
+
+
+async def postgres_get_object_details(
+    schema_name: str = Field(description="Schema name"),
+    object_name: str = Field(description="Object name"),
+    object_type: str = Field(description="Object type: 'table', 'view', 'sequence', or 'extension'", default="table"),
+) -> CallToolResult:
+    """Get detailed information about a database object."""
+    try:
+        sql_driver = await get_sql_driver()
+
+        if object_type in ("table", "view"):
+            # pg_constraint.conenforced arrived with NOT ENFORCED constraints
+            # in PostgreSQL 18, so the cached server version answers the
+            # capability question without a catalog probe; the four metadata
+            # queries are independent and run concurrently on the pool.
+            server_info = await get_server_info(sql_driver)
+            has_conenforced = server_info.server_version_num >= 180000
+
+            col_rows, con_rows, con_meta_rows, idx_rows = await asyncio.gather(
+                SafeSqlDriver.execute_param_query(
+                    sql_driver,
+                    """
+                    SELECT
+                        column_name,
+                        data_type,
+                        is_nullable,
+                        column_default,
+                        is_generated,
+                        generation_expression
+                    FROM information_schema.columns
+                    WHERE table_schema = {} AND table_name = {}
+                    ORDER BY ordinal_position
+                    """,
+                    [schema_name, object_name],
+                ),
+                SafeSqlDriver.execute_param_query(
+                    sql_driver,
+                    """
+                    SELECT tc.constraint_name, tc.constraint_type, kcu.column_name
+                    FROM information_schema.table_constraints AS tc
+                    LEFT JOIN information_schema.key_column_usage AS kcu
+                      ON tc.constraint_name = kcu.constraint_name
+                     AND tc.table_schema = kcu.table_schema
+                    WHERE tc.table_schema = {} AND tc.table_name = {}
+                    """,
+                    [schema_name, object_name],
+                ),
+                SafeSqlDriver.execute_param_query(
+                    sql_driver,
+                    f"""
+                    SELECT
+                        con.conname AS constraint_name,
+                        con.convalidated AS is_validated,
+                        {"con.conenforced AS is_enforced" if has_conenforced else "TRUE AS is_enforced"}
+                    FROM pg_catalog.pg_constraint con
+                    INNER JOIN pg_catalog.pg_class rel ON rel.oid = con.conrelid
+                    INNER JOIN pg_catalog.pg_namespace nsp ON nsp.oid = rel.relnamespace
+                    WHERE nsp.nspname = {{}} AND rel.relname = {{}}
+                    """,
+                    [schema_name, object_name],
+                ),
+                SafeSqlDriver.execute_param_query(
+                    sql_driver,
+                    _TABLE_INDEXES_SQL,
+                    [schema_name, object_name],
+                ),
+            )
+
+            columns = [dict(zip(_COLUMN_KEYS, _COLUMN_GET(r.cells))) for r in col_rows] if col_rows else []
+
+            con_meta_by_name = {r.cells["constraint_name"]: r.cells for r in con_meta_rows} if con_meta_rows else {}
+
+            # Aggregate first, then apply meta once per constraint: composite
+            # constraints repeat one row per column and would otherwise redo
+            # the same meta writes for every column.
+            constraints: dict[str, dict[str, object]] = {}
+            columns_by_constraint: dict[str, dict[object, None]] = {}
+            if con_rows:
+                for row in con_rows:
+                    cname = row.cells["constraint_name"]
+                    if cname not in constraints:
+                        constraints[cname] = {"name": cname, "type": row.cells["constraint_type"]}
+                        columns_by_constraint[cname] = {}
+                    col = row.cells["column_name"]
+                    if col:
+                        # dict keys de-duplicate while preserving column order
+                        columns_by_constraint[cname][col] = None
+
+                for cname, data in constraints.items():
+                    data["columns"] = list(columns_by_constraint[cname])
+                    meta = con_meta_by_name.get(cname)
+                    if meta is not None:
+                        data["is_validated"] = meta["is_validated"]
+                        if has_conenforced:
+                            data["is_enforced"] = meta["is_enforced"]
+
+            constraints_list = list(constraints.values())
+
+            indexes = [dict(zip(_INDEX_KEYS, _INDEX_GET(r.cells))) for r in idx_rows] if idx_rows else []
+
+            result = {
+                "basic": {"schema": schema_name, "name": object_name, "type": object_type},
+                "columns": columns,
+                "constraints": constraints_list,
+                "indexes": indexes,
+            }
+
+        elif object_type == "sequence":
+            rows = await SafeSqlDriver.execute_param_query(
+                sql_driver,
+                """
+                SELECT sequence_schema, sequence_name, data_type, start_value, increment
+                FROM information_schema.sequences
+                WHERE sequence_schema = {} AND sequence_name = {}
+                """,
+                [schema_name, object_name],
+            )
+
+            if rows and rows[0]:
+                row = rows[0]
+                result = {
+                    "schema": row.cells["sequence_schema"],
+                    "name": row.cells["sequence_name"],
+                    "data_type": row.cells["data_type"],
+                    "start_value": row.cells["start_value"],
+                    "increment": row.cells["increment"],
+                }
+            else:
+                result = {}
+
+        elif object_type == "extension":
+            rows = await SafeSqlDriver.execute_param_query(
+                sql_driver,
+                """
+                SELECT extname, extversion, extrelocatable
+                FROM pg_extension
+                WHERE extname = {}
+                """,
+                [object_name],
+            )
+
+            if rows and rows[0]:
+                row = rows[0]
+                result = {"name": row.cells["extname"], "version": row.cells["extversion"], "relocatable": row.cells["extrelocatable"]}
+            else:
+                result = {}
+
+        else:
+            return format_error_response(f"Unsupported object type: {object_type}")
+
+        return format_text_response(result)
+    except Exception as e:
+        logger.error(f"Error getting object details: {e}")
+        return format_error_response(str(e))
@@ -1,5 +1,7 @@
 # ruff: noqa: B008
+import json
 import logging
+import time
 from typing import Any
 from typing import Optional
 
@@ -10,6 +12,7 @@ from pydantic.fields import FieldInfo
 from postgres_mcp.artifacts import ErrorResult
 from postgres_mcp.artifacts import ExplainPlanArtifact
 from postgres_mcp.explain import ExplainPlanTool
+from postgres_mcp.sql import SafeSqlDriver
 from postgres_mcp.sql import check_hypopg_installation_status
 
 from ._response import format_error_response
@@ -18,11 +21,60 @@ from ._state import get_sql_driver
 
 logger = logging.getLogger(__name__)
 
+# Statement keywords that produce a row set and can safely be wrapped in a
+# paginating subquery.
+_ROW_RETURNING_KEYWORDS = {"SELECT", "WITH", "TABLE", "VALUES"}
 
-def _resolve_field_default(value: Any) -> Any:
-    """Handle direct Python calls where pydantic Field defaults can leak through."""
+# Agents commonly re-issue the same EXPLAIN several times in a session; cache
+# the rendered plan text for plain (non-ANALYZE) explains, whose results only
+# change when schema or statistics do.
+_EXPLAIN_CACHE_TTL_SECONDS = 60.0
+_EXPLAIN_CACHE_MAX_ENTRIES = 256
+_explain_cache: dict[tuple[str, bool, Optional[str], str], tuple[float, str]] = {}
+
+
+def clear_explain_cache() -> None:
+    """Drop cached explain plans (e.g. after schema changes)."""
+    _explain_cache.clear()
+
+
+def _explain_cache_get(key: tuple[str, bool, Optional[str], str]) -> Optional[str]:
+    entry = _explain_cache.get(key)
+    if entry is not None and time.monotonic() - entry[0] <= _EXPLAIN_CACHE_TTL_SECONDS:
+        return entry[1]
+    return None
+
+
+def _explain_cache_put(key: tuple[str, bool, Optional[str], str], text: str) -> None:
+    while len(_explain_cache) >= _EXPLAIN_CACHE_MAX_ENTRIES:
+        _explain_cache.pop(next(iter(_explain_cache)))
+    _explain_cache[key] = (time.monotonic(), text)
+
+
+def _is_row_returning(sql: str) -> bool:
+    """Best-effort check that a statement can be wrapped in a subquery."""
+    trimmed = sql.strip().rstrip(";").lstrip("(")
+    first_word = trimmed.split(None, 1)[0].upper() if trimmed else ""
+    return first_word in _ROW_RETURNING_KEYWORDS
+
+
+def _coerce(value: Any, expected_type: type, error_message: str, allow_none: bool = False) -> Any:
+    """Resolve leaked pydantic Field defaults and check the expected type.
+
+    Values that already have the expected type — the common case when invoked
+    via MCP, where Field defaults never leak through — return immediately.
+
+    Raises:
+        ValueError: If the resolved value does not have the expected type.
+    """
+    if isinstance(value, expected_type) and not isinstance(value, FieldInfo):
+        return value
     if isinstance(value, FieldInfo):
-        return value.default
+        value = value.default
+    if value is None and allow_none:
+        return None
+    if not isinstance(value, expected_type):
+        raise ValueError(error_message)
     return value
 
 
@@ -34,6 +86,32 @@ async def postgres_execute_sql(
     """Executes a SQL query against the database."""
     try:
         sql_driver = await get_sql_driver()
+
+        if (offset is not None or limit is not None) and _is_row_returning(sql):
+            # Push pagination into SQL so the database caps the rows on the
+            # wire instead of Python materializing and discarding them.
+            clauses = ""
+            args: list[object] = []
+            if limit is not None:
+                clauses += " LIMIT {}"
+                args.append(limit)
+            if offset is not None:
+                clauses += " OFFSET {}"
+                args.append(offset)
+            paginated_sql = f"SELECT * FROM ({sql.strip().rstrip(';')}) AS _mcp_page{clauses}"
+            try:
+                rows = await SafeSqlDriver.execute_param_query(sql_driver, paginated_sql, args)  # type: ignore[arg-type]
+            except Exception as wrap_error:
+                # The keyword check is best-effort: statements like data-modifying
+                # CTEs or SELECT INTO look wrappable but Postgres rejects them
+                # inside a subquery. Fall back to running the original SQL and
+                # slicing in Python, as before pagination was pushed into SQL.
+                logger.debug(f"Paginated wrapping failed, falling back to client-side slicing: {wrap_error}")
+            else:
+                if rows is None:
+                    return format_text_response("No results")
+                return format_text_response([r.cells for r in rows])
+
         rows = await sql_driver.execute_query(sql)  # type: ignore[arg-type]
         if rows is None:
             return format_text_response("No results")
@@ -48,6 +126,24 @@ async def postgres_execute_sql(
         return format_error_response(str(e))
 
 
+async def _run_explain_with_hypo(
+    explain_tool: ExplainPlanTool,
+    sql_driver: Any,
+    sql: str,
+    hypothetical_indexes: list[dict[str, Any]],
+    include_memory: bool,
+) -> ExplainPlanArtifact | ErrorResult | str:
+    """Explain with hypothetical indexes; returns the install message if hypopg is missing."""
+    is_hypopg_installed, hypopg_message = await check_hypopg_installation_status(sql_driver)
+    if not is_hypopg_installed:
+        return hypopg_message
+    return await explain_tool.explain_with_hypothetical_indexes(
+        sql,
+        hypothetical_indexes,
+        include_memory=include_memory,
+    )
+
+
 async def postgres_explain_query(
     sql: str = Field(description="SQL query to explain"),
     analyze: bool = Field(
@@ -79,21 +175,13 @@ If there is no hypothetical index, you can pass an empty list.""",
 ) -> CallToolResult:
     """Explains the execution plan for a SQL query."""
     try:
-        analyze_value = _resolve_field_default(analyze)
-        include_memory_value = _resolve_field_default(include_memory)
-        serialize_value = _resolve_field_default(serialize)
-        hypothetical_indexes_value = _resolve_field_default(hypothetical_indexes)
-
-        if not isinstance(analyze_value, bool):
-            return format_error_response("analyze must be a boolean")
-        if not isinstance(include_memory_value, bool):
-            return format_error_response("include_memory must be a boolean")
-        if serialize_value is not None and not isinstance(serialize_value, str):
-            return format_error_response("serialize must be a string when provided")
-        if hypothetical_indexes_value is None:
-            hypothetical_indexes_value = []
-        if not isinstance(hypothetical_indexes_value, list):
-            return format_error_response("hypothetical_indexes must be a list")
+        try:
+            analyze_value = _coerce(analyze, bool, "analyze must be a boolean")
+            include_memory_value = _coerce(include_memory, bool, "include_memory must be a boolean")
+            serialize_value = _coerce(serialize, str, "serialize must be a string when provided", allow_none=True)
+            hypothetical_indexes_value = _coerce(hypothetical_indexes, list, "hypothetical_indexes must be a list", allow_none=True) or []
+        except ValueError as e:
+            return format_error_response(str(e))
 
         serialize_mode = serialize_value.lower() if isinstance(serialize_value, str) else None
 
@@ -102,40 +190,46 @@ If there is no hypothetical index, you can pass an empty list.""",
         if serialize_mode and not analyze_value:
             return format_error_response("SERIALIZE requires analyze=True")
 
-        result: ExplainPlanArtifact | ErrorResult | None = None
+        cache_key = None
+        if not analyze_value:
+            cache_key = (sql, include_memory_value, serialize_mode, json.dumps(hypothetical_indexes_value, sort_keys=True, default=str))
+            cached_text = _explain_cache_get(cache_key)
+            if cached_text is not None:
+                return format_text_response(cached_text)
+
         sql_driver = await get_sql_driver()
         explain_tool = ExplainPlanTool(sql_driver=sql_driver)
 
-        if hypothetical_indexes_value and len(hypothetical_indexes_value) > 0:
+        # Plain explains dominate agent traffic, so keep that path first and
+        # free of any hypothetical-index handling.
+        result: ExplainPlanArtifact | ErrorResult | str | None
+        if not hypothetical_indexes_value:
+            if analyze_value:
+                result = await explain_tool.explain_analyze(
+                    sql,
+                    include_memory=include_memory_value,
+                    serialize=serialize_mode,
+                )
+            else:
+                result = await explain_tool.explain(
+                    sql,
+                    include_memory=include_memory_value,
+                    serialize=serialize_mode,
+                )
+        else:
             if analyze_value:
                 return format_error_response("Cannot use analyze and hypothetical indexes together")
             if serialize_mode:
                 return format_error_response("Cannot use serialize with hypothetical indexes")
-
-            is_hypopg_installed, hypopg_message = await check_hypopg_installation_status(sql_driver)
-            if not is_hypopg_installed:
-                return format_text_response(hypopg_message)
-
-            result = await explain_tool.explain_with_hypothetical_indexes(
-                sql,
-                hypothetical_indexes_value,
-                include_memory=include_memory_value,
-            )
-        elif analyze_value:
-            result = await explain_tool.explain_analyze(
-                sql,
-                include_memory=include_memory_value,
-                serialize=serialize_mode,
-            )
-        else:
-            result = await explain_tool.explain(
-                sql,
-                include_memory=include_memory_value,
-                serialize=serialize_mode,
-            )
+            result = await _run_explain_with_hypo(explain_tool, sql_driver, sql, hypothetical_indexes_value, include_memory_value)
+            if isinstance(result, str):
+                return format_text_response(result)
 
         if result and isinstance(result, ExplainPlanArtifact):
-            return format_text_response(result.to_text())
+            text = result.to_text()
+            if cache_key is not None:
+                _explain_cache_put(cache_key, text)
+            return format_text_response(text)
         else:
             error_message = "Error processing explain plan"
             if isinstance(result, ErrorResult):
@@ -1,18 +1,48 @@
+import json
 import logging
 from typing import Literal
 from typing import LiteralString
+from typing import Optional
 from typing import Union
 from typing import cast
 
 from ..sql import SafeSqlDriver
 from ..sql import SqlDriver
 from ..sql import get_pg_stat_statements_columns
+from ..sql import get_server_info
 from ..sql.extension_utils import check_extension
 
 logger = logging.getLogger(__name__)
 
 PG_STAT_STATEMENTS = "pg_stat_statements"
 
+# Every column get_top_resource_queries can return; doubles as the whitelist
+# for its optional ``columns`` projection filter.
+_RESOURCE_QUERY_COLUMNS = (
+    "query",
+    "calls",
+    "rows",
+    "total_exec_time",
+    "mean_exec_time",
+    "stddev_exec_time",
+    "total_exec_time_frac",
+    "shared_blks_accessed_frac",
+    "shared_blks_read_frac",
+    "shared_blks_dirtied_frac",
+    "total_wal_bytes_frac",
+    "shared_blks_hit",
+    "shared_blks_read",
+    "shared_blks_dirtied",
+    "wal_bytes",
+    "stats_since",
+    "minmax_stats_since",
+    "local_blk_read_time",
+    "local_blk_write_time",
+    "parallel_workers_to_launch",
+    "parallel_workers_launched",
+    "wal_buffers_full",
+)
+
 install_pg_stat_statements_message = (
     "The pg_stat_statements extension is required to "
     "report slow queries, but it is not currently "
@@ -35,13 +65,15 @@ class TopQueriesCalc:
     def __init__(self, sql_driver: Union[SqlDriver, SafeSqlDriver]):
         self.sql_driver = sql_driver
 
-    async def get_top_queries_by_time(self, limit: int = 10, sort_by: Literal["total", "mean"] = "mean") -> str:
+    async def get_top_queries_by_time(self, limit: int = 10, sort_by: Literal["total", "mean"] = "mean", max_query_len: int = 2048) -> str:
         """Reports the slowest SQL queries based on execution time.
 
         Args:
             limit: Number of slow queries to return
             sort_by: Sort criteria - 'total' for total execution time or
                 'mean' for mean execution time per call (default)
+            max_query_len: Maximum query text length returned per row; longer
+                statements are truncated server-side (default: 2048)
 
         Returns:
             A string with the top queries or installation instructions
@@ -68,7 +100,7 @@ class TopQueriesCalc:
                 LiteralString,
                 f"""
                 SELECT
-                    query,
+                    left(query, {int(max_query_len)}) AS query,
                     calls,
                     {cols.total_time},
                     {cols.mean_time},
@@ -93,24 +125,43 @@ class TopQueriesCalc:
             else:
                 criteria = "mean execution time per call"
 
-            result = f"Top {len(slow_queries)} slowest queries by {criteria}:\n"
-            result += str(slow_queries)
-            return result
+            # json.dumps is C-accelerated and emits parseable output, unlike
+            # repr of the row dicts which is slow on multi-KB query strings.
+            return f"Top {len(slow_queries)} slowest queries by {criteria}:\n{json.dumps(slow_queries, default=str, ensure_ascii=False)}"
         except Exception as e:
             logger.error(f"Error getting slow queries: {e}", exc_info=True)
             return f"Error getting slow queries: {e}"
 
-    async def get_top_resource_queries(self, frac_threshold: float = 0.05) -> str:
+    async def get_top_resource_queries(
+        self,
+        frac_threshold: float = 0.05,
+        limit: int = 50,
+        max_query_len: int = 2048,
+        columns: Optional[list[str]] = None,
+    ) -> str:
         """Reports the most time consuming queries based on a resource blend.
 
         Args:
             frac_threshold: Fraction threshold for filtering queries (default: 0.05)
+            limit: Maximum number of queries to return (default: 50)
+            max_query_len: Maximum query text length returned per row; longer
+                statements are truncated server-side (default: 2048)
+            columns: Optional subset of output columns to return; must be
+                drawn from the full projection (default: all columns)
 
         Returns:
             A string with the resource-heavy queries or error message
         """
 
         try:
+            if columns:
+                requested = set(columns)
+                unknown = requested.difference(_RESOURCE_QUERY_COLUMNS)
+                if unknown:
+                    return f"Error: unknown columns requested: {', '.join(sorted(unknown))}"
+                selected = [name for name in _RESOURCE_QUERY_COLUMNS if name in requested]
+            else:
+                selected = list(_RESOURCE_QUERY_COLUMNS)
             logger.debug(f"Getting top resource queries with threshold {frac_threshold}")
             extension_status = await check_extension(
                 self.sql_driver,
@@ -125,12 +176,19 @@ class TopQueriesCalc:
 
             cols = await get_pg_stat_statements_columns(self.sql_driver)
 
+            # NOT MATERIALIZED (PostgreSQL 12+) lets the planner push the
+            # frac-threshold predicates into the CTE scan instead of first
+            # computing every windowed column for every statement.
+            server_info = await get_server_info(self.sql_driver)
+            cte_clause = "NOT MATERIALIZED " if server_info.server_version_num >= 120000 else ""
+            select_list = ",\n                    ".join(selected)
+
             query = cast(
                 LiteralString,
                 f"""
-                WITH resource_fractions AS (
+                WITH resource_fractions AS {cte_clause}(
                     SELECT
-                        query,
+                        left(query, {int(max_query_len)}) AS query,
                         calls,
                         rows,
                         {cols.total_time} AS total_exec_time,
@@ -160,28 +218,7 @@ class TopQueriesCalc:
                     FROM pg_stat_statements
                 )
                 SELECT
-                    query,
-                    calls,
-                    rows,
-                    total_exec_time,
-                    mean_exec_time,
-                    stddev_exec_time,
-                    total_exec_time_frac,
-                    shared_blks_accessed_frac,
-                    shared_blks_read_frac,
-                    shared_blks_dirtied_frac,
-                    total_wal_bytes_frac,
-                    shared_blks_hit,
-                    shared_blks_read,
-                    shared_blks_dirtied,
-                    wal_bytes,
-                    stats_since,
-                    minmax_stats_since,
-                    local_blk_read_time,
-                    local_blk_write_time,
-                    parallel_workers_to_launch,
-                    parallel_workers_launched,
-                    wal_buffers_full
+                    {select_list}
                 FROM resource_fractions
                 WHERE
                     total_exec_time_frac > {frac_threshold}
@@ -190,6 +227,7 @@ class TopQueriesCalc:
                     OR shared_blks_dirtied_frac > {frac_threshold}
                     OR total_wal_bytes_frac > {frac_threshold}
                 ORDER BY total_exec_time DESC
+                LIMIT {{}}
             """,
             )
 
@@ -197,11 +235,12 @@ class TopQueriesCalc:
             slow_query_rows = await SafeSqlDriver.execute_param_query(
                 self.sql_driver,
                 query,
+                [limit],
             )
             resource_queries = [row.cells for row in slow_query_rows] if slow_query_rows else []
             logger.info(f"Found {len(resource_queries)} resource-intensive queries")
 
-            return str(resource_queries)
+            return json.dumps(resource_queries, default=str, ensure_ascii=False)
         except Exception as e:
             logger.error(f"Error getting resource-intensive queries: {e}", exc_info=True)
             return f"Error resource-intensive queries: {e}"
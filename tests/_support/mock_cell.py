@@ -0,0 +1,14 @@
+"""Shared row stub for tests that fake SqlDriver results."""
+
+
+class MockCell:
+    """Mimics SqlDriver.RowResult: a row exposing its data as ``cells``.
+
+    ``__slots__`` keeps the per-instance footprint small for tests that
+    build large fake result sets.
+    """
+
+    __slots__ = ("cells",)
+
+    def __init__(self, data):
+        self.cells = data
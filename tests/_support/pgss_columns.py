@@ -0,0 +1,37 @@
+"""Canonical PgStatStatementsColumns literals shared across test files.
+
+Built once at import so version-matrix tests reference the same value
+objects instead of duplicating the literal blocks per file.
+"""
+
+from postgres_mcp.sql import PgStatStatementsColumns
+
+PG12_COLS = PgStatStatementsColumns(
+    total_time="total_time",
+    mean_time="mean_time",
+    stddev_time="stddev_time",
+    wal_bytes_select="0::numeric AS wal_bytes",
+    wal_bytes_frac="0::double precision AS total_wal_bytes_frac",
+    stats_since_select="NULL::timestamptz AS stats_since",
+    minmax_stats_since_select="NULL::timestamptz AS minmax_stats_since",
+    local_blk_read_time_select="NULL::double precision AS local_blk_read_time",
+    local_blk_write_time_select="NULL::double precision AS local_blk_write_time",
+    parallel_workers_to_launch_select="NULL::bigint AS parallel_workers_to_launch",
+    parallel_workers_launched_select="NULL::bigint AS parallel_workers_launched",
+    wal_buffers_full_select="NULL::bigint AS wal_buffers_full",
+)
+
+PG13_COLS = PgStatStatementsColumns(
+    total_time="total_exec_time",
+    mean_time="mean_exec_time",
+    stddev_time="stddev_exec_time",
+    wal_bytes_select="wal_bytes AS wal_bytes",
+    wal_bytes_frac="wal_bytes / NULLIF(SUM(wal_bytes) OVER (), 0) AS total_wal_bytes_frac",
+    stats_since_select="NULL::timestamptz AS stats_since",
+    minmax_stats_since_select="NULL::timestamptz AS minmax_stats_since",
+    local_blk_read_time_select="NULL::double precision AS local_blk_read_time",
+    local_blk_write_time_select="NULL::double precision AS local_blk_write_time",
+    parallel_workers_to_launch_select="NULL::bigint AS parallel_workers_to_launch",
+    parallel_workers_launched_select="NULL::bigint AS parallel_workers_launched",
+    wal_buffers_full_select="NULL::bigint AS wal_buffers_full",
+)
@@ -0,0 +1,23 @@
+"""Lightweight SqlDriver stand-in for tests that only exercise execute_query.
+
+MagicMock(spec=SqlDriver) enumerates the whole class per construction; this
+stub skips that walk while still satisfying SqlDriver type expectations.
+"""
+
+from typing import Any
+
+from postgres_mcp.sql import SqlDriver
+
+
+class StubDriver(SqlDriver):
+    """SqlDriver subclass whose execute_query is supplied by the test.
+
+    Deliberately skips SqlDriver.__init__: no connection is involved. The
+    supplied callable (usually an AsyncMock, so call_args stays inspectable)
+    is exposed directly as ``execute_query``.
+    """
+
+    execute_query: Any
+
+    def __init__(self, execute_query: Any):
+        self.execute_query = execute_query
@@ -1,4 +1,3 @@
-import asyncio
 import os
 from typing import Generator
 
@@ -16,20 +15,43 @@ TEST_POSTGRES_IMAGE = os.getenv("POSTGRES_TEST_IMAGE")
 TEST_POSTGRES_IMAGES = [TEST_POSTGRES_IMAGE] if TEST_POSTGRES_IMAGE else DEFAULT_TEST_POSTGRES_IMAGES
 
 
-# Define a custom event loop policy that handles cleanup better
-@pytest.fixture(scope="session")
-def event_loop_policy():
-    """Create and return a custom event loop policy for tests."""
-    return asyncio.DefaultEventLoopPolicy()
-
-
-@pytest.fixture(scope="class", params=TEST_POSTGRES_IMAGES)
+@pytest.fixture(scope="session", params=TEST_POSTGRES_IMAGES)
 def test_postgres_connection_string(request) -> Generator[tuple[str, str], None, None]:
+    """One PostgreSQL container per image for the whole session.
+
+    Tests that touch the database each DROP and recreate their own tables in
+    their setup fixtures, so sharing a container across test classes does not
+    leak state between tests.
+    """
     yield from create_postgres_container(request.param)
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture
 def reset_pg_version_cache():
     """Reset the PostgreSQL version cache before each test."""
     reset_postgres_version_cache()
     yield
+
+
+def pytest_collection_modifyitems(items):
+    """Attach the version-cache reset only to tests that hit a real database.
+
+    Pure unit tests use per-instance mock drivers whose cache keys never
+    collide, so running the reset autouse just added overhead to every test.
+    Tests sharing the session-scoped container can leave stale entries behind
+    and still get a fresh cache.
+    """
+    for item in items:
+        fixturenames = getattr(item, "fixturenames", None)
+        if fixturenames is None:
+            continue
+        if "test_postgres_connection_string" in fixturenames and "reset_pg_version_cache" not in fixturenames:
+            fixturenames.append("reset_pg_version_cache")
+        # Group database tests by Postgres image so `pytest -n auto --dist
+        # loadgroup` runs each image's tests (and its session container) on a
+        # single xdist worker while different images run in parallel.
+        callspec = getattr(item, "callspec", None)
+        if callspec is not None:
+            image = callspec.params.get("test_postgres_connection_string")
+            if image is not None:
+                item.add_marker(pytest.mark.xdist_group(name=image))
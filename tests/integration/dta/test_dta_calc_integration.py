@@ -165,7 +165,6 @@ async def create_dta(db_connection):
     return dta
 
 
-@pytest.mark.asyncio
 @retry(max_attempts=3, delay=2)  # Add retry decorator for flaky test
 async def test_join_order_benchmark(db_connection, setup_test_tables, create_dta):
     """Test DTA performance on JOIN ORDER BENCHMARK (JOB) style queries."""
@@ -547,7 +546,6 @@ async def test_join_order_benchmark(db_connection, setup_test_tables, create_dta
             logger.warning(f"Error during cleanup: {e}")
 
 
-@pytest.mark.asyncio
 @pytest.mark.skip(reason="Skipping multi-column indexes test for now")
 async def test_multi_column_indexes(db_connection, setup_test_tables, create_dta):
     """Test that DTA can recommend multi-column indexes when appropriate."""
@@ -880,7 +878,6 @@ async def test_multi_column_indexes(db_connection, setup_test_tables, create_dta
         logger.warning("Could not measure performance improvements for multi-column indexes")
 
 
-@pytest.mark.asyncio
 @retry(max_attempts=3, delay=2)  # Add retry decorator for flaky test
 async def test_diminishing_returns(db_connection, create_dta):
     """Test that the DTA correctly implements the diminishing returns behavior."""
@@ -1075,7 +1072,6 @@ async def test_diminishing_returns(db_connection, create_dta):
             logger.warning(f"Error during cleanup: {e}")
 
 
-@pytest.mark.asyncio
 @retry(max_attempts=3, delay=2)  # Add retry decorator for flaky test
 async def test_pareto_optimization_basic(db_connection, create_dta):
     """Basic test for Pareto optimal index selection with diminishing returns."""
@@ -1167,7 +1163,6 @@ async def test_pareto_optimization_basic(db_connection, create_dta):
             logger.warning(f"Error during cleanup: {e}")
 
 
-@pytest.mark.asyncio
 @pytest.mark.skip(reason="Skipping storage cost tradeoff test for now")
 async def test_storage_cost_tradeoff(db_connection, create_dta):
     """Test that the DTA correctly balances performance gains against storage costs."""
@@ -1305,7 +1300,6 @@ async def test_storage_cost_tradeoff(db_connection, create_dta):
     await db_connection.execute_query("DROP TABLE IF EXISTS wide_table", force_readonly=False)
 
 
-@pytest.mark.asyncio
 @pytest.mark.skip(reason="Skipping pareto optimal index selection test for now")
 async def test_pareto_optimal_index_selection(db_connection, create_dta):
     """Test that the DTA correctly implements Pareto optimal index selection."""
@@ -105,7 +105,6 @@ async def cleanup_test_data(sql_driver):
         logger.warning(f"Error cleaning up test data: {e}")
 
 
-@pytest.mark.asyncio
 async def test_get_top_queries_integration(local_sql_driver):
     """
     Integration test for get_top_queries with a real database.
@@ -147,7 +146,6 @@ async def test_get_top_queries_integration(local_sql_driver):
         await cleanup_test_data(local_sql_driver)
 
 
-@pytest.mark.asyncio
 async def test_extension_not_available(local_sql_driver):
     """Test behavior when pg_stat_statements extension is not available."""
     # Create the TopQueriesCalc instance
@@ -0,0 +1,84 @@
+"""Lightweight test doubles shared by the database_health unit tests.
+
+A plain class with a real ``async def`` costs a fraction of the
+MagicMock + AsyncMock machinery it replaces, which dominates runtime in
+these otherwise sub-millisecond tests.
+"""
+
+from postgres_mcp.sql import SqlDriver
+
+
+class FakeDriver(SqlDriver):
+    """Minimal SqlDriver stand-in that answers execute_query from a table.
+
+    ``responses`` maps a query substring to the rows returned for queries
+    containing it (first match wins); ``fallback`` is returned when nothing
+    matches, defaulting to None like a resultless statement.
+    """
+
+    def __init__(self, responses=None, fallback=None):
+        # Deliberately skip SqlDriver.__init__: no connection is involved.
+        self._responses = responses or {}
+        self._fallback = fallback
+        # Exact-match cache: the fragment scan below is O(fragments x query
+        # length), so resolve each distinct query text only once.
+        self._resolved = {}
+
+    async def execute_query(self, query, params=None, force_readonly=False):
+        try:
+            return self._resolved[query]
+        except KeyError:
+            pass
+        rows = self._fallback
+        for fragment, candidate in self._responses.items():
+            if fragment in query:
+                rows = candidate
+                break
+        self._resolved[query] = rows
+        return rows
+
+
+def returning(value):
+    """Build an async callable that always returns ``value``.
+
+    A plain coroutine function is far cheaper to construct than an
+    AsyncMock when the test never asserts on call arguments.
+    """
+
+    async def _call(*_args, **_kwargs):
+        return value
+
+    return _call
+
+
+async def always_has_column(*_args, **_kwargs):
+    """has_view_column stub reporting every column as present."""
+    return True
+
+
+async def never_has_column(*_args, **_kwargs):
+    """has_view_column stub reporting every column as missing."""
+    return False
+
+
+def column_present(schema, view_name, column_name):
+    """Build a has_view_column stub that is True for exactly one column."""
+
+    async def _check(_driver, schema_arg, view_arg, column_arg):
+        return (schema_arg, view_arg, column_arg) == (schema, view_name, column_name)
+
+    return _check
+
+
+def has_columns_from(available=None):
+    """Build a has_view_columns stub.
+
+    Reports every requested column as present when ``available`` is None,
+    otherwise only the requested names also listed in ``available``.
+    """
+
+    async def _check(_driver, _schema, _view_name, column_names):
+        names = set(column_names)
+        return names if available is None else names & set(available)
+
+    return _check
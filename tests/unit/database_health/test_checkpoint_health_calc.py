@@ -1,51 +1,26 @@
-from unittest.mock import AsyncMock
-from unittest.mock import MagicMock
-
-import pytest
+from _fakes import FakeDriver
+from _fakes import has_columns_from
+from _support.mock_cell import MockCell
 
+from postgres_mcp.database_health import checkpoint_health_calc
 from postgres_mcp.database_health.checkpoint_health_calc import CheckpointHealthCalc
 
 
-class MockCell:
-    def __init__(self, data):
-        self.cells = data
-
-
-@pytest.mark.asyncio
 async def test_checkpoint_health_unavailable_without_view(monkeypatch):
-    async def fake_has_view_column(_driver, _schema, _view_name, _column_name):
-        return False
+    monkeypatch.setattr(checkpoint_health_calc, "has_view_columns", has_columns_from(()))
 
-    monkeypatch.setattr(
-        "postgres_mcp.database_health.checkpoint_health_calc.has_view_column",
-        fake_has_view_column,
-    )
-
-    driver = MagicMock()
-    driver.execute_query = AsyncMock(return_value=None)
+    driver = FakeDriver()
     calc = CheckpointHealthCalc(driver)
 
     result = await calc.checkpoint_health_check()
     assert result == "Checkpoint statistics unavailable (requires PostgreSQL 17 or later)."
 
 
-@pytest.mark.asyncio
 async def test_checkpoint_health_includes_pg18_columns(monkeypatch):
-    async def fake_has_view_column(_driver, _schema, _view_name, column_name):
-        if column_name == "num_timed":
-            return True
-        if column_name in {"num_done", "slru_written"}:
-            return True
-        return False
-
-    monkeypatch.setattr(
-        "postgres_mcp.database_health.checkpoint_health_calc.has_view_column",
-        fake_has_view_column,
-    )
+    monkeypatch.setattr(checkpoint_health_calc, "has_view_columns", has_columns_from({"num_timed", "num_done", "slru_written"}))
 
-    driver = MagicMock()
-    driver.execute_query = AsyncMock(
-        return_value=[
+    driver = FakeDriver(
+        fallback=[
             MockCell(
                 {
                     "num_timed": 10,
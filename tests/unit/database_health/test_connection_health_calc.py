@@ -1,29 +1,18 @@
-from unittest.mock import AsyncMock
-from unittest.mock import MagicMock
-
-import pytest
+from _fakes import FakeDriver
+from _fakes import column_present
+from _fakes import never_has_column
+from _support.mock_cell import MockCell
 
+from postgres_mcp.database_health import connection_health_calc
 from postgres_mcp.database_health.connection_health_calc import ConnectionHealthCalc
 
 
-class MockCell:
-    def __init__(self, data):
-        self.cells = data
-
-
-@pytest.mark.asyncio
 async def test_connection_health_includes_wait_event_context(monkeypatch):
-    async def fake_has_view_column(_driver, schema, view_name, column_name):
-        return schema == "pg_catalog" and view_name == "pg_wait_events" and column_name == "name"
-
-    monkeypatch.setattr(
-        "postgres_mcp.database_health.connection_health_calc.has_view_column",
-        fake_has_view_column,
-    )
+    monkeypatch.setattr(connection_health_calc, "has_view_column", column_present("pg_catalog", "pg_wait_events", "name"))
 
-    async def side_effect(query):
-        if "LEFT JOIN pg_catalog.pg_wait_events" in query:
-            return [
+    driver = FakeDriver(
+        {
+            "LEFT JOIN pg_catalog.pg_wait_events": [
                 MockCell(
                     {
                         "wait_event_type": "Lock",
@@ -32,15 +21,10 @@ async def test_connection_health_includes_wait_event_context(monkeypatch):
                         "count": 120,
                     }
                 )
-            ]
-        if "WHERE state = 'idle in transaction'" in query and "COUNT(*)" in query:
-            return [MockCell({"count": 120})]
-        if "FROM pg_stat_activity" in query and "COUNT(*)" in query:
-            return [MockCell({"count": 140})]
-        return None
-
-    driver = MagicMock()
-    driver.execute_query = AsyncMock(side_effect=side_effect)
+            ],
+            "FILTER (WHERE state = 'idle in transaction')": [MockCell({"total": 140, "idle": 120})],
+        }
+    )
     calc = ConnectionHealthCalc(driver, max_total_connections=500, max_idle_connections=100)
 
     result = await calc.connection_health_check()
@@ -49,25 +33,10 @@ async def test_connection_health_includes_wait_event_context(monkeypatch):
     assert "Lock:transactionid (count=120)" in result
 
 
-@pytest.mark.asyncio
 async def test_connection_health_without_wait_events_view(monkeypatch):
-    async def fake_has_view_column(_driver, _schema, _view_name, _column_name):
-        return False
-
-    monkeypatch.setattr(
-        "postgres_mcp.database_health.connection_health_calc.has_view_column",
-        fake_has_view_column,
-    )
-
-    async def side_effect(query):
-        if "WHERE state = 'idle in transaction'" in query and "COUNT(*)" in query:
-            return [MockCell({"count": 120})]
-        if "FROM pg_stat_activity" in query and "COUNT(*)" in query:
-            return [MockCell({"count": 140})]
-        return None
+    monkeypatch.setattr(connection_health_calc, "has_view_column", never_has_column)
 
-    driver = MagicMock()
-    driver.execute_query = AsyncMock(side_effect=side_effect)
+    driver = FakeDriver({"FILTER (WHERE state = 'idle in transaction')": [MockCell({"total": 140, "idle": 120})]})
     calc = ConnectionHealthCalc(driver, max_total_connections=500, max_idle_connections=100)
 
     result = await calc.connection_health_check()
@@ -1,29 +1,17 @@
-from unittest.mock import AsyncMock
-from unittest.mock import MagicMock
-
-import pytest
+from _fakes import FakeDriver
+from _fakes import always_has_column
+from _fakes import never_has_column
+from _support.mock_cell import MockCell
 
+from postgres_mcp.database_health import constraint_health_calc
 from postgres_mcp.database_health.constraint_health_calc import ConstraintHealthCalc
 
 
-class MockCell:
-    def __init__(self, data):
-        self.cells = data
-
-
-@pytest.mark.asyncio
 async def test_invalid_constraint_message_without_conenforced(monkeypatch):
-    async def fake_has_view_column(_driver, _schema, _view_name, _column_name):
-        return False
-
-    monkeypatch.setattr(
-        "postgres_mcp.database_health.constraint_health_calc.has_view_column",
-        fake_has_view_column,
-    )
+    monkeypatch.setattr(constraint_health_calc, "has_view_column", never_has_column)
 
-    driver = MagicMock()
-    driver.execute_query = AsyncMock(
-        return_value=[
+    driver = FakeDriver(
+        fallback=[
             MockCell(
                 {
                     "schema": "public",
@@ -44,19 +32,11 @@ async def test_invalid_constraint_message_without_conenforced(monkeypatch):
     assert "referencing 'public.customers' is invalid" in result
 
 
-@pytest.mark.asyncio
 async def test_not_enforced_constraint_message(monkeypatch):
-    async def fake_has_view_column(_driver, _schema, _view_name, _column_name):
-        return True
+    monkeypatch.setattr(constraint_health_calc, "has_view_column", always_has_column)
 
-    monkeypatch.setattr(
-        "postgres_mcp.database_health.constraint_health_calc.has_view_column",
-        fake_has_view_column,
-    )
-
-    driver = MagicMock()
-    driver.execute_query = AsyncMock(
-        return_value=[
+    driver = FakeDriver(
+        fallback=[
             MockCell(
                 {
                     "schema": "public",
@@ -77,18 +57,10 @@ async def test_not_enforced_constraint_message(monkeypatch):
     assert "is not enforced" in result
 
 
-@pytest.mark.asyncio
 async def test_constraint_health_no_issues(monkeypatch):
-    async def fake_has_view_column(_driver, _schema, _view_name, _column_name):
-        return True
-
-    monkeypatch.setattr(
-        "postgres_mcp.database_health.constraint_health_calc.has_view_column",
-        fake_has_view_column,
-    )
+    monkeypatch.setattr(constraint_health_calc, "has_view_column", always_has_column)
 
-    driver = MagicMock()
-    driver.execute_query = AsyncMock(return_value=[])
+    driver = FakeDriver(fallback=[])
     calc = ConstraintHealthCalc(driver)
 
     result = await calc.invalid_constraints_check()
@@ -145,7 +145,6 @@ async def cleanup_test_tables(sql_driver):
         await conn_pool.close()
 
 
-@pytest.mark.asyncio
 async def test_database_health_all(local_sql_driver):
     """Test that the database health tool runs without errors when performing all health checks.
     This test only verifies that the tool executes successfully and returns results in the expected format.
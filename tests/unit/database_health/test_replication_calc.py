@@ -1,33 +1,24 @@
 from typing import Any
 from typing import cast
-from unittest.mock import AsyncMock
-from unittest.mock import MagicMock
 
-import pytest
+from _fakes import FakeDriver
+from _fakes import has_columns_from
+from _fakes import returning
+from _support.mock_cell import MockCell
 
+from postgres_mcp.database_health import replication_calc
 from postgres_mcp.database_health.replication_calc import ReplicationCalc
 from postgres_mcp.database_health.replication_calc import ReplicationMetrics
 from postgres_mcp.database_health.replication_calc import ReplicationSlot
+from postgres_mcp.sql import PgServerInfo
 
 
-class MockCell:
-    def __init__(self, data):
-        self.cells = data
-
-
-@pytest.mark.asyncio
 async def test_replication_slots_include_pg17_fields(monkeypatch):
-    async def fake_has_view_column(_driver, _schema, _view_name, _column_name):
-        return True
-
-    monkeypatch.setattr(
-        "postgres_mcp.database_health.replication_calc.has_view_column",
-        fake_has_view_column,
-    )
+    monkeypatch.setattr(replication_calc, "has_view_columns", has_columns_from())
+    monkeypatch.setattr(replication_calc, "get_server_info", returning(PgServerInfo(server_version_num=170000, major=17)))
 
-    driver = MagicMock()
-    driver.execute_query = AsyncMock(
-        return_value=[
+    driver = FakeDriver(
+        fallback=[
             MockCell(
                 {
                     "slot_name": "slot_a",
@@ -44,7 +35,6 @@ async def test_replication_slots_include_pg17_fields(monkeypatch):
 
     calc = ReplicationCalc(driver)
     raw_calc = cast(Any, calc)
-    raw_calc._server_version = 170000
     slots = await raw_calc._get_replication_slots()
 
     assert len(slots) == 1
@@ -56,14 +46,12 @@ async def test_replication_slots_include_pg17_fields(monkeypatch):
     assert slot.synced is False
 
 
-@pytest.mark.asyncio
 async def test_replication_health_formats_slot_details():
-    driver = MagicMock()
-    driver.execute_query = AsyncMock(return_value=[])
+    driver = FakeDriver(fallback=[])
     calc = ReplicationCalc(driver)
     raw_calc = cast(Any, calc)
-    raw_calc._get_replication_metrics = AsyncMock(
-        return_value=ReplicationMetrics(
+    raw_calc._get_replication_metrics = returning(
+        ReplicationMetrics(
             is_replica=False,
             replication_lag_seconds=None,
             is_replicating=True,
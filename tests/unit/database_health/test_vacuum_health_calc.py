@@ -1,31 +1,21 @@
 from typing import Any
 from typing import cast
-from unittest.mock import AsyncMock
-from unittest.mock import MagicMock
 
-import pytest
+from _fakes import FakeDriver
+from _fakes import always_has_column
+from _fakes import never_has_column
+from _fakes import returning
+from _support.mock_cell import MockCell
 
+from postgres_mcp.database_health import vacuum_health_calc
 from postgres_mcp.database_health.vacuum_health_calc import VacuumHealthCalc
 
 
-class MockCell:
-    def __init__(self, data):
-        self.cells = data
-
-
-@pytest.mark.asyncio
 async def test_vacuum_health_includes_timing_summary(monkeypatch):
-    async def fake_has_view_column(_driver, _schema, _view_name, _column_name):
-        return True
-
-    monkeypatch.setattr(
-        "postgres_mcp.database_health.vacuum_health_calc.has_view_column",
-        fake_has_view_column,
-    )
+    monkeypatch.setattr(vacuum_health_calc, "has_view_column", always_has_column)
 
-    driver = MagicMock()
-    driver.execute_query = AsyncMock(
-        return_value=[
+    driver = FakeDriver(
+        fallback=[
             MockCell(
                 {
                     "total_vacuum_time": 12.5,
@@ -38,7 +28,7 @@ async def test_vacuum_health_includes_timing_summary(monkeypatch):
     )
 
     calc = VacuumHealthCalc(driver)
-    cast(Any, calc)._get_transaction_id_metrics = AsyncMock(return_value=[])
+    cast(Any, calc)._get_transaction_id_metrics = returning([])
     result = await calc.transaction_id_danger_check()
 
     assert "No tables found with transaction ID wraparound danger." in result
@@ -47,20 +37,12 @@ async def test_vacuum_health_includes_timing_summary(monkeypatch):
     assert "autovacuum=33.0" in result
 
 
-@pytest.mark.asyncio
 async def test_vacuum_health_without_timing_columns(monkeypatch):
-    async def fake_has_view_column(_driver, _schema, _view_name, _column_name):
-        return False
-
-    monkeypatch.setattr(
-        "postgres_mcp.database_health.vacuum_health_calc.has_view_column",
-        fake_has_view_column,
-    )
+    monkeypatch.setattr(vacuum_health_calc, "has_view_column", never_has_column)
 
-    driver = MagicMock()
-    driver.execute_query = AsyncMock(return_value=None)
+    driver = FakeDriver()
 
     calc = VacuumHealthCalc(driver)
-    cast(Any, calc)._get_transaction_id_metrics = AsyncMock(return_value=[])
+    cast(Any, calc)._get_transaction_id_metrics = returning([])
     result = await calc.transaction_id_danger_check()
     assert result == "No tables found with transaction ID wraparound danger."
@@ -2,19 +2,14 @@ import json
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 
-import pytest
 import pytest_asyncio
+from _support.mock_cell import MockCell
 
 from postgres_mcp.artifacts import ErrorResult
 from postgres_mcp.artifacts import ExplainPlanArtifact
 from postgres_mcp.explain import ExplainPlanTool
 
 
-class MockCell:
-    def __init__(self, data):
-        self.cells = data
-
-
 @pytest_asyncio.fixture
 async def mock_sql_driver():
     """Create a mock SQL driver for testing."""
@@ -23,14 +18,12 @@ async def mock_sql_driver():
     return driver
 
 
-@pytest.mark.asyncio
 async def test_explain_plan_tool_initialization(mock_sql_driver):
     """Test initialization of ExplainPlanTool."""
     tool = ExplainPlanTool(sql_driver=mock_sql_driver)
     assert tool.sql_driver == mock_sql_driver
 
 
-@pytest.mark.asyncio
 async def test_has_bind_variables():
     """Test the _has_bind_variables method."""
     tool = ExplainPlanTool(sql_driver=MagicMock())
@@ -44,7 +37,6 @@ async def test_has_bind_variables():
     assert tool._has_bind_variables("INSERT INTO users VALUES (1, 'test')") is False  # type: ignore
 
 
-@pytest.mark.asyncio
 async def test_has_like_expressions():
     """Test the _has_like_expressions method."""
     tool = ExplainPlanTool(sql_driver=MagicMock())
@@ -59,7 +51,6 @@ async def test_has_like_expressions():
     assert tool._has_like_expressions("SELECT * FROM users WHERE id > 100") is False  # type: ignore
 
 
-@pytest.mark.asyncio
 async def test_explain_success(mock_sql_driver):
     """Test successful execution of explain."""
     # Prepare mock response
@@ -118,7 +109,6 @@ def test_explain_plan_artifact_tolerates_additional_pg18_fields():
     assert artifact.planning_time == 0.10
 
 
-@pytest.mark.asyncio
 async def test_explain_with_bind_variables(mock_sql_driver):
     """Test explain with bind variables."""
     # Prepare mock response for PostgreSQL version check
@@ -161,7 +151,6 @@ async def test_explain_with_bind_variables(mock_sql_driver):
     assert "EXPLAIN (FORMAT JSON, GENERIC_PLAN) SELECT * FROM users WHERE id = $1" in explain_call
 
 
-@pytest.mark.asyncio
 async def test_explain_with_bind_variables_pg15(mock_sql_driver, monkeypatch):
     """Test explain with bind variables on PostgreSQL < 16."""
     # Prepare mock response for PostgreSQL version check
@@ -228,7 +217,6 @@ async def test_explain_with_bind_variables_pg15(mock_sql_driver, monkeypatch):
     assert "id = 42" in explain_call[0][0]
 
 
-@pytest.mark.asyncio
 async def test_explain_analyze_with_bind_variables(mock_sql_driver, monkeypatch):
     """Test explain analyze with bind variables uses parameter replacement."""
     # Prepare plan data for the replaced parameter query
@@ -283,7 +271,6 @@ async def test_explain_analyze_with_bind_variables(mock_sql_driver, monkeypatch)
     assert "id = 42" in call_args
 
 
-@pytest.mark.asyncio
 async def test_explain_analyze_success(mock_sql_driver):
     """Test successful execution of explain analyze."""
     # Prepare mock response with execution statistics
@@ -318,7 +305,6 @@ async def test_explain_analyze_success(mock_sql_driver):
     assert json.loads(result.value) == plan_data
 
 
-@pytest.mark.asyncio
 async def test_explain_memory_option_success(mock_sql_driver):
     """Test EXPLAIN MEMORY support for PostgreSQL 17+."""
     plan_data = {
@@ -348,7 +334,6 @@ async def test_explain_memory_option_success(mock_sql_driver):
     assert "MEMORY" in explain_call
 
 
-@pytest.mark.asyncio
 async def test_explain_memory_option_requires_pg17(mock_sql_driver):
     """Test EXPLAIN MEMORY validation on unsupported versions."""
     mock_sql_driver.execute_query.return_value = [MockCell({"server_version_num": "160009"})]
@@ -358,7 +343,6 @@ async def test_explain_memory_option_requires_pg17(mock_sql_driver):
     assert "MEMORY option requires PostgreSQL 17 or later" in result.value
 
 
-@pytest.mark.asyncio
 async def test_explain_serialize_option_success(mock_sql_driver):
     """Test EXPLAIN ANALYZE SERIALIZE support for PostgreSQL 17+."""
     plan_data = {
@@ -394,7 +378,6 @@ async def test_explain_serialize_option_success(mock_sql_driver):
     assert "SERIALIZE TEXT" in explain_call
 
 
-@pytest.mark.asyncio
 async def test_explain_serialize_requires_analyze(mock_sql_driver):
     """Test EXPLAIN SERIALIZE validation when analyze=False."""
     tool = ExplainPlanTool(sql_driver=mock_sql_driver)
@@ -403,7 +386,6 @@ async def test_explain_serialize_requires_analyze(mock_sql_driver):
     assert "SERIALIZE option requires analyze=True" in result.value
 
 
-@pytest.mark.asyncio
 async def test_explain_with_error(mock_sql_driver):
     """Test handling of error in explain."""
     # Configure mock to raise exception
@@ -417,7 +399,6 @@ async def test_explain_with_error(mock_sql_driver):
     assert "Database error" in result.value
 
 
-@pytest.mark.asyncio
 async def test_explain_with_invalid_response(mock_sql_driver):
     """Test handling of invalid response format."""
     # Return invalid response format
@@ -433,7 +414,6 @@ async def test_explain_with_invalid_response(mock_sql_driver):
     assert "Expected list" in result.value
 
 
-@pytest.mark.asyncio
 async def test_explain_with_empty_result(mock_sql_driver):
     """Test handling of empty result set."""
     # Return empty result
@@ -447,7 +427,6 @@ async def test_explain_with_empty_result(mock_sql_driver):
     assert "No results" in result.value
 
 
-@pytest.mark.asyncio
 async def test_explain_with_empty_plan_data(mock_sql_driver):
     """Test handling of empty plan data."""
     # Return empty plan data list
@@ -461,7 +440,6 @@ async def test_explain_with_empty_plan_data(mock_sql_driver):
     assert "No results" in result.value
 
 
-@pytest.mark.asyncio
 async def test_explain_with_like_and_bind_variables_pg16(mock_sql_driver, monkeypatch):
     """Test explain with LIKE and bind variables on PostgreSQL 16."""
     # Prepare mock response for PostgreSQL version check
@@ -528,7 +506,6 @@ async def test_explain_with_like_and_bind_variables_pg16(mock_sql_driver, monkey
     assert "LIKE '%John%'" in explain_call[0][0]
 
 
-@pytest.mark.asyncio
 async def test_explain_with_functional_hypothetical_indexes(mock_sql_driver):
     """Test explain with functional expressions in hypothetical indexes."""
     # Prepare sample plan data with index scan - including all required fields
@@ -105,7 +105,6 @@ async def cleanup_test_tables(sql_driver):
         await conn_pool.close()
 
 
-@pytest.mark.asyncio
 async def test_explain_with_real_db(local_sql_driver):
     """Test explain with a real database connection."""
     await setup_test_tables(local_sql_driver)
@@ -132,7 +131,6 @@ async def test_explain_with_real_db(local_sql_driver):
         await cleanup_test_tables(local_sql_driver)
 
 
-@pytest.mark.asyncio
 async def test_explain_analyze_with_real_db(local_sql_driver):
     """Test explain analyze with a real database connection."""
     await setup_test_tables(local_sql_driver)
@@ -158,7 +156,6 @@ async def test_explain_analyze_with_real_db(local_sql_driver):
         await cleanup_test_tables(local_sql_driver)
 
 
-@pytest.mark.asyncio
 async def test_explain_join_query_with_real_db(local_sql_driver):
     """Test explain with a join query."""
     await setup_test_tables(local_sql_driver)
@@ -186,7 +183,6 @@ async def test_explain_join_query_with_real_db(local_sql_driver):
         await cleanup_test_tables(local_sql_driver)
 
 
-@pytest.mark.asyncio
 async def test_explain_with_bind_variables_real_db(local_sql_driver):
     """Test explain with bind variables on a real database."""
     await setup_test_tables(local_sql_driver)
@@ -205,7 +201,6 @@ async def test_explain_with_bind_variables_real_db(local_sql_driver):
         await cleanup_test_tables(local_sql_driver)
 
 
-@pytest.mark.asyncio
 async def test_explain_with_like_expressions_real_db(local_sql_driver):
     """Test explain with LIKE expressions on a real database."""
     await setup_test_tables(local_sql_driver)
@@ -227,7 +222,6 @@ async def test_explain_with_like_expressions_real_db(local_sql_driver):
         await cleanup_test_tables(local_sql_driver)
 
 
-@pytest.mark.asyncio
 async def test_explain_with_like_and_bind_variables_real_db(local_sql_driver):
     """Test explain with both LIKE and bind variables on a real database."""
     await setup_test_tables(local_sql_driver)
@@ -246,7 +240,6 @@ async def test_explain_with_like_and_bind_variables_real_db(local_sql_driver):
         await cleanup_test_tables(local_sql_driver)
 
 
-@pytest.mark.asyncio
 async def test_explain_invalid_query_with_real_db(local_sql_driver):
     """Test explain with an invalid query."""
     await setup_test_tables(local_sql_driver)
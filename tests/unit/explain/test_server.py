@@ -3,17 +3,11 @@ from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
-import pytest
 import pytest_asyncio
 
 import postgres_mcp.server as server
 
 
-class MockCell:
-    def __init__(self, data):
-        self.cells = data
-
-
 @pytest_asyncio.fixture
 async def mock_db_connection():
     """Create a mock DB connection."""
@@ -23,7 +17,6 @@ async def mock_db_connection():
     return conn
 
 
-@pytest.mark.asyncio
 async def test_server_tools_registered():
     """Test that the explain tools are properly registered in the server."""
     # Check that the explain tool is registered
@@ -33,7 +26,6 @@ async def test_server_tools_registered():
     assert callable(server.explain_query)
 
 
-@pytest.mark.asyncio
 async def test_explain_query_basic():
     """Test explain_query with basic parameters."""
     # Expected output
@@ -54,7 +46,6 @@ async def test_explain_query_basic():
         assert json.loads(result[0].text) == expected_output
 
 
-@pytest.mark.asyncio
 async def test_explain_query_analyze():
     """Test explain_query with analyze=True."""
     # Expected output with execution statistics
@@ -82,7 +73,6 @@ async def test_explain_query_analyze():
         assert json.loads(result[0].text) == expected_output
 
 
-@pytest.mark.asyncio
 async def test_explain_query_hypothetical_indexes():
     """Test explain_query with hypothetical indexes."""
     # Expected output with an index scan
@@ -112,7 +102,6 @@ async def test_explain_query_hypothetical_indexes():
         assert json.loads(result[0].text) == expected_output
 
 
-@pytest.mark.asyncio
 async def test_explain_query_error_handling():
     """Test explain_query error handling."""
     # Create a mock error response
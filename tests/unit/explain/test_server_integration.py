@@ -1,201 +1,182 @@
 import json
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
-from unittest.mock import patch
+from unittest.mock import create_autospec
 
 import pytest
 import pytest_asyncio
+from mcp.types import CallToolResult
+from mcp.types import TextContent
 
 from postgres_mcp.artifacts import ExplainPlanArtifact
+from postgres_mcp.explain import ExplainPlanTool
 from postgres_mcp.server import explain_query
+from postgres_mcp.sql import SafeSqlDriver
+from postgres_mcp.tools.query_tools import clear_explain_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_explain_plan_cache():
+    clear_explain_cache()
+    yield
+    clear_explain_cache()
 
 
 @pytest_asyncio.fixture
 async def mock_safe_sql_driver():
     """Create a mock SafeSqlDriver for testing."""
-    driver = MagicMock()
-    return driver
+    # instance=True skips autospec's class-and-instance dual mock and
+    # spec_set rejects typo'd attributes instead of lazily creating them.
+    return create_autospec(SafeSqlDriver, instance=True, spec_set=True)
 
 
 @pytest.fixture
 def mock_explain_plan_tool():
-    """Create a mock ExplainPlanTool."""
-    tool = MagicMock()
-    tool.explain = AsyncMock()
-    tool.explain_analyze = AsyncMock()
-    tool.explain_with_hypothetical_indexes = AsyncMock()
-    return tool
-
-
-class MockCell:
-    def __init__(self, data):
-        self.cells = data
-
-
-def _make_explain_mock(result_text: str) -> MagicMock:
-    """Create a mock ExplainPlanArtifact with the given text."""
-    artifact = MagicMock(spec=ExplainPlanArtifact)
-    artifact.to_text.return_value = result_text
-    return artifact
-
-
-@pytest.mark.asyncio
-async def test_explain_query_integration():
-    """Test the entire explain_query tool end-to-end."""
-    result_text = json.dumps({"Plan": {"Node Type": "Seq Scan"}})
-    artifact = _make_explain_mock(result_text)
-
-    with patch("postgres_mcp.tools.query_tools.get_sql_driver", new_callable=AsyncMock):
-        with patch("postgres_mcp.tools.query_tools.ExplainPlanTool") as mock_tool:
-            mock_tool.return_value.explain = AsyncMock(return_value=artifact)
-            result = await explain_query("SELECT * FROM users", analyze=False, hypothetical_indexes=[])
-
-            from mcp.types import CallToolResult
-            from mcp.types import TextContent
-
-            assert isinstance(result, CallToolResult)
-            first_content = result.content[0]
-            assert isinstance(first_content, TextContent)
-            assert result_text in first_content.text
-
-
-@pytest.mark.asyncio
-async def test_explain_query_with_analyze_integration():
-    """Test the explain_query tool with analyze=True."""
-    result_text = json.dumps({"Plan": {"Node Type": "Seq Scan"}, "Execution Time": 1.23})
-    artifact = _make_explain_mock(result_text)
-
-    with patch("postgres_mcp.tools.query_tools.get_sql_driver", new_callable=AsyncMock):
-        with patch("postgres_mcp.tools.query_tools.ExplainPlanTool") as mock_tool:
-            mock_tool.return_value.explain_analyze = AsyncMock(return_value=artifact)
-            result = await explain_query("SELECT * FROM users", analyze=True, hypothetical_indexes=[])
-
-            from mcp.types import CallToolResult
-            from mcp.types import TextContent
-
-            assert isinstance(result, CallToolResult)
-            first_content = result.content[0]
-            assert isinstance(first_content, TextContent)
-            assert result_text in first_content.text
-            mock_tool.return_value.explain_analyze.assert_awaited_once_with(
-                "SELECT * FROM users",
-                include_memory=False,
-                serialize=None,
-            )
-
-
-@pytest.mark.asyncio
-async def test_explain_query_with_analyze_memory_and_serialize_integration():
-    """Test serialize/include_memory pass-through for analyze mode."""
-    result_text = json.dumps({"Plan": {"Node Type": "Seq Scan"}, "Execution Time": 1.23})
-    artifact = _make_explain_mock(result_text)
-
-    with patch("postgres_mcp.tools.query_tools.get_sql_driver", new_callable=AsyncMock):
-        with patch("postgres_mcp.tools.query_tools.ExplainPlanTool") as mock_tool:
-            mock_tool.return_value.explain_analyze = AsyncMock(return_value=artifact)
-            result = await explain_query(
-                "SELECT * FROM users",
-                analyze=True,
-                include_memory=True,
-                serialize="binary",
-                hypothetical_indexes=[],
-            )
-
-            from mcp.types import CallToolResult
-
-            assert isinstance(result, CallToolResult)
-            mock_tool.return_value.explain_analyze.assert_awaited_once_with(
-                "SELECT * FROM users",
-                include_memory=True,
-                serialize="binary",
-            )
-
-
-@pytest.mark.asyncio
-async def test_explain_query_with_hypothetical_indexes_integration():
-    """Test the explain_query tool with hypothetical indexes."""
-    result_text = json.dumps({"Plan": {"Node Type": "Index Scan"}})
-    artifact = _make_explain_mock(result_text)
+    """Create a mock ExplainPlanTool (async methods become AsyncMocks via autospec)."""
+    return create_autospec(ExplainPlanTool, instance=True, spec_set=True)
+
+
+@pytest.fixture
+def patched_query_tools(monkeypatch):
+    """Patch query_tools' ExplainPlanTool and driver lookup once per test.
+
+    A single monkeypatch fixture is cheaper than re-entering nested
+    ``with patch(...)`` stacks in every test, and returning the mocked tool
+    class keeps each test's arrange step to one line.
+    """
+    mock_tool_cls = MagicMock()
+    monkeypatch.setattr("postgres_mcp.tools.query_tools.ExplainPlanTool", mock_tool_cls)
+    monkeypatch.setattr("postgres_mcp.tools.query_tools.get_sql_driver", AsyncMock())
+    return mock_tool_cls
 
-    test_sql = "SELECT * FROM users WHERE email = 'test@example.com'"
-    test_indexes = [{"table": "users", "columns": ["email"]}]
 
-    with patch("postgres_mcp.tools.query_tools.get_sql_driver", new_callable=AsyncMock):
-        with patch("postgres_mcp.tools.query_tools.ExplainPlanTool") as mock_tool:
-            mock_tool.return_value.explain_with_hypothetical_indexes = AsyncMock(return_value=artifact)
-            with patch(
-                "postgres_mcp.tools.query_tools.check_hypopg_installation_status",
-                new_callable=AsyncMock,
-                return_value=(True, ""),
-            ):
-                result = await explain_query(test_sql, analyze=False, hypothetical_indexes=test_indexes)
+class _FakeArtifact(ExplainPlanArtifact):
+    """Tiny ExplainPlanArtifact stand-in; only to_text is ever consumed.
 
-                from mcp.types import CallToolResult
-                from mcp.types import TextContent
+    Subclassing keeps query_tools' isinstance check passing while skipping
+    both MagicMock's spec introspection and the attrs initializer.
+    """
 
-                assert isinstance(result, CallToolResult)
-                first_content = result.content[0]
-                assert isinstance(first_content, TextContent)
-                assert result_text in first_content.text
+    def __init__(self, text: str):
+        self._text = text
 
+    def to_text(self) -> str:
+        return self._text
 
-@pytest.mark.asyncio
-async def test_explain_query_missing_hypopg_integration():
+
+def _make_explain_mock(result_text: str) -> _FakeArtifact:
+    """Create a fake ExplainPlanArtifact with the given text."""
+    return _FakeArtifact(result_text)
+
+
+def assert_tool_text(result, expected, is_error=False):
+    """Assert a CallToolResult whose first content block contains ``expected``."""
+    assert isinstance(result, CallToolResult)
+    assert bool(result.isError) is is_error
+    first_content = result.content[0]
+    assert isinstance(first_content, TextContent)
+    assert expected in first_content.text
+
+
+_TEST_INDEXES = [{"table": "users", "columns": ["email"]}]
+
+# Precomputed per-case mocks: each parametrized case runs once, so building
+# the AsyncMock chain at module import instead of inside the test keeps the
+# per-test body to a setattr while awaited-once assertions stay valid.
+_SEQ_SCAN_TEXT = json.dumps({"Plan": {"Node Type": "Seq Scan"}})
+_ANALYZE_TEXT = json.dumps({"Plan": {"Node Type": "Seq Scan"}, "Execution Time": 1.23})
+_INDEX_SCAN_TEXT = json.dumps({"Plan": {"Node Type": "Index Scan"}})
+
+
+@pytest.mark.parametrize(
+    ("mock_method", "explain_kwargs", "needs_hypopg", "explain_mock", "result_text", "expected_call"),
+    [
+        pytest.param(
+            "explain",
+            {"analyze": False, "hypothetical_indexes": []},
+            False,
+            AsyncMock(return_value=_make_explain_mock(_SEQ_SCAN_TEXT)),
+            _SEQ_SCAN_TEXT,
+            None,
+            id="plain",
+        ),
+        pytest.param(
+            "explain_analyze",
+            {"analyze": True, "hypothetical_indexes": []},
+            False,
+            AsyncMock(return_value=_make_explain_mock(_ANALYZE_TEXT)),
+            _ANALYZE_TEXT,
+            {"include_memory": False, "serialize": None},
+            id="analyze",
+        ),
+        pytest.param(
+            "explain_analyze",
+            {"analyze": True, "include_memory": True, "serialize": "binary", "hypothetical_indexes": []},
+            False,
+            AsyncMock(return_value=_make_explain_mock(_ANALYZE_TEXT)),
+            _ANALYZE_TEXT,
+            {"include_memory": True, "serialize": "binary"},
+            id="analyze-memory-serialize",
+        ),
+        pytest.param(
+            "explain_with_hypothetical_indexes",
+            {"analyze": False, "hypothetical_indexes": _TEST_INDEXES},
+            True,
+            AsyncMock(return_value=_make_explain_mock(_INDEX_SCAN_TEXT)),
+            _INDEX_SCAN_TEXT,
+            None,
+            id="hypothetical-indexes",
+        ),
+    ],
+)
+async def test_explain_query_integration(
+    patched_query_tools, monkeypatch, mock_method, explain_kwargs, needs_hypopg, explain_mock, result_text, expected_call
+):
+    """Test the explain_query tool end-to-end across its main modes."""
+    setattr(patched_query_tools.return_value, mock_method, explain_mock)
+    if needs_hypopg:
+        monkeypatch.setattr(
+            "postgres_mcp.tools.query_tools.check_hypopg_installation_status",
+            AsyncMock(return_value=(True, "")),
+        )
+
+    result = await explain_query("SELECT * FROM users", **explain_kwargs)
+
+    assert_tool_text(result, result_text)
+    if expected_call is not None:
+        getattr(patched_query_tools.return_value, mock_method).assert_awaited_once_with("SELECT * FROM users", **expected_call)
+
+
+async def test_explain_query_missing_hypopg_integration(patched_query_tools, monkeypatch):
     """Test the explain_query tool when hypopg extension is missing."""
     missing_ext_message = "The hypopg extension is required"
 
     test_sql = "SELECT * FROM users WHERE email = 'test@example.com'"
     test_indexes = [{"table": "users", "columns": ["email"]}]
 
-    with patch("postgres_mcp.tools.query_tools.get_sql_driver", new_callable=AsyncMock):
-        with patch("postgres_mcp.tools.query_tools.ExplainPlanTool"):
-            with patch(
-                "postgres_mcp.tools.query_tools.check_hypopg_installation_status",
-                new_callable=AsyncMock,
-                return_value=(False, missing_ext_message),
-            ):
-                result = await explain_query(test_sql, analyze=False, hypothetical_indexes=test_indexes)
-
-                from mcp.types import CallToolResult
-                from mcp.types import TextContent
+    monkeypatch.setattr(
+        "postgres_mcp.tools.query_tools.check_hypopg_installation_status",
+        AsyncMock(return_value=(False, missing_ext_message)),
+    )
+    result = await explain_query(test_sql, analyze=False, hypothetical_indexes=test_indexes)
 
-                assert isinstance(result, CallToolResult)
-                first_content = result.content[0]
-                assert isinstance(first_content, TextContent)
-                assert missing_ext_message in first_content.text
+    assert_tool_text(result, missing_ext_message)
 
 
-@pytest.mark.asyncio
 async def test_explain_query_serialize_requires_analyze():
     """Serialize requires analyze=True."""
     result = await explain_query("SELECT 1", serialize="text")
 
-    from mcp.types import CallToolResult
-    from mcp.types import TextContent
-
-    assert isinstance(result, CallToolResult)
-    assert result.isError is True
-    first_content = result.content[0]
-    assert isinstance(first_content, TextContent)
-    assert "SERIALIZE requires analyze=True" in first_content.text
+    assert_tool_text(result, "SERIALIZE requires analyze=True", is_error=True)
 
 
-@pytest.mark.asyncio
 async def test_explain_query_serialize_mode_validation():
     """Serialize accepts only text/binary."""
     result = await explain_query("SELECT 1", analyze=True, serialize="json")
 
-    from mcp.types import CallToolResult
-    from mcp.types import TextContent
+    assert_tool_text(result, "SERIALIZE must be either 'text' or 'binary'", is_error=True)
 
-    assert isinstance(result, CallToolResult)
-    assert result.isError is True
-    first_content = result.content[0]
-    assert isinstance(first_content, TextContent)
-    assert "SERIALIZE must be either 'text' or 'binary'" in first_content.text
 
-
-@pytest.mark.asyncio
 async def test_explain_query_serialize_with_hypothetical_indexes_rejected():
     """Serialize cannot be used with hypothetical indexes."""
     test_indexes = [{"table": "users", "columns": ["email"]}]
@@ -206,32 +187,18 @@ async def test_explain_query_serialize_with_hypothetical_indexes_rejected():
         hypothetical_indexes=test_indexes,
     )
 
-    from mcp.types import CallToolResult
-    from mcp.types import TextContent
+    assert_tool_text(result, "Cannot use analyze and hypothetical indexes together", is_error=True)
 
-    assert isinstance(result, CallToolResult)
-    assert result.isError is True
-    first_content = result.content[0]
-    assert isinstance(first_content, TextContent)
-    assert "Cannot use analyze and hypothetical indexes together" in first_content.text
 
-
-@pytest.mark.asyncio
-async def test_explain_query_error_handling_integration():
+async def test_explain_query_error_handling_integration(monkeypatch):
     """Test the explain_query tool's error handling."""
     error_message = "Error executing query"
 
-    with patch(
+    # Not a fit for patched_query_tools: get_sql_driver must raise here.
+    monkeypatch.setattr(
         "postgres_mcp.tools.query_tools.get_sql_driver",
-        side_effect=Exception(error_message),
-    ):
-        result = await explain_query("INVALID SQL")
-
-        from mcp.types import CallToolResult
-        from mcp.types import TextContent
-
-        assert isinstance(result, CallToolResult)
-        assert result.isError is True
-        first_content = result.content[0]
-        assert isinstance(first_content, TextContent)
-        assert error_message in first_content.text
+        AsyncMock(side_effect=Exception(error_message)),
+    )
+    result = await explain_query("INVALID SQL")
+
+    assert_tool_text(result, error_message, is_error=True)
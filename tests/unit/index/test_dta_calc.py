@@ -1,7 +1,6 @@
 import asyncio
 import json
 from logging import getLogger
-from typing import Any
 from typing import Dict
 from typing import Set
 from unittest.mock import AsyncMock
@@ -10,6 +9,7 @@ from unittest.mock import patch
 
 import pytest
 import pytest_asyncio
+from _support.mock_cell import MockCell
 from pglast import parse_sql
 
 from postgres_mcp.artifacts import ExplainPlanArtifact
@@ -21,11 +21,6 @@ from postgres_mcp.index.dta_calc import IndexRecommendation
 logger = getLogger(__name__)
 
 
-class MockCell:
-    def __init__(self, data: Dict[str, Any]):
-        self.cells = data
-
-
 # Using pytest-asyncio's fixture to run async tests
 @pytest_asyncio.fixture
 async def async_sql_driver():
@@ -40,7 +35,6 @@ async def create_dta(async_sql_driver):
 
 
 # Convert the unittest.TestCase class to use pytest
-@pytest.mark.asyncio
 async def test_extract_columns_empty_query(create_dta):
     dta = create_dta
     query = "SELECT 1"
@@ -48,7 +42,6 @@ async def test_extract_columns_empty_query(create_dta):
     assert columns == {}
 
 
-@pytest.mark.asyncio
 async def test_extract_columns_invalid_sql(create_dta):
     dta = create_dta
     query = "INVALID SQL"
@@ -56,7 +49,6 @@ async def test_extract_columns_invalid_sql(create_dta):
     assert columns == {}
 
 
-@pytest.mark.asyncio
 async def test_extract_columns_subquery(create_dta):
     dta = create_dta
     query = "SELECT * FROM users WHERE id IN (SELECT user_id FROM orders WHERE status = 'pending')"
@@ -64,7 +56,6 @@ async def test_extract_columns_subquery(create_dta):
     assert columns == {"users": {"id"}, "orders": {"user_id", "status"}}
 
 
-@pytest.mark.asyncio
 async def test_index_initialization():
     """Test Index class initialization and properties."""
     idx = IndexRecommendation(
@@ -79,7 +70,6 @@ async def test_index_initialization():
     assert idx.definition == "CREATE INDEX crystaldba_idx_users_name_email_2 ON users USING btree (name, email)"
 
 
-@pytest.mark.asyncio
 async def test_index_equality():
     """Test Index equality comparison."""
     idx1 = IndexRecommendation(table="users", columns=("name",))
@@ -90,7 +80,6 @@ async def test_index_equality():
     assert idx1.index_definition != idx3.index_definition
 
 
-@pytest.mark.asyncio
 async def test_extract_columns_from_simple_query(create_dta):
     """Test column extraction from a simple SELECT query."""
     dta = create_dta
@@ -99,7 +88,6 @@ async def test_extract_columns_from_simple_query(create_dta):
     assert columns == {"users": {"name", "age"}}
 
 
-@pytest.mark.asyncio
 async def test_extract_columns_from_join_query(create_dta):
     """Test column extraction from a query with JOINs."""
     dta = create_dta
@@ -116,7 +104,6 @@ async def test_extract_columns_from_join_query(create_dta):
     }
 
 
-@pytest.mark.asyncio
 async def test_generate_candidates(async_sql_driver, create_dta):
     """Test index candidate generation."""
     global responses
@@ -166,10 +153,11 @@ async def test_generate_candidates(async_sql_driver, create_dta):
     assert candidates[0].estimated_size_bytes == 10 * 8192
 
 
-@pytest.mark.asyncio
 async def test_analyze_workload(async_sql_driver, create_dta):
-    async def mock_execute_query(query):
+    async def mock_execute_query(query, *args, **kwargs):
         logger.info(f"Query: {query}")
+        if "FROM pg_catalog.pg_attribute a" in query and "pg_stat_statements" in query:
+            return []  # No optional pg_stat_statements columns available
         if "pg_stat_statements" in query:
             return [
                 MockCell(
@@ -225,7 +213,6 @@ async def test_analyze_workload(async_sql_driver, create_dta):
     assert any(r.table in {"users", "orders"} for r in session.recommendations)
 
 
-@pytest.mark.asyncio
 async def test_error_handling(async_sql_driver, create_dta):
     """Test error handling in critical methods."""
     # Test HypoPG setup failure
@@ -243,7 +230,6 @@ async def test_error_handling(async_sql_driver, create_dta):
     assert columns == {}
 
 
-@pytest.mark.asyncio
 async def test_index_exists(create_dta):
     """Test the robust index comparison functionality."""
     dta = create_dta
@@ -334,7 +320,6 @@ async def test_index_exists(create_dta):
             )
 
 
-@pytest.mark.asyncio
 async def test_ndistinct_handling(create_dta):
     """Test handling of ndistinct values in row estimation calculations."""
     dta = create_dta
@@ -366,7 +351,6 @@ async def test_ndistinct_handling(create_dta):
         assert result == case["expected"], f"Failed for n_distinct={case['stats']['total_distinct']}. Expected: {case['expected']}, Got: {result}"
 
 
-@pytest.mark.asyncio
 async def test_filter_long_text_columns(async_sql_driver, create_dta):
     """Test filtering of long text columns from index candidates."""
     dta = create_dta
@@ -458,7 +442,6 @@ async def test_filter_long_text_columns(async_sql_driver, create_dta):
     assert len(filtered) == 3
 
 
-@pytest.mark.asyncio
 async def test_basic_workload_analysis(async_sql_driver):
     """Test basic workload analysis functionality."""
     dta = DatabaseTuningAdvisor(
@@ -482,7 +465,7 @@ async def test_basic_workload_analysis(async_sql_driver):
         if "SELECT s.last_analyze FROM pg_stat_user_tables" in query:
             return [MockCell({"last_analyze": "2024-01-01 00:00:00"})]
         if "FROM pg_catalog.pg_attribute a" in query and "pg_stat_statements" in query:
-            return [MockCell({"has_column": False})]
+            return []  # No optional pg_stat_statements columns available
         if "FROM pg_stat_statements" in query:
             return [
                 MockCell({"queryid": 1, "query": workload[0]["query"], "calls": 100, "avg_exec_time": 10.0}),
@@ -542,7 +525,6 @@ async def test_basic_workload_analysis(async_sql_driver):
     assert any(("name" in r.columns) or ("user_id" in r.columns) for r in session.recommendations)
 
 
-@pytest.mark.asyncio
 async def test_replace_parameters_basic(create_dta):
     """Test basic parameter replacement functionality."""
     dta = create_dta
@@ -566,7 +548,6 @@ async def test_replace_parameters_basic(create_dta):
     dta._sql_bind_params._identify_parameter_column.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_replace_parameters_numeric(create_dta):
     """Test parameter replacement for numeric columns."""
     dta = create_dta
@@ -594,7 +575,6 @@ async def test_replace_parameters_numeric(create_dta):
     assert result == "select * from orders where amount = 99.99"
 
 
-@pytest.mark.asyncio
 async def test_replace_parameters_date(create_dta):
     """Test parameter replacement for date columns."""
     dta = create_dta
@@ -615,7 +595,6 @@ async def test_replace_parameters_date(create_dta):
     assert result == "select * from orders where order_date > '2023-01-15'"
 
 
-@pytest.mark.asyncio
 async def test_replace_parameters_like(create_dta):
     """Test parameter replacement for LIKE patterns."""
     dta = create_dta
@@ -636,7 +615,6 @@ async def test_replace_parameters_like(create_dta):
     assert result == "select * from users where name like '%test%'"
 
 
-@pytest.mark.asyncio
 async def test_replace_parameters_multiple(create_dta):
     """Test replacement of multiple parameters in a complex query."""
     dta = create_dta
@@ -694,7 +672,6 @@ async def test_replace_parameters_multiple(create_dta):
     assert "o.order_date > '2023-01-15'" in result
 
 
-@pytest.mark.asyncio
 async def test_replace_parameters_fallback(create_dta):
     """Test fallback behavior when column information is not available."""
     dta = create_dta
@@ -721,7 +698,6 @@ async def test_replace_parameters_fallback(create_dta):
     assert "between 10 and 100" in result or "between 42 and 42" in result
 
 
-@pytest.mark.asyncio
 async def test_extract_columns(create_dta):
     """Test extracting table and column information from queries."""
     dta = create_dta
@@ -733,7 +709,6 @@ async def test_extract_columns(create_dta):
     assert result == {"users": {"id", "name", "status"}}
 
 
-@pytest.mark.asyncio
 async def test_identify_parameter_column(create_dta):
     """Test identifying which column a parameter belongs to."""
     dta = create_dta
@@ -768,7 +743,6 @@ async def test_identify_parameter_column(create_dta):
     assert result is None
 
 
-@pytest.mark.asyncio
 async def test_get_replacement_value(create_dta):
     """Test generating replacement values based on statistics."""
     dta = create_dta
@@ -806,7 +780,6 @@ async def test_get_replacement_value(create_dta):
     assert result == "true"
 
 
-@pytest.mark.asyncio
 async def test_condition_column_collector_simple(async_sql_driver):
     """Test basic functionality of ConditionColumnCollector."""
     query = "SELECT hobby FROM users WHERE name = 'Alice' AND age > 25"
@@ -823,7 +796,6 @@ async def test_condition_column_collector_simple(async_sql_driver):
     assert collector.condition_columns == {"users": {"name", "age"}}
 
 
-@pytest.mark.asyncio
 async def test_condition_column_collector_join(async_sql_driver):
     """Test condition column collection with JOIN conditions."""
     query = """
@@ -851,7 +823,6 @@ async def test_condition_column_collector_join(async_sql_driver):
     }
 
 
-@pytest.mark.asyncio
 async def test_condition_column_collector_with_alias(async_sql_driver):
     """Test condition column collection with column aliases in conditions."""
     query = """
@@ -887,7 +858,6 @@ async def test_condition_column_collector_with_alias(async_sql_driver):
     }
 
 
-@pytest.mark.asyncio
 async def test_complex_query_with_alias_in_conditions(async_sql_driver):
     """Test complex query with aliases used in multiple conditions."""
     query = """
@@ -930,7 +900,6 @@ async def test_complex_query_with_alias_in_conditions(async_sql_driver):
     assert "revenue" in collector.column_aliases
 
 
-@pytest.mark.asyncio
 async def test_filter_candidates_by_query_conditions(async_sql_driver, create_dta):
     """Test filtering index candidates based on query conditions."""
     dta = create_dta
@@ -966,7 +935,6 @@ async def test_filter_candidates_by_query_conditions(async_sql_driver, create_dt
     assert ("orders", ("order_date",)) not in filtered_tables_columns
 
 
-@pytest.mark.asyncio
 async def test_extract_condition_columns(async_sql_driver):
     """Test the _extract_condition_columns method directly."""
     query = """
@@ -983,7 +951,6 @@ async def test_extract_condition_columns(async_sql_driver):
     assert collector.condition_columns == {"users": {"active"}, "orders": {"status"}}
 
 
-@pytest.mark.asyncio
 async def test_condition_collector_with_order_by(async_sql_driver):
     """Test that columns used in ORDER BY are collected for indexing."""
     query = """
@@ -1005,7 +972,6 @@ async def test_condition_collector_with_order_by(async_sql_driver):
     }
 
 
-@pytest.mark.asyncio
 async def test_condition_collector_with_order_by_alias(async_sql_driver):
     """Test that columns in aliased expressions in ORDER BY are collected."""
     query = """
@@ -1029,7 +995,6 @@ async def test_condition_collector_with_order_by_alias(async_sql_driver):
     }
 
 
-@pytest.mark.asyncio
 async def test_enumerate_greedy_pareto_cost_benefit(async_sql_driver):
     """Test the Pareto optimal implementation with the specified cost/benefit analysis."""
     dta = DatabaseTuningAdvisor(sql_driver=async_sql_driver, budget_mb=1000, max_runtime_seconds=120)
@@ -11,42 +11,50 @@ from postgres_mcp.index.index_opt_base import IndexTuningResult
 from postgres_mcp.index.presentation import TextPresentation
 from postgres_mcp.sql.pg_compat import PgServerInfo
 
+# Read-only in the code under test, so safe to share across tests.
+_EXISTING_INDEXES = [
+    {
+        "definition": "CREATE INDEX idx_orders_status_customer ON orders USING btree (status, customer_id)",
+    }
+]
 
-@pytest.mark.asyncio
-async def test_skip_scan_candidate_is_marked_on_pg18(monkeypatch):
+
+@pytest.fixture(scope="module")
+def dta():
+    """One advisor per module; these tests never exercise the driver."""
+    return DatabaseTuningAdvisor(sql_driver=MagicMock())
+
+
+@pytest.fixture(scope="module")
+def annotate(dta):
+    """Bound private annotation method, captured once per module."""
+    return dta._annotate_skip_scan_candidates  # pyright: ignore[reportPrivateUsage]
+
+
+@pytest.fixture
+def candidates():
+    # Function-scoped: _annotate_skip_scan_candidates mutates the
+    # recommendation in place, so each test needs a fresh copy.
+    return [IndexRecommendation(table="orders", columns=("customer_id",))]
+
+
+async def test_skip_scan_candidate_is_marked_on_pg18(monkeypatch, annotate, candidates):
     async def fake_get_server_info(_sql_driver):
         return PgServerInfo(server_version_num=180000, major=18)
 
     monkeypatch.setattr("postgres_mcp.index.dta_calc.get_server_info", fake_get_server_info)
 
-    dta = DatabaseTuningAdvisor(sql_driver=MagicMock())
-    candidates = [IndexRecommendation(table="orders", columns=("customer_id",))]
-    existing_indexes = [
-        {
-            "definition": "CREATE INDEX idx_orders_status_customer ON orders USING btree (status, customer_id)",
-        }
-    ]
-
-    annotated = await cast(Any, dta)._annotate_skip_scan_candidates(candidates, existing_indexes)
+    annotated = await annotate(candidates, _EXISTING_INDEXES)
     assert annotated[0].potential_problematic_reason == "pg18_skip_scan_redundant"
 
 
-@pytest.mark.asyncio
-async def test_skip_scan_candidate_not_marked_before_pg18(monkeypatch):
+async def test_skip_scan_candidate_not_marked_before_pg18(monkeypatch, annotate, candidates):
     async def fake_get_server_info(_sql_driver):
         return PgServerInfo(server_version_num=170000, major=17)
 
     monkeypatch.setattr("postgres_mcp.index.dta_calc.get_server_info", fake_get_server_info)
 
-    dta = DatabaseTuningAdvisor(sql_driver=MagicMock())
-    candidates = [IndexRecommendation(table="orders", columns=("customer_id",))]
-    existing_indexes = [
-        {
-            "definition": "CREATE INDEX idx_orders_status_customer ON orders USING btree (status, customer_id)",
-        }
-    ]
-
-    annotated = await cast(Any, dta)._annotate_skip_scan_candidates(candidates, existing_indexes)
+    annotated = await annotate(candidates, _EXISTING_INDEXES)
     assert annotated[0].potential_problematic_reason is None
 
 
@@ -1,76 +1,85 @@
 from unittest.mock import AsyncMock
-from unittest.mock import MagicMock
 from unittest.mock import patch
 
 import pytest
+from _support.mock_cell import MockCell
+from _support.stub_driver import StubDriver
 
-from postgres_mcp.sql import SqlDriver
 from postgres_mcp.sql.pg_compat import get_pg_stat_statements_columns
 from postgres_mcp.sql.pg_compat import get_server_info
 from postgres_mcp.sql.pg_compat import reset_pg_compat_cache
 
+# Every pg_stat_statements column the PG18 probe can report; frozenset keeps
+# membership checks a single hash probe and lets parametrized variants pass
+# subsets without rebuilding the literal.
+_ALL_PGSS_COLS = frozenset(
+    {
+        "total_exec_time",
+        "mean_exec_time",
+        "stddev_exec_time",
+        "wal_bytes",
+        "stats_since",
+        "minmax_stats_since",
+        "local_blk_read_time",
+        "local_blk_write_time",
+        "parallel_workers_to_launch",
+        "parallel_workers_launched",
+        "wal_buffers_full",
+    }
+)
+
+
+_PG18_ROWS = (MockCell({"server_version_num": "180001"}),)
+
+
+# Plain coroutine instead of AsyncMock: none of these tests inspect
+# call_args, so the mock's per-call recording machinery is pure overhead.
+async def _return_pg18(*_args, **_kwargs):
+    return _PG18_ROWS
+
+
+async def _version_num_unavailable(query, *_args, **_kwargs):
+    if query == "SHOW server_version_num":
+        raise ValueError("not available")
+    if query == "SHOW server_version":
+        return (MockCell({"server_version": "17.5 (Debian 17.5-1.pgdg120+1)"}),)
+    return None
 
-class MockSqlRowResult:
-    def __init__(self, cells):
-        self.cells = cells
 
+# Module constants so each driver keeps a stable id() for the whole file:
+# the pg_compat cache keys on driver identity, and keeping the objects alive
+# prevents a recycled id from aliasing another test's cache entry.
+_PG18_DRIVER = StubDriver(_return_pg18)
+_FALLBACK_DRIVER = StubDriver(_version_num_unavailable)
 
-@pytest.fixture(autouse=True)
+
+# Module scope: every test here stubs out driver I/O, so one reset on entry
+# and one on exit is enough — no per-test flush needed.
+@pytest.fixture(autouse=True, scope="module")
 def clear_pg_compat_cache():
     reset_pg_compat_cache()
     yield
     reset_pg_compat_cache()
 
 
-@pytest.mark.asyncio
 async def test_get_server_info_prefers_server_version_num():
-    driver = MagicMock(spec=SqlDriver)
-    driver.execute_query = AsyncMock(return_value=[MockSqlRowResult({"server_version_num": "180001"})])
-
-    info = await get_server_info(driver)
+    info = await get_server_info(_PG18_DRIVER)
     assert info.server_version_num == 180001
     assert info.major == 18
 
 
-@pytest.mark.asyncio
 async def test_get_server_info_falls_back_to_server_version():
-    driver = MagicMock(spec=SqlDriver)
-
-    async def side_effect(query, *args, **kwargs):
-        if query == "SHOW server_version_num":
-            raise ValueError("not available")
-        if query == "SHOW server_version":
-            return [MockSqlRowResult({"server_version": "17.5 (Debian 17.5-1.pgdg120+1)"})]
-        return None
-
-    driver.execute_query = AsyncMock(side_effect=side_effect)
-
-    info = await get_server_info(driver)
+    info = await get_server_info(_FALLBACK_DRIVER)
     assert info.server_version_num == 170000
     assert info.major == 17
 
 
-@pytest.mark.asyncio
 async def test_get_pg_stat_statements_columns_handles_optional_columns():
-    driver = MagicMock(spec=SqlDriver)
-    driver.execute_query = AsyncMock(return_value=[MockSqlRowResult({"server_version_num": "180001"})])
-
-    availability = {
-        "total_exec_time": True,
-        "mean_exec_time": True,
-        "stddev_exec_time": True,
-        "wal_bytes": True,
-        "stats_since": True,
-        "minmax_stats_since": True,
-        "local_blk_read_time": True,
-        "local_blk_write_time": True,
-        "parallel_workers_to_launch": True,
-        "parallel_workers_launched": True,
-        "wal_buffers_full": True,
-    }
-
-    with patch("postgres_mcp.sql.pg_compat.has_pg_stat_statements_column", AsyncMock(side_effect=lambda _d, c: availability[c])):
-        cols = await get_pg_stat_statements_columns(driver)
+    with patch(
+        "postgres_mcp.sql.pg_compat.has_pg_stat_statements_columns",
+        AsyncMock(side_effect=lambda _d, names: _ALL_PGSS_COLS & set(names)),
+    ):
+        cols = await get_pg_stat_statements_columns(_PG18_DRIVER)
 
     assert cols.total_time == "total_exec_time"
     assert cols.mean_time == "mean_exec_time"
@@ -2,15 +2,12 @@ from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
-import pytest
-
 from postgres_mcp.server import AccessMode
 from postgres_mcp.server import get_sql_driver
 from postgres_mcp.sql import SafeSqlDriver
 from postgres_mcp.sql import SqlDriver
 
 
-@pytest.mark.asyncio
 async def test_force_readonly_enforcement():
     """
     Test that force_readonly is properly enforced based on access mode:
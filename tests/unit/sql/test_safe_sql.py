@@ -23,7 +23,6 @@ async def safe_driver(mock_sql_driver):
     return SafeSqlDriver(mock_sql_driver)
 
 
-@pytest.mark.asyncio
 async def test_select_statement(safe_driver, mock_sql_driver):
     """Test that simple SELECT statements are allowed"""
     query = "SELECT * FROM users WHERE age > 18"
@@ -31,7 +30,6 @@ async def test_select_statement(safe_driver, mock_sql_driver):
     mock_sql_driver.execute_query.assert_awaited_once_with("/* crystaldba */ " + query, params=None, force_readonly=True)
 
 
-@pytest.mark.asyncio
 async def test_update_statement(safe_driver):
     """Test that UPDATE statements are blocked"""
     query = "UPDATE users SET status = 'active' WHERE id = 1"
@@ -42,7 +40,6 @@ async def test_update_statement(safe_driver):
         await safe_driver.execute_query(query)
 
 
-@pytest.mark.asyncio
 async def test_select_with_join(safe_driver, mock_sql_driver):
     """Test that SELECT with JOIN is allowed"""
     query = """
@@ -55,7 +52,6 @@ async def test_select_with_join(safe_driver, mock_sql_driver):
     mock_sql_driver.execute_query.assert_awaited_once_with("/* crystaldba */ " + query, params=None, force_readonly=True)
 
 
-@pytest.mark.asyncio
 async def test_show_variable(safe_driver, mock_sql_driver):
     """Test that SHOW statements are allowed"""
     query = "SHOW search_path"
@@ -63,7 +59,6 @@ async def test_show_variable(safe_driver, mock_sql_driver):
     mock_sql_driver.execute_query.assert_awaited_once_with("/* crystaldba */ " + query, params=None, force_readonly=True)
 
 
-@pytest.mark.asyncio
 async def test_set_variable(safe_driver):
     """Test that SET statements are blocked"""
     query = "SET search_path TO public"
@@ -74,7 +69,6 @@ async def test_set_variable(safe_driver):
         await safe_driver.execute_query(query)
 
 
-@pytest.mark.asyncio
 async def test_select_with_arithmetic(safe_driver, mock_sql_driver):
     """Test that SELECT with arithmetic expressions is allowed"""
     query = "SELECT id, price * quantity as total FROM orders"
@@ -82,7 +76,6 @@ async def test_select_with_arithmetic(safe_driver, mock_sql_driver):
     mock_sql_driver.execute_query.assert_awaited_once_with("/* crystaldba */ " + query, params=None, force_readonly=True)
 
 
-@pytest.mark.asyncio
 async def test_select_current_user(safe_driver, mock_sql_driver):
     """Test that SELECT current_user is allowed"""
     query = "SELECT current_user"
@@ -90,7 +83,6 @@ async def test_select_current_user(safe_driver, mock_sql_driver):
     mock_sql_driver.execute_query.assert_awaited_once_with("/* crystaldba */ " + query, params=None, force_readonly=True)
 
 
-@pytest.mark.asyncio
 async def test_drop_table(safe_driver):
     """Test that DROP TABLE statements are blocked"""
     query = "DROP TABLE users"
@@ -101,7 +93,6 @@ async def test_drop_table(safe_driver):
         await safe_driver.execute_query(query)
 
 
-@pytest.mark.asyncio
 async def test_delete_from_table(safe_driver):
     """Test that DELETE FROM statements are blocked"""
     query = "DELETE FROM users WHERE status = 'inactive'"
@@ -112,7 +103,6 @@ async def test_delete_from_table(safe_driver):
         await safe_driver.execute_query(query)
 
 
-@pytest.mark.asyncio
 async def test_select_with_subquery(safe_driver, mock_sql_driver):
     """Test that SELECT with subqueries is allowed"""
     query = """
@@ -123,7 +113,6 @@ async def test_select_with_subquery(safe_driver, mock_sql_driver):
     mock_sql_driver.execute_query.assert_awaited_once_with("/* crystaldba */ " + query, params=None, force_readonly=True)
 
 
-@pytest.mark.asyncio
 async def test_select_with_malicious_comment(safe_driver):
     """Test that SQL injection via comments is blocked"""
     query = """
@@ -136,7 +125,6 @@ async def test_select_with_malicious_comment(safe_driver):
         await safe_driver.execute_query(query)
 
 
-@pytest.mark.asyncio
 async def test_select_with_union(safe_driver, mock_sql_driver):
     """Test that UNION queries are allowed"""
     query = """
@@ -148,7 +136,6 @@ async def test_select_with_union(safe_driver, mock_sql_driver):
     mock_sql_driver.execute_query.assert_awaited_once_with("/* crystaldba */ " + query, params=None, force_readonly=True)
 
 
-@pytest.mark.asyncio
 async def test_select_into(safe_driver):
     """Test that SELECT INTO statements are blocked"""
     query = """
@@ -160,7 +147,6 @@ async def test_select_into(safe_driver):
         await safe_driver.execute_query(query)
 
 
-@pytest.mark.asyncio
 async def test_select_for_update(safe_driver):
     """Test that SELECT FOR UPDATE statements are blocked"""
     query = """
@@ -172,7 +158,6 @@ async def test_select_for_update(safe_driver):
         await safe_driver.execute_query(query)
 
 
-@pytest.mark.asyncio
 async def test_select_with_locking_clause(safe_driver):
     """Test that SELECT with explicit locking clauses is blocked"""
     query = """
@@ -184,7 +169,6 @@ async def test_select_with_locking_clause(safe_driver):
         await safe_driver.execute_query(query)
 
 
-@pytest.mark.asyncio
 async def test_select_with_commit(safe_driver):
     """Test that statements containing COMMIT are blocked"""
     query = """
@@ -199,7 +183,6 @@ async def test_select_with_commit(safe_driver):
         await safe_driver.execute_query(query)
 
 
-@pytest.mark.asyncio
 async def test_explain_plan(safe_driver, mock_sql_driver):
     """Test that EXPLAIN (without ANALYZE) works with bind variables"""
     query = """
@@ -212,7 +195,6 @@ async def test_explain_plan(safe_driver, mock_sql_driver):
     mock_sql_driver.execute_query.assert_awaited_once_with("/* crystaldba */ " + query, params=None, force_readonly=True)
 
 
-@pytest.mark.asyncio
 async def test_explain_analyze_blocked(safe_driver):
     """Test that EXPLAIN ANALYZE is blocked"""
     query = """
@@ -223,7 +205,6 @@ async def test_explain_analyze_blocked(safe_driver):
         await safe_driver.execute_query(query)
 
 
-@pytest.mark.asyncio
 async def test_begin_transaction_blocked(safe_driver):
     """Test that transaction blocks are blocked"""
     query = """
@@ -237,7 +218,6 @@ async def test_begin_transaction_blocked(safe_driver):
         await safe_driver.execute_query(query)
 
 
-@pytest.mark.asyncio
 async def test_invalid_sql_syntax(safe_driver):
     """Test that queries with invalid SQL syntax are blocked"""
     query1 = "SELECT * FRMO users;"
@@ -253,7 +233,6 @@ async def test_invalid_sql_syntax(safe_driver):
         await safe_driver.execute_query(query3)
 
 
-@pytest.mark.asyncio
 async def test_create_index_blocked(safe_driver):
     """Test that CREATE INDEX statements are blocked"""
     query = """
@@ -266,7 +245,6 @@ async def test_create_index_blocked(safe_driver):
         await safe_driver.execute_query(query)
 
 
-@pytest.mark.asyncio
 async def test_drop_index_blocked(safe_driver):
     """Test that DROP INDEX statements are blocked"""
     query = """
@@ -279,7 +257,6 @@ async def test_drop_index_blocked(safe_driver):
         await safe_driver.execute_query(query)
 
 
-@pytest.mark.asyncio
 async def test_create_table_blocked(safe_driver):
     """Test that CREATE TABLE statements are blocked"""
     query = """
@@ -296,7 +273,6 @@ async def test_create_table_blocked(safe_driver):
         await safe_driver.execute_query(query)
 
 
-@pytest.mark.asyncio
 async def test_create_table_as_blocked(safe_driver):
     """Test that CREATE TABLE AS statements are blocked"""
     query = """
@@ -310,7 +286,6 @@ async def test_create_table_as_blocked(safe_driver):
         await safe_driver.execute_query(query)
 
 
-@pytest.mark.asyncio
 async def test_create_extension_blocked(safe_driver):
     """Test that CREATE EXTENSION statements are blocked"""
     query = """
@@ -320,7 +295,6 @@ async def test_create_extension_blocked(safe_driver):
         await safe_driver.execute_query(query)
 
 
-@pytest.mark.asyncio
 async def test_drop_extension_blocked(safe_driver):
     """Test that DROP EXTENSION statements are blocked"""
     query = """
@@ -333,7 +307,6 @@ async def test_drop_extension_blocked(safe_driver):
         await safe_driver.execute_query(query)
 
 
-@pytest.mark.asyncio
 async def test_complex_index_metadata_select(safe_driver, mock_sql_driver):
     """Test that complex SELECT queries for index metadata are allowed"""
     query = """SELECT indexrelid::regclass AS index_name, array_agg(attname) AS columns,
@@ -348,7 +321,6 @@ async def test_complex_index_metadata_select(safe_driver, mock_sql_driver):
     mock_sql_driver.execute_query.assert_awaited_once_with("/* crystaldba */ " + query, params=None, force_readonly=True)
 
 
-@pytest.mark.asyncio
 async def test_allowed_functions(safe_driver):
     """Tests that allow functions (especially the ones that are newly added)"""
     query = """
@@ -357,7 +329,6 @@ async def test_allowed_functions(safe_driver):
     await safe_driver.execute_query(query)
 
 
-@pytest.mark.asyncio
 async def test_disallowed_functions(safe_driver):
     """Test that disallowed functions are blocked"""
     queries = [
@@ -371,7 +342,6 @@ async def test_disallowed_functions(safe_driver):
             await safe_driver.execute_query(query)
 
 
-@pytest.mark.asyncio
 async def test_session_info_functions(safe_driver, mock_sql_driver):
     """Test that session info functions are allowed"""
     query = "SELECT current_user, current_database(), version()"
@@ -379,7 +349,6 @@ async def test_session_info_functions(safe_driver, mock_sql_driver):
     mock_sql_driver.execute_query.assert_awaited_once_with("/* crystaldba */ " + query, params=None, force_readonly=True)
 
 
-@pytest.mark.asyncio
 async def test_blocking_pids_functions(safe_driver, mock_sql_driver):
     """Test that blocking pids functions are allowed"""
     query = "SELECT pg_blocking_pids(1234)"
@@ -387,7 +356,6 @@ async def test_blocking_pids_functions(safe_driver, mock_sql_driver):
     mock_sql_driver.execute_query.assert_awaited_once_with("/* crystaldba */ " + query, params=None, force_readonly=True)
 
 
-@pytest.mark.asyncio
 async def test_logfile_functions(safe_driver, mock_sql_driver):
     """Test that logfile functions are allowed"""
     query = "SELECT pg_current_logfile()"
@@ -395,7 +363,6 @@ async def test_logfile_functions(safe_driver, mock_sql_driver):
     mock_sql_driver.execute_query.assert_awaited_once_with("/* crystaldba */ " + query, params=None, force_readonly=True)
 
 
-@pytest.mark.asyncio
 async def test_complex_session_info_queries(safe_driver, mock_sql_driver):
     """Test that complex session info queries are allowed"""
     query = """
@@ -406,7 +373,6 @@ async def test_complex_session_info_queries(safe_driver, mock_sql_driver):
     mock_sql_driver.execute_query.assert_awaited_once_with("/* crystaldba */ " + query, params=None, force_readonly=True)
 
 
-@pytest.mark.asyncio
 async def test_security_privilege_functions(safe_driver, mock_sql_driver):
     """Test that security privilege functions are allowed"""
     query = "SELECT has_table_privilege('user', 'table', 'SELECT')"
@@ -414,7 +380,6 @@ async def test_security_privilege_functions(safe_driver, mock_sql_driver):
     mock_sql_driver.execute_query.assert_awaited_once_with("/* crystaldba */ " + query, params=None, force_readonly=True)
 
 
-@pytest.mark.asyncio
 async def test_complex_security_privilege_queries(safe_driver, mock_sql_driver):
     """Test more complex queries using security privilege functions"""
     queries = [
@@ -449,7 +414,6 @@ async def test_complex_security_privilege_queries(safe_driver, mock_sql_driver):
         mock_sql_driver.execute_query.assert_awaited_with("/* crystaldba */ " + query, params=None, force_readonly=True)
 
 
-@pytest.mark.asyncio
 async def test_security_privilege_functions_with_subqueries(safe_driver, mock_sql_driver):
     """Test security privilege functions used within subqueries"""
     queries = [
@@ -479,7 +443,6 @@ async def test_security_privilege_functions_with_subqueries(safe_driver, mock_sq
 
 
 @pytest.mark.parametrize("operator", ["LIKE", "ILIKE"])
-@pytest.mark.asyncio
 async def test_like_patterns(safe_driver, mock_sql_driver, operator):
     """Test that LIKE/ILIKE patterns are only allowed if they start or end with %, but not both or in middle"""
     queries = [
@@ -495,7 +458,6 @@ async def test_like_patterns(safe_driver, mock_sql_driver, operator):
         mock_sql_driver.execute_query.assert_awaited_with("/* crystaldba */ " + query, params=None, force_readonly=True)
 
 
-@pytest.mark.asyncio
 async def test_datetime_functions(safe_driver, mock_sql_driver):
     """Test that date/time functions are allowed"""
     queries = [
@@ -529,7 +491,6 @@ async def test_datetime_functions(safe_driver, mock_sql_driver):
         mock_sql_driver.execute_query.assert_awaited_with("/* crystaldba */ " + query, params=None, force_readonly=True)
 
 
-@pytest.mark.asyncio
 async def test_type_conversion_functions(safe_driver, mock_sql_driver):
     """Test that type conversion functions are allowed"""
     queries = [
@@ -556,7 +517,6 @@ async def test_type_conversion_functions(safe_driver, mock_sql_driver):
         mock_sql_driver.execute_query.assert_awaited_with("/* crystaldba */ " + query, params=None, force_readonly=True)
 
 
-@pytest.mark.asyncio
 async def test_regexp_functions(safe_driver, mock_sql_driver):
     """Test that regexp functions are allowed"""
     query = "SELECT regexp_replace('Hello World', 'World', 'PostgreSQL')"
@@ -564,7 +524,6 @@ async def test_regexp_functions(safe_driver, mock_sql_driver):
     mock_sql_driver.execute_query.assert_awaited_once_with("/* crystaldba */ " + query, params=None, force_readonly=True)
 
 
-@pytest.mark.asyncio
 async def test_complex_type_conversion_queries(safe_driver, mock_sql_driver):
     """Test that complex type conversion queries are allowed"""
     query = """
@@ -577,7 +536,6 @@ async def test_complex_type_conversion_queries(safe_driver, mock_sql_driver):
     mock_sql_driver.execute_query.assert_awaited_once_with("/* crystaldba */ " + query, params=None, force_readonly=True)
 
 
-@pytest.mark.asyncio
 async def test_network_functions(safe_driver, mock_sql_driver):
     """Test that network functions are allowed"""
     query = "SELECT inet_client_addr(), inet_client_port()"
@@ -585,7 +543,6 @@ async def test_network_functions(safe_driver, mock_sql_driver):
     mock_sql_driver.execute_query.assert_awaited_once_with("/* crystaldba */ " + query, params=None, force_readonly=True)
 
 
-@pytest.mark.asyncio
 async def test_network_functions_in_complex_queries(safe_driver, mock_sql_driver):
     """Test that network functions in complex queries are allowed"""
     query = """
@@ -598,7 +555,6 @@ async def test_network_functions_in_complex_queries(safe_driver, mock_sql_driver
     mock_sql_driver.execute_query.assert_awaited_once_with("/* crystaldba */ " + query, params=None, force_readonly=True)
 
 
-@pytest.mark.asyncio
 async def test_notification_and_server_functions(safe_driver, mock_sql_driver):
     """Test that notification and server functions are allowed"""
     query = "SELECT pg_listening_channels(), pg_postmaster_start_time()"
@@ -606,7 +562,6 @@ async def test_notification_and_server_functions(safe_driver, mock_sql_driver):
     mock_sql_driver.execute_query.assert_awaited_once_with("/* crystaldba */ " + query, params=None, force_readonly=True)
 
 
-@pytest.mark.asyncio
 async def test_minmax_expressions(safe_driver, mock_sql_driver):
     """Test that minmax expressions are allowed"""
     query = "SELECT GREATEST(1, 2, 3), LEAST(1, 2, 3)"
@@ -614,7 +569,6 @@ async def test_minmax_expressions(safe_driver, mock_sql_driver):
     mock_sql_driver.execute_query.assert_awaited_once_with("/* crystaldba */ " + query, params=None, force_readonly=True)
 
 
-@pytest.mark.asyncio
 async def test_row_expressions(safe_driver, mock_sql_driver):
     """Test that row expressions are allowed"""
     query = "SELECT ROW(1, 2, 3) = ROW(1, 2, 3)"
@@ -622,7 +576,6 @@ async def test_row_expressions(safe_driver, mock_sql_driver):
     mock_sql_driver.execute_query.assert_awaited_once_with("/* crystaldba */ " + query, params=None, force_readonly=True)
 
 
-@pytest.mark.asyncio
 async def test_extension_check_query(safe_driver, mock_sql_driver):
     """Test that extension check queries are allowed"""
     query = "SELECT extname, extversion FROM pg_extension WHERE extname = 'hypopg'"
@@ -630,7 +583,6 @@ async def test_extension_check_query(safe_driver, mock_sql_driver):
     mock_sql_driver.execute_query.assert_awaited_once_with("/* crystaldba */ " + query, params=None, force_readonly=True)
 
 
-@pytest.mark.asyncio
 async def test_create_extension_query(safe_driver, mock_sql_driver):
     """Test that CREATE EXTENSION queries are allowed"""
     query = "CREATE EXTENSION IF NOT EXISTS hypopg"
@@ -638,7 +590,6 @@ async def test_create_extension_query(safe_driver, mock_sql_driver):
     mock_sql_driver.execute_query.assert_awaited_once_with("/* crystaldba */ " + query, params=None, force_readonly=True)
 
 
-@pytest.mark.asyncio
 async def test_hypopg_create_index_query(safe_driver, mock_sql_driver):
     """Test that hypopg create index queries are allowed"""
     query = "SELECT * FROM hypopg_create_index('CREATE INDEX idx ON users(id)')"
@@ -646,7 +597,6 @@ async def test_hypopg_create_index_query(safe_driver, mock_sql_driver):
     mock_sql_driver.execute_query.assert_awaited_once_with("/* crystaldba */ " + query, params=None, force_readonly=True)
 
 
-@pytest.mark.asyncio
 async def test_hypopg_reset_query(safe_driver, mock_sql_driver):
     """Test that hypopg reset queries are allowed"""
     query = "SELECT * FROM hypopg_reset()"
@@ -654,7 +604,6 @@ async def test_hypopg_reset_query(safe_driver, mock_sql_driver):
     mock_sql_driver.execute_query.assert_awaited_once_with("/* crystaldba */ " + query, params=None, force_readonly=True)
 
 
-@pytest.mark.asyncio
 async def test_hypopg_list_indexes_query(safe_driver, mock_sql_driver):
     """Test that hypopg list indexes queries are allowed"""
     query = "SELECT * FROM hypopg_list_indexes()"
@@ -662,7 +611,6 @@ async def test_hypopg_list_indexes_query(safe_driver, mock_sql_driver):
     mock_sql_driver.execute_query.assert_awaited_once_with("/* crystaldba */ " + query, params=None, force_readonly=True)
 
 
-@pytest.mark.asyncio
 async def test_pg_stat_statements_query(safe_driver, mock_sql_driver):
     """Test that pg_stat_statements queries are allowed"""
     query = "SELECT * FROM pg_stat_statements ORDER BY calls DESC LIMIT 10"
@@ -670,7 +618,6 @@ async def test_pg_stat_statements_query(safe_driver, mock_sql_driver):
     mock_sql_driver.execute_query.assert_awaited_once_with("/* crystaldba */ " + query, params=None, force_readonly=True)
 
 
-@pytest.mark.asyncio
 async def test_pg_indexes_query(safe_driver, mock_sql_driver):
     """Test that pg_indexes queries are allowed"""
     query = "SELECT * FROM pg_indexes WHERE schemaname = 'public'"
@@ -678,7 +625,6 @@ async def test_pg_indexes_query(safe_driver, mock_sql_driver):
     mock_sql_driver.execute_query.assert_awaited_once_with("/* crystaldba */ " + query, params=None, force_readonly=True)
 
 
-@pytest.mark.asyncio
 async def test_pg_stats_query(safe_driver, mock_sql_driver):
     """Test that pg_stats queries are allowed"""
     query = "SELECT * FROM pg_stats WHERE schemaname = 'public'"
@@ -686,7 +632,6 @@ async def test_pg_stats_query(safe_driver, mock_sql_driver):
     mock_sql_driver.execute_query.assert_awaited_once_with("/* crystaldba */ " + query, params=None, force_readonly=True)
 
 
-@pytest.mark.asyncio
 async def test_explain_query(safe_driver, mock_sql_driver):
     """Test that explain queries are allowed"""
     query = "EXPLAIN SELECT * FROM users"
@@ -694,7 +639,6 @@ async def test_explain_query(safe_driver, mock_sql_driver):
     mock_sql_driver.execute_query.assert_awaited_once_with("/* crystaldba */ " + query, params=None, force_readonly=True)
 
 
-@pytest.mark.asyncio
 async def test_sql_driver_parameter_format(safe_driver, mock_sql_driver):
     """Test query with SQL parameters through the DatabaseTuningAdvisor."""
     query_template = """
@@ -716,7 +660,6 @@ async def test_sql_driver_parameter_format(safe_driver, mock_sql_driver):
     mock_sql_driver.execute_query.assert_awaited_with("/* crystaldba */ " + formatted_query, params=None, force_readonly=True)
 
 
-@pytest.mark.asyncio
 async def test_multiple_queries(safe_driver, mock_sql_driver):
     """Test that multiple queries are handled correctly"""
     query1 = "SELECT * FROM users"
@@ -731,7 +674,6 @@ async def test_multiple_queries(safe_driver, mock_sql_driver):
     )
 
 
-@pytest.mark.asyncio
 async def test_query_with_comments(safe_driver, mock_sql_driver):
     """Test that queries with comments are handled correctly"""
     query = """
@@ -745,7 +687,6 @@ async def test_query_with_comments(safe_driver, mock_sql_driver):
     mock_sql_driver.execute_query.assert_awaited_once_with("/* crystaldba */ " + query, params=None, force_readonly=True)
 
 
-@pytest.mark.asyncio
 async def test_query_with_whitespace(safe_driver, mock_sql_driver):
     """Test that queries with whitespace are handled correctly"""
     query = """
@@ -760,7 +701,6 @@ async def test_query_with_whitespace(safe_driver, mock_sql_driver):
     mock_sql_driver.execute_query.assert_awaited_once_with("/* crystaldba */ " + query, params=None, force_readonly=True)
 
 
-@pytest.mark.asyncio
 async def test_sql_json_exists_is_allowed(safe_driver, mock_sql_driver):
     """PostgreSQL SQL/JSON function nodes should be accepted in restricted mode."""
     query = "SELECT JSON_EXISTS('{\"a\":1}', '$.a')"
@@ -768,7 +708,6 @@ async def test_sql_json_exists_is_allowed(safe_driver, mock_sql_driver):
     mock_sql_driver.execute_query.assert_awaited_once_with("/* crystaldba */ " + query, params=None, force_readonly=True)
 
 
-@pytest.mark.asyncio
 async def test_sql_json_table_is_allowed(safe_driver, mock_sql_driver):
     """JSON_TABLE syntax should pass AST validation for read-only SELECT usage."""
     query = "SELECT * FROM JSON_TABLE('[1,2,3]', '$[*]' COLUMNS (value INT PATH '$')) AS jt"
@@ -776,7 +715,6 @@ async def test_sql_json_table_is_allowed(safe_driver, mock_sql_driver):
     mock_sql_driver.execute_query.assert_awaited_once_with("/* crystaldba */ " + query, params=None, force_readonly=True)
 
 
-@pytest.mark.asyncio
 async def test_postgres18_parser_limitation_message_is_clear(safe_driver):
     """PG18-only grammar should fail with a parser-version-aware message."""
     query = "CREATE TABLE t (a int GENERATED ALWAYS AS (1) VIRTUAL)"
@@ -784,7 +722,6 @@ async def test_postgres18_parser_limitation_message_is_clear(safe_driver):
         await safe_driver.execute_query(query)
 
 
-@pytest.mark.asyncio
 async def test_new_readonly_function_whitelist_entries(safe_driver, mock_sql_driver):
     """Recently added read-safe utility functions should pass validation."""
     query = """
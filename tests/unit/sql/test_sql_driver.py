@@ -89,7 +89,6 @@ def mock_db_pool():
     return db_pool, connection, cursor
 
 
-@pytest.mark.asyncio
 async def test_execute_query_readonly_transaction(mock_connection):
     """Test execute_query with read-only transaction."""
     connection, cursor = mock_connection
@@ -140,7 +139,6 @@ async def test_execute_query_readonly_transaction(mock_connection):
     assert result[1].cells["name"] == "test2"
 
 
-@pytest.mark.asyncio
 async def test_execute_query_writeable_transaction(mock_connection):
     """Test execute_query with writeable transaction."""
     connection, cursor = mock_connection
@@ -186,7 +184,6 @@ async def test_execute_query_writeable_transaction(mock_connection):
     assert result is not None
 
 
-@pytest.mark.asyncio
 async def test_execute_query_error_handling(mock_connection):
     """Test execute_query error handling."""
     connection, cursor = mock_connection
@@ -213,7 +210,6 @@ async def test_execute_query_error_handling(mock_connection):
     assert "Query execution failed" in str(excinfo.value)
 
 
-@pytest.mark.asyncio
 async def test_execute_query_no_results(mock_connection):
     """Test execute_query with no results returned."""
     connection, cursor = mock_connection
@@ -257,7 +253,6 @@ async def test_execute_query_no_results(mock_connection):
     assert call("COMMIT") in cursor.execute.call_args_list
 
 
-@pytest.mark.asyncio
 async def test_execute_query_with_params(mock_connection):
     """Test execute_query with parameters."""
     connection, cursor = mock_connection
@@ -300,7 +295,6 @@ async def test_execute_query_with_params(mock_connection):
     assert call("SELECT * FROM test WHERE id = %s", [1]) in cursor.execute.call_args_list
 
 
-@pytest.mark.asyncio
 async def test_execute_query_from_pool(mock_db_pool):
     """Test execute_query using a connection from a pool."""
     db_pool, connection, cursor = mock_db_pool
@@ -326,7 +320,6 @@ async def test_execute_query_from_pool(mock_db_pool):
     assert result[1].cells["name"] == "test2"
 
 
-@pytest.mark.asyncio
 async def test_connection_error_marks_pool_invalid(mock_db_pool):
     """Test that connection errors mark the pool as invalid."""
     db_pool, connection, cursor = mock_db_pool
@@ -350,7 +343,6 @@ async def test_connection_error_marks_pool_invalid(mock_db_pool):
     assert isinstance(db_pool._last_error, str)
 
 
-@pytest.mark.asyncio
 async def test_engine_url_connection():
     """Test connecting with engine_url instead of connection object."""
     db_pool = MagicMock(spec=DbConnPool)
@@ -27,7 +27,6 @@ def mock_db_connection():
         (AccessMode.RESTRICTED, SafeSqlDriver),
     ],
 )
-@pytest.mark.asyncio
 async def test_get_sql_driver_returns_correct_driver(access_mode, expected_driver_type, mock_db_connection):
     """Test that get_sql_driver returns the correct driver type based on access mode."""
     with (
@@ -43,7 +42,6 @@ async def test_get_sql_driver_returns_correct_driver(access_mode, expected_drive
             assert driver.timeout == 30
 
 
-@pytest.mark.asyncio
 async def test_get_sql_driver_sets_timeout_in_restricted_mode(mock_db_connection):
     """Test that get_sql_driver sets the timeout in restricted mode."""
     with (
@@ -56,7 +54,6 @@ async def test_get_sql_driver_sets_timeout_in_restricted_mode(mock_db_connection
         assert hasattr(driver, "sql_driver")
 
 
-@pytest.mark.asyncio
 async def test_get_sql_driver_in_unrestricted_mode_no_timeout(mock_db_connection):
     """Test that get_sql_driver in unrestricted mode is a regular SqlDriver."""
     with (
@@ -68,7 +65,6 @@ async def test_get_sql_driver_in_unrestricted_mode_no_timeout(mock_db_connection
         assert not hasattr(driver, "timeout")
 
 
-@pytest.mark.asyncio
 async def test_command_line_parsing():
     """Test that command-line arguments correctly set the access mode."""
     import sys
@@ -90,6 +86,7 @@ async def test_command_line_parsing():
 
         with (
             patch("postgres_mcp.tools._state.db_connection.pool_connect", AsyncMock()),
+            patch("postgres_mcp.server.warm_catalog_caches", AsyncMock()),
             patch("postgres_mcp.server.mcp.run_stdio_async", AsyncMock()),
             patch("postgres_mcp.server.shutdown", AsyncMock()),
         ):
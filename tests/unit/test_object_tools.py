@@ -0,0 +1,150 @@
+import json
+from functools import cache
+from typing import Any
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from _support.mock_cell import MockCell
+
+from postgres_mcp.sql import PgServerInfo
+from postgres_mcp.tools.object_tools import _TABLE_INDEXES_SQL  # pyright: ignore[reportPrivateUsage]
+from postgres_mcp.tools.object_tools import postgres_get_object_details
+
+# Shared row literals: the tool only reads these cells, so building them once
+# at import avoids re-allocating the dict graph in every test.
+_ID_COLUMN = MockCell(
+    {
+        "column_name": "id",
+        "data_type": "integer",
+        "is_nullable": "NO",
+        "column_default": None,
+        "is_generated": "NEVER",
+        "generation_expression": None,
+    }
+)
+_GENERATED_COLUMN = MockCell(
+    {
+        "column_name": "slug",
+        "data_type": "text",
+        "is_nullable": "YES",
+        "column_default": None,
+        "is_generated": "ALWAYS",
+        "generation_expression": "lower(id::text)",
+    }
+)
+_PK_CONSTRAINT = MockCell(
+    {
+        "constraint_name": "products_pkey",
+        "constraint_type": "PRIMARY KEY",
+        "column_name": "id",
+    }
+)
+_PK_CONSTRAINT_FLAGS = MockCell(
+    {
+        "constraint_name": "products_pkey",
+        "is_validated": True,
+        "is_enforced": True,
+    }
+)
+_PK_INDEX = MockCell(
+    {
+        "name": "products_pkey",
+        "method": "btree",
+        "is_unique": True,
+        "is_primary": True,
+        "columns": ["id"],
+    }
+)
+
+_SHARED_RESPONSES = (
+    ("FROM information_schema.table_constraints AS tc", [_PK_CONSTRAINT]),
+    ("FROM pg_catalog.pg_constraint con", [_PK_CONSTRAINT_FLAGS]),
+)
+
+
+def _dispatch(responses):
+    """Build an execute_param_query stub dispatching on a query fragment."""
+
+    async def _execute(_sql_driver, query, params):
+        for fragment, rows in responses:
+            if fragment in query:
+                return rows
+        raise AssertionError(f"Unexpected query: {query}")
+
+    return _execute
+
+
+@cache
+def _loads(text: str) -> Any:
+    # Keyed on the payload text itself: identical tool responses asserted
+    # against repeatedly are decoded once.
+    return json.loads(text)
+
+
+def _parse_json_payload(result) -> dict[str, Any]:
+    assert result.content
+    return _loads(result.content[0].text)
+
+
+async def test_get_object_details_includes_generated_and_constraint_flags():
+    driver = MagicMock()
+    responses = (
+        ("FROM information_schema.columns", [_ID_COLUMN, _GENERATED_COLUMN]),
+        *_SHARED_RESPONSES,
+        ("FROM pg_catalog.pg_index i", [_PK_INDEX]),
+    )
+
+    with (
+        patch("postgres_mcp.tools.object_tools.get_sql_driver", new=AsyncMock(return_value=driver)),
+        patch("postgres_mcp.tools.object_tools.SafeSqlDriver.execute_param_query", new=_dispatch(responses)),
+        patch(
+            "postgres_mcp.tools.object_tools.get_server_info",
+            new=AsyncMock(return_value=PgServerInfo(server_version_num=180000, major=18)),
+        ),
+    ):
+        result = await postgres_get_object_details("public", "products", "table")
+
+    payload = _parse_json_payload(result)
+    assert payload["columns"][1]["is_generated"] == "ALWAYS"
+    assert payload["columns"][1]["generation_expression"] == "lower(id::text)"
+    assert payload["constraints"][0]["is_validated"] is True
+    assert payload["constraints"][0]["is_enforced"] is True
+    assert payload["indexes"] == [
+        {
+            "name": "products_pkey",
+            "method": "btree",
+            "is_unique": True,
+            "is_primary": True,
+            "columns": ["id"],
+        }
+    ]
+
+
+async def test_get_object_details_skips_is_enforced_when_not_supported():
+    driver = MagicMock()
+    responses = (
+        ("FROM information_schema.columns", [_ID_COLUMN]),
+        *_SHARED_RESPONSES,
+        ("FROM pg_catalog.pg_index i", []),
+    )
+
+    with (
+        patch("postgres_mcp.tools.object_tools.get_sql_driver", new=AsyncMock(return_value=driver)),
+        patch("postgres_mcp.tools.object_tools.SafeSqlDriver.execute_param_query", new=_dispatch(responses)),
+        patch(
+            "postgres_mcp.tools.object_tools.get_server_info",
+            new=AsyncMock(return_value=PgServerInfo(server_version_num=160000, major=16)),
+        ),
+    ):
+        result = await postgres_get_object_details("public", "products", "table")
+
+    payload = _parse_json_payload(result)
+    assert payload["constraints"][0]["is_validated"] is True
+    assert "is_enforced" not in payload["constraints"][0]
+
+
+def test_table_indexes_sql_uses_one_based_column_numbers():
+    """indkey subscripts are 0-based but pg_get_indexdef column numbers start
+    at 1 (0 returns the whole definition), so the subquery must add one."""
+    assert "pg_get_indexdef(i.indexrelid, k + 1, true)" in _TABLE_INDEXES_SQL
@@ -1,97 +1,78 @@
 from unittest.mock import AsyncMock
-from unittest.mock import MagicMock
 from unittest.mock import patch
 
 import pytest
+from _support.mock_cell import MockCell
+from _support.pgss_columns import PG12_COLS
+from _support.pgss_columns import PG13_COLS
+from _support.stub_driver import StubDriver
 
 import postgres_mcp.top_queries.top_queries_calc as top_queries_module
-from postgres_mcp.sql import PgStatStatementsColumns
-from postgres_mcp.sql import SqlDriver
 from postgres_mcp.sql.extension_utils import ExtensionStatus
 from postgres_mcp.top_queries import TopQueriesCalc
 
+# Tuples: the calculators only iterate these, and immutability makes the
+# module-scoped sharing below safe by construction.
+_PG12_ROWS = (
+    MockCell({"query": "SELECT * FROM users", "calls": 100, "total_time": 1000.0, "mean_time": 10.0, "rows": 1000}),
+    MockCell({"query": "SELECT * FROM orders", "calls": 50, "total_time": 750.0, "mean_time": 15.0, "rows": 500}),
+    MockCell({"query": "SELECT * FROM products", "calls": 200, "total_time": 500.0, "mean_time": 2.5, "rows": 2000}),
+)
+
+_PG13_ROWS = (
+    MockCell({"query": "SELECT * FROM users", "calls": 100, "total_exec_time": 1000.0, "mean_exec_time": 10.0, "rows": 1000}),
+    MockCell({"query": "SELECT * FROM orders", "calls": 50, "total_exec_time": 750.0, "mean_exec_time": 15.0, "rows": 500}),
+    MockCell({"query": "SELECT * FROM products", "calls": 200, "total_exec_time": 500.0, "mean_exec_time": 2.5, "rows": 2000}),
+)
+
+
+# Projection fragments each resource query must emit per version; a single
+# comprehension reports every missing fragment at once instead of stopping
+# at the first failed assert.
+_EXPECTED_PG12 = (
+    "stddev_time AS stddev_exec_time",
+    "total_time AS total_exec_time",
+    "mean_time AS mean_exec_time",
+    "0::numeric AS wal_bytes",
+    "stats_since",
+)
+
+_EXPECTED_PG13 = (
+    "stddev_exec_time",
+    "total_exec_time",
+    "mean_exec_time",
+    "wal_bytes AS wal_bytes",
+)
+
+
+def _make_driver(rows):
+    """Build a stub driver whose execute_query answers pg_stat_statements queries."""
 
-class MockSqlRowResult:
-    def __init__(self, cells):
-        self.cells = cells
-
-
-def _columns_for_pg12() -> PgStatStatementsColumns:
-    return PgStatStatementsColumns(
-        total_time="total_time",
-        mean_time="mean_time",
-        stddev_time="stddev_time",
-        wal_bytes_select="0::numeric AS wal_bytes",
-        wal_bytes_frac="0::double precision AS total_wal_bytes_frac",
-        stats_since_select="NULL::timestamptz AS stats_since",
-        minmax_stats_since_select="NULL::timestamptz AS minmax_stats_since",
-        local_blk_read_time_select="NULL::double precision AS local_blk_read_time",
-        local_blk_write_time_select="NULL::double precision AS local_blk_write_time",
-        parallel_workers_to_launch_select="NULL::bigint AS parallel_workers_to_launch",
-        parallel_workers_launched_select="NULL::bigint AS parallel_workers_launched",
-        wal_buffers_full_select="NULL::bigint AS wal_buffers_full",
-    )
-
-
-def _columns_for_pg13() -> PgStatStatementsColumns:
-    return PgStatStatementsColumns(
-        total_time="total_exec_time",
-        mean_time="mean_exec_time",
-        stddev_time="stddev_exec_time",
-        wal_bytes_select="wal_bytes AS wal_bytes",
-        wal_bytes_frac="wal_bytes / NULLIF(SUM(wal_bytes) OVER (), 0) AS total_wal_bytes_frac",
-        stats_since_select="NULL::timestamptz AS stats_since",
-        minmax_stats_since_select="NULL::timestamptz AS minmax_stats_since",
-        local_blk_read_time_select="NULL::double precision AS local_blk_read_time",
-        local_blk_write_time_select="NULL::double precision AS local_blk_write_time",
-        parallel_workers_to_launch_select="NULL::bigint AS parallel_workers_to_launch",
-        parallel_workers_launched_select="NULL::bigint AS parallel_workers_launched",
-        wal_buffers_full_select="NULL::bigint AS wal_buffers_full",
-    )
+    async def side_effect(query, *args, **kwargs):
+        return rows if "pg_stat_statements" in query else None
 
+    return StubDriver(AsyncMock(side_effect=side_effect))
 
-@pytest.fixture
+
+# Module scope: even the stub's AsyncMock is worth building only once.
+# The autouse reset below wipes call state between tests instead.
+@pytest.fixture(scope="module")
 def mock_pg12_driver():
     """Create a mock for SqlDriver that simulates PostgreSQL 12 rows."""
-    driver = MagicMock(spec=SqlDriver)
-    mock_execute = AsyncMock()
-
-    async def side_effect(query, *args, **kwargs):
-        if "pg_stat_statements" in query:
-            return [
-                MockSqlRowResult(cells={"query": "SELECT * FROM users", "calls": 100, "total_time": 1000.0, "mean_time": 10.0, "rows": 1000}),
-                MockSqlRowResult(cells={"query": "SELECT * FROM orders", "calls": 50, "total_time": 750.0, "mean_time": 15.0, "rows": 500}),
-                MockSqlRowResult(cells={"query": "SELECT * FROM products", "calls": 200, "total_time": 500.0, "mean_time": 2.5, "rows": 2000}),
-            ]
-        return None
-
-    mock_execute.side_effect = side_effect
-    driver.execute_query = mock_execute
-    return driver
+    return _make_driver(_PG12_ROWS)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_pg13_driver():
     """Create a mock for SqlDriver that simulates PostgreSQL 13 rows."""
-    driver = MagicMock(spec=SqlDriver)
-    mock_execute = AsyncMock()
+    return _make_driver(_PG13_ROWS)
 
-    async def side_effect(query, *args, **kwargs):
-        if "pg_stat_statements" in query:
-            return [
-                MockSqlRowResult(
-                    cells={"query": "SELECT * FROM users", "calls": 100, "total_exec_time": 1000.0, "mean_exec_time": 10.0, "rows": 1000}
-                ),
-                MockSqlRowResult(cells={"query": "SELECT * FROM orders", "calls": 50, "total_exec_time": 750.0, "mean_exec_time": 15.0, "rows": 500}),
-                MockSqlRowResult(
-                    cells={"query": "SELECT * FROM products", "calls": 200, "total_exec_time": 500.0, "mean_exec_time": 2.5, "rows": 2000}
-                ),
-            ]
-        return None
-
-    mock_execute.side_effect = side_effect
-    driver.execute_query = mock_execute
-    return driver
+
+@pytest.fixture(autouse=True)
+def _reset_driver_mocks(mock_pg12_driver, mock_pg13_driver):
+    yield
+    mock_pg12_driver.execute_query.reset_mock()
+    mock_pg13_driver.execute_query.reset_mock()
 
 
 @pytest.fixture
@@ -120,51 +101,27 @@ def mock_extension_not_installed():
         yield mock_check
 
 
-@pytest.mark.asyncio
-async def test_top_queries_pg12_total_sort(mock_pg12_driver, mock_extension_installed):
-    calc = TopQueriesCalc(sql_driver=mock_pg12_driver)
-    with patch.object(top_queries_module, "get_pg_stat_statements_columns", AsyncMock(return_value=_columns_for_pg12())):
-        result = await calc.get_top_queries_by_time(limit=3, sort_by="total")
-
-    assert "Top 3 slowest queries by total execution time" in result
-    assert "SELECT * FROM users" in result
-    assert "ORDER BY total_time DESC" in str(mock_pg12_driver.execute_query.call_args)
-
+@pytest.mark.parametrize(
+    ("driver_fixture", "cols", "sort_by", "expected_query", "expected_order_by"),
+    [
+        pytest.param("mock_pg12_driver", PG12_COLS, "total", "SELECT * FROM users", "ORDER BY total_time DESC", id="pg12-total"),
+        pytest.param("mock_pg12_driver", PG12_COLS, "mean", "SELECT * FROM orders", "ORDER BY mean_time DESC", id="pg12-mean"),
+        pytest.param("mock_pg13_driver", PG13_COLS, "total", "SELECT * FROM users", "ORDER BY total_exec_time DESC", id="pg13-total"),
+        pytest.param("mock_pg13_driver", PG13_COLS, "mean", "SELECT * FROM orders", "ORDER BY mean_exec_time DESC", id="pg13-mean"),
+    ],
+)
+async def test_top_queries_sort(request, mock_extension_installed, driver_fixture, cols, sort_by, expected_query, expected_order_by):
+    driver = request.getfixturevalue(driver_fixture)
+    calc = TopQueriesCalc(sql_driver=driver)
+    with patch.object(top_queries_module, "get_pg_stat_statements_columns", AsyncMock(return_value=cols)):
+        result = await calc.get_top_queries_by_time(limit=3, sort_by=sort_by)
 
-@pytest.mark.asyncio
-async def test_top_queries_pg12_mean_sort(mock_pg12_driver, mock_extension_installed):
-    calc = TopQueriesCalc(sql_driver=mock_pg12_driver)
-    with patch.object(top_queries_module, "get_pg_stat_statements_columns", AsyncMock(return_value=_columns_for_pg12())):
-        result = await calc.get_top_queries_by_time(limit=3, sort_by="mean")
-
-    assert "Top 3 slowest queries by mean execution time per call" in result
-    assert "SELECT * FROM orders" in result
-    assert "ORDER BY mean_time DESC" in str(mock_pg12_driver.execute_query.call_args)
+    criteria = "total execution time" if sort_by == "total" else "mean execution time per call"
+    assert f"Top 3 slowest queries by {criteria}" in result
+    assert expected_query in result
+    assert expected_order_by in str(driver.execute_query.call_args)
 
 
-@pytest.mark.asyncio
-async def test_top_queries_pg13_total_sort(mock_pg13_driver, mock_extension_installed):
-    calc = TopQueriesCalc(sql_driver=mock_pg13_driver)
-    with patch.object(top_queries_module, "get_pg_stat_statements_columns", AsyncMock(return_value=_columns_for_pg13())):
-        result = await calc.get_top_queries_by_time(limit=3, sort_by="total")
-
-    assert "Top 3 slowest queries by total execution time" in result
-    assert "SELECT * FROM users" in result
-    assert "ORDER BY total_exec_time DESC" in str(mock_pg13_driver.execute_query.call_args)
-
-
-@pytest.mark.asyncio
-async def test_top_queries_pg13_mean_sort(mock_pg13_driver, mock_extension_installed):
-    calc = TopQueriesCalc(sql_driver=mock_pg13_driver)
-    with patch.object(top_queries_module, "get_pg_stat_statements_columns", AsyncMock(return_value=_columns_for_pg13())):
-        result = await calc.get_top_queries_by_time(limit=3, sort_by="mean")
-
-    assert "Top 3 slowest queries by mean execution time per call" in result
-    assert "SELECT * FROM orders" in result
-    assert "ORDER BY mean_exec_time DESC" in str(mock_pg13_driver.execute_query.call_args)
-
-
-@pytest.mark.asyncio
 async def test_extension_not_installed(mock_pg13_driver, mock_extension_not_installed):
     calc = TopQueriesCalc(sql_driver=mock_pg13_driver)
     result = await calc.get_top_queries_by_time(limit=3)
@@ -173,7 +130,6 @@ async def test_extension_not_installed(mock_pg13_driver, mock_extension_not_inst
     mock_pg13_driver.execute_query.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_error_handling(mock_pg13_driver, mock_extension_installed):
     calc = TopQueriesCalc(sql_driver=mock_pg13_driver)
     with patch.object(top_queries_module, "get_pg_stat_statements_columns", AsyncMock(side_effect=Exception("Database error"))):
@@ -181,28 +137,38 @@ async def test_error_handling(mock_pg13_driver, mock_extension_installed):
     assert "Error getting slow queries: Database error" in result
 
 
-@pytest.mark.asyncio
 async def test_resource_queries_pg12(mock_pg12_driver, mock_extension_installed):
     calc = TopQueriesCalc(sql_driver=mock_pg12_driver)
-    with patch.object(top_queries_module, "get_pg_stat_statements_columns", AsyncMock(return_value=_columns_for_pg12())):
+    with patch.object(top_queries_module, "get_pg_stat_statements_columns", AsyncMock(return_value=PG12_COLS)):
         _result = await calc.get_top_resource_queries(frac_threshold=0.05)
 
     call_args = str(mock_pg12_driver.execute_query.call_args)
-    assert "stddev_time AS stddev_exec_time" in call_args
-    assert "total_time AS total_exec_time" in call_args
-    assert "mean_time AS mean_exec_time" in call_args
-    assert "0::numeric AS wal_bytes" in call_args
-    assert "stats_since" in call_args
+    missing = [fragment for fragment in _EXPECTED_PG12 if fragment not in call_args]
+    assert not missing, missing
+
+
+async def test_resource_queries_column_projection(mock_pg13_driver, mock_extension_installed):
+    calc = TopQueriesCalc(sql_driver=mock_pg13_driver)
+    with patch.object(top_queries_module, "get_pg_stat_statements_columns", AsyncMock(return_value=PG13_COLS)):
+        _result = await calc.get_top_resource_queries(columns=["query", "total_exec_time"])
+
+    call_args = str(mock_pg13_driver.execute_query.call_args)
+    assert "query,\\n                    total_exec_time\\n                FROM resource_fractions" in call_args
+
+
+async def test_resource_queries_rejects_unknown_columns(mock_pg13_driver, mock_extension_installed):
+    calc = TopQueriesCalc(sql_driver=mock_pg13_driver)
+    with patch.object(top_queries_module, "get_pg_stat_statements_columns", AsyncMock(return_value=PG13_COLS)):
+        result = await calc.get_top_resource_queries(columns=["query", "no_such_column"])
+
+    assert "unknown columns requested: no_such_column" in result
 
 
-@pytest.mark.asyncio
 async def test_resource_queries_pg13(mock_pg13_driver, mock_extension_installed):
     calc = TopQueriesCalc(sql_driver=mock_pg13_driver)
-    with patch.object(top_queries_module, "get_pg_stat_statements_columns", AsyncMock(return_value=_columns_for_pg13())):
+    with patch.object(top_queries_module, "get_pg_stat_statements_columns", AsyncMock(return_value=PG13_COLS)):
         _result = await calc.get_top_resource_queries(frac_threshold=0.05)
 
     call_args = str(mock_pg13_driver.execute_query.call_args)
-    assert "stddev_exec_time" in call_args
-    assert "total_exec_time" in call_args
-    assert "mean_exec_time" in call_args
-    assert "wal_bytes AS wal_bytes" in call_args
+    missing = [fragment for fragment in _EXPECTED_PG13 if fragment not in call_args]
+    assert not missing, missing
@@ -12,8 +12,19 @@ from docker import errors as docker_errors
 logger = logging.getLogger(__name__)
 
 
+def _container_reuse_enabled() -> bool:
+    """Whether test containers should survive the pytest run for reuse."""
+    return os.getenv("POSTGRES_TEST_CONTAINER_REUSE", "").lower() in ("1", "true", "yes")
+
+
 def create_postgres_container(version: str) -> Generator[Tuple[str, str], None, None]:
-    """Create a PostgreSQL container of specified version and return its connection string."""
+    """Create a PostgreSQL container of specified version and return its connection string.
+
+    Set POSTGRES_TEST_CONTAINER_REUSE=true to keep the container running after
+    the run and reattach to it on the next invocation, skipping image startup
+    and initdb. Set POSTGRES_TEST_PREBUILT_IMAGE to use an existing image
+    (e.g. produced via ``docker commit``) instead of building the HypoPG one.
+    """
     try:
         client = docker.from_env()
         client.ping()
@@ -24,9 +35,14 @@ def create_postgres_container(version: str) -> Generator[Tuple[str, str], None,
     pg_version = version.split(":")[1] if ":" in version else version
 
     # Define custom image name with HypoPG
-    custom_image_name = f"postgres-hypopg:{pg_version}"
-
-    container_name = f"postgres-crystal-test-{version.replace(':', '_')}-{os.urandom(4).hex()}"
+    custom_image_name = os.getenv("POSTGRES_TEST_PREBUILT_IMAGE") or f"postgres-hypopg:{pg_version}"
+
+    reuse = _container_reuse_enabled()
+    if reuse:
+        # Deterministic name so the next pytest run finds the same container.
+        container_name = f"postgres-crystal-test-{version.replace(':', '_').replace('/', '_')}-reuse"
+    else:
+        container_name = f"postgres-crystal-test-{version.replace(':', '_')}-{os.urandom(4).hex()}"
     current_dir = Path(__file__).parent.absolute()
 
     logger.info(f"Setting up PostgreSQL {pg_version} with HypoPG")
@@ -37,6 +53,8 @@ def create_postgres_container(version: str) -> Generator[Tuple[str, str], None,
         client.images.get(custom_image_name)
         logger.info(f"Using existing Docker image: {custom_image_name}")
     except docker_errors.ImageNotFound:
+        if os.getenv("POSTGRES_TEST_PREBUILT_IMAGE"):
+            pytest.skip(f"Prebuilt image not found: {custom_image_name}")
         # Build the custom image
         logger.info(f"Building custom Docker image: {custom_image_name}")
         try:
@@ -61,28 +79,40 @@ def create_postgres_container(version: str) -> Generator[Tuple[str, str], None,
     postgres_password = "test_password"
     postgres_db = "test_db"
 
+    # Reattach to a previous run's container when reuse is enabled.
+    container = None
+    if reuse:
+        try:
+            container = client.containers.get(container_name)
+            if container.status != "running":
+                container.start()
+            logger.info(f"Reusing existing container {container_name}")
+        except docker_errors.NotFound:
+            container = None
+
     # Create container with more verbose logging
-    container = client.containers.run(
-        custom_image_name,
-        name=container_name,
-        environment={
-            "POSTGRES_PASSWORD": postgres_password,
-            "POSTGRES_DB": postgres_db,
-            "POSTGRES_HOST_AUTH_METHOD": "trust",  # Make authentication easier in tests
-        },
-        ports={"5432/tcp": ("127.0.0.1", 0)},  # Let Docker assign a random port
-        command=[
-            "-c",
-            "shared_preload_libraries=pg_stat_statements",
-            "-c",
-            "pg_stat_statements.track=all",
-            "-c",
-            "log_min_messages=info",  # More verbose logging
-            "-c",
-            "log_statement=all",  # Log all SQL statements
-        ],
-        detach=True,
-    )
+    if container is None:
+        container = client.containers.run(
+            custom_image_name,
+            name=container_name,
+            environment={
+                "POSTGRES_PASSWORD": postgres_password,
+                "POSTGRES_DB": postgres_db,
+                "POSTGRES_HOST_AUTH_METHOD": "trust",  # Make authentication easier in tests
+            },
+            ports={"5432/tcp": ("127.0.0.1", 0)},  # Let Docker assign a random port
+            command=[
+                "-c",
+                "shared_preload_libraries=pg_stat_statements",
+                "-c",
+                "pg_stat_statements.track=all",
+                "-c",
+                "log_min_messages=info",  # More verbose logging
+                "-c",
+                "log_statement=all",  # Log all SQL statements
+            ],
+            detach=True,
+        )
 
     logger.info(f"Container {container_name} started, waiting for PostgreSQL to be ready")
 
@@ -147,9 +177,12 @@ def create_postgres_container(version: str) -> Generator[Tuple[str, str], None,
         raise
 
     finally:
-        logger.info(f"Stopping and removing container {container_name}")
-        try:
-            container.stop(timeout=1)
-            container.remove(v=True)
-        except Exception as e:
-            logger.warning(f"Error cleaning up container {container_name}: {e}")
+        if reuse:
+            logger.info(f"Leaving container {container_name} running for reuse")
+        else:
+            logger.info(f"Stopping and removing container {container_name}")
+            try:
+                container.stop(timeout=1)
+                container.remove(v=True)
+            except Exception as e:
+                logger.warning(f"Error cleaning up container {container_name}: {e}")